@@ -1,14 +1,73 @@
 import base64
 import datetime
+import time
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from jose import JWTError, jwt
 from fastapi.security import OAuth2PasswordBearer
-from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS
-from database import get_db
+from config import (
+    SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS,
+    USER_CACHE_TTL_SECONDS, USER_CACHE_MAX_SIZE,
+    AUTH_STATELESS, STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES, REVOCATION_MAX_SIZE
+)
+from aiomysql import DictCursor
+from database import db_connection
+from cache import TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# 인증된 사용자 정보 캐시 (user_id -> users 행)
+user_cache = TTLCache(max_size=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+# 캐시 무효화 횟수. 조회 중에 무효화가 일어나면 읽은 행이 이전 값일 수 있으므로 캐시에 저장하지 않는다.
+user_cache_version = 0
+
+# 무상태 모드에서 폐기된 사용자 (user_id -> 폐기 시각). 이전에 발급된 토큰은 거부된다.
+# 토큰 수명이 지나면 항목이 필요 없으므로 토큰 만료 시간을 TTL로 사용.
+# 프로세스 단위로 유지되므로 워커가 여러 개이면 폐기를 처리한 워커에서만 거부된다.
+revoked_users = TTLCache(max_size=REVOCATION_MAX_SIZE, ttl=STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+def user_role(user_id: int) -> str:
+    """
+    사용자 권한 결정. user_id = 1인 경우 관리자라고 가정.
+    """
+    return "admin" if user_id == 1 else "user"
+
+def revoke_user_tokens(user_id: int):
+    """
+    무상태 모드에서 현재까지 발급된 사용자의 액세스 토큰을 폐기
+    """
+    revoked_users.set(user_id, time.time())
+
+def invalidate_cached_user(user_id: int):
+    """
+    사용자 정보가 변경된 경우 캐시에서 제거
+    """
+    global user_cache_version
+    user_cache_version += 1
+    user_cache.pop(user_id)
+
+async def load_user(user_id: int) -> Optional[dict]:
+    """
+    사용자 정보 조회. 캐시에 없을 때만 DB를 조회한다.
+    조회하는 동안 무효화가 일어났으면 조회 결과를 캐시에 저장하지 않는다.
+    """
+    user = user_cache.get(user_id)
+    if user is None:
+        version = user_cache_version
+        async with db_connection() as db:
+            cursor = await db.cursor(DictCursor)
+            await cursor.execute(
+                "SELECT user_id, email, name, status, phone, birth_date FROM users WHERE user_id=%s",
+                (user_id,)
+            )
+            user = await cursor.fetchone()
+            await cursor.close()
+        if user is None:
+            return None
+        if version == user_cache_version:
+            user_cache.set(user_id, user)
+    return dict(user)
+
 def base64_encode_password(raw_password: str) -> str:
     """
     패스워드를 Base64로 인코딩하는 유틸 함수
@@ -30,6 +89,42 @@ def create_access_token(data: dict, expires_delta: Optional[datetime.timedelta]
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
+def create_user_access_token(user: dict) -> str:
+    """
+    사용자용 액세스 토큰 생성.
+    무상태 모드에서는 상태/권한/프로필 클레임을 포함한 짧은 수명의 토큰을 발급한다.
+    """
+    data = {"sub": str(user['user_id'])}
+    if not AUTH_STATELESS:
+        return create_access_token(data=data)
+
+    birth_date = user.get('birth_date')
+    data.update({
+        # 같은 초에 폐기 후 재발급한 토큰이 거부되지 않도록 소수점 이하까지 기록
+        "iat": time.time(),
+        "status": user['status'],
+        "role": user_role(user['user_id']),
+        "email": user.get('email'),
+        "name": user.get('name'),
+        "phone": user.get('phone'),
+        "birth_date": birth_date.isoformat() if birth_date else None
+    })
+    return create_access_token(data=data, expires_delta=datetime.timedelta(minutes=STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES))
+
+def user_from_claims(user_id: int, payload: dict) -> dict:
+    """
+    무상태 토큰의 클레임으로 사용자 정보 구성
+    """
+    return {
+        "user_id": user_id,
+        "email": payload.get("email"),
+        "name": payload.get("name"),
+        "status": payload["status"],
+        "phone": payload.get("phone"),
+        "birth_date": payload.get("birth_date"),
+        "role": payload.get("role", user_role(user_id))
+    }
+
 def create_refresh_token(data: dict) -> str:
     """
     리프레시 토큰 생성
@@ -39,10 +134,11 @@ def create_refresh_token(data: dict) -> str:
     to_encode.update({"exp": expire, "scope": "refresh_token"})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db=Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     """
     현재 인증된 사용자 정보를 반환하는 종속성.
-    토큰 검증 후 사용자 DB 조회.
+    토큰 검증 후 사용자 조회 (캐시 미스 시에만 DB 조회).
+    무상태 모드에서 발급된 토큰은 클레임을 그대로 신뢰하고 폐기 여부만 확인한다.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -60,13 +156,15 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db=Depends(get_d
         except ValueError:
             raise credentials_exception
 
-        cursor = db.cursor(dictionary=True)
-        cursor.execute(
-            "SELECT user_id, email, name, status, phone, birth_date FROM users WHERE user_id=%s",
-            (user_id,)
-        )
-        user = cursor.fetchone()
-        cursor.close()
+        if AUTH_STATELESS and "status" in payload:
+            revoked_at = revoked_users.get(user_id)
+            if revoked_at is not None and payload.get("iat", 0) <= revoked_at:
+                raise credentials_exception
+            user = user_from_claims(user_id, payload)
+        else:
+            user = await load_user(user_id)
+            if user:
+                user['role'] = user_role(user_id)
 
         if not user or user['status'] in ['inactive', 'blocked']:
             raise HTTPException(status_code=403, detail="User is not active.")
@@ -77,8 +175,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db=Depends(get_d
 
 async def check_admin(user=Depends(get_current_user)):
     """
-    관리자 권한 확인. user_id = 1인 경우 관리자라고 가정.
+    관리자 권한 확인 (user_role 참고)
     """
-    if user['user_id'] != 1:
+    if user['role'] != "admin":
         raise HTTPException(status_code=403, detail="Not authorized")
     return user
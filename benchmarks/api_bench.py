@@ -0,0 +1,364 @@
+"""
+API 부하/지연 시간 벤치마크 (시나리오 혼합: 목록 탐색, 검색, 북마크, 지원, 로그인)
+
+    python -m benchmarks.api_bench --users 20 --duration 60 --save-baseline benchmarks/baseline.json
+    python -m benchmarks.api_bench --users 20 --duration 60 --compare benchmarks/baseline.json
+    python -m benchmarks.api_bench --base-url http://127.0.0.1:8000   # 실행 중인 uvicorn 서버 대상
+
+.env의 DB를 사용하며, 공고가 --seed-postings개보다 적으면 기록 페이지로 채우고
+벤치마크 사용자(bench-user-N)와 이력서를 만든다 (비어 있는 테스트 DB 사용).
+"""
+import argparse
+import asyncio
+import contextvars
+import json
+import logging
+import math
+import platform
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+import aiomysql
+import httpx
+from database import db_connection, close_async_pool
+from main import app
+
+DEFAULT_MIX = "browse=45,search=25,bookmark=15,apply=10,login=5"
+SEARCH_KEYWORDS = ['python', 'java', '백엔드', '프론트엔드', 'react', 'aws', '데이터', '개발자']
+JOB_SORTS = ['created_at_desc', 'created_at_asc', 'view_count_desc']
+BENCH_PASSWORD = 'bench-password'
+
+# 현재 요청에서 실행한 쿼리 수 (요청마다 새 카운터를 설정, 백그라운드 작업의 쿼리는 세지 않음)
+_request_queries: contextvars.ContextVar[Optional[List[int]]] = contextvars.ContextVar('request_queries', default=None)
+
+def count_queries():
+    """
+    aiomysql 커서 실행을 현재 요청의 쿼리 수에 합산 (executemany도 execute를 거침)
+    """
+    execute = aiomysql.Cursor.execute
+
+    async def counted_execute(self, query, args=None):
+        counter = _request_queries.get()
+        if counter is not None:
+            counter[0] += 1
+        return await execute(self, query, args)
+
+    aiomysql.Cursor.execute = counted_execute
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    정렬된 값의 q번째 백분위수 (nearest-rank)
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(math.ceil(q / 100 * len(values)) - 1, 0))]
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip() not in VirtualUser.SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name.strip()}' (available: {', '.join(VirtualUser.SCENARIOS)})")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+class Recorder:
+    """
+    엔드포인트별 응답 시간/쿼리 수 기록. active가 False인 동안(워밍업)의 요청은 기록하지 않는다.
+    """
+    def __init__(self):
+        self.active = False
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.queries: Dict[str, List[int]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, endpoint: str, elapsed_ms: float, queries: Optional[int], ok: bool):
+        if not self.active:
+            return
+        self.latencies[endpoint].append(elapsed_ms)
+        if queries is not None:
+            self.queries[endpoint].append(queries)
+        if not ok:
+            self.errors[endpoint] += 1
+
+    def summary(self, duration: float) -> Dict[str, dict]:
+        endpoints = {}
+        for endpoint in sorted(self.latencies):
+            latencies = sorted(self.latencies[endpoint])
+            queries = self.queries.get(endpoint)
+            endpoints[endpoint] = {
+                "requests": len(latencies),
+                "errors": self.errors.get(endpoint, 0),
+                "throughput_rps": round(len(latencies) / duration, 2),
+                "mean_ms": round(sum(latencies) / len(latencies), 2),
+                "p50_ms": round(percentile(latencies, 50), 2),
+                "p95_ms": round(percentile(latencies, 95), 2),
+                "p99_ms": round(percentile(latencies, 99), 2),
+                "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+            }
+        return endpoints
+
+class VirtualUser:
+    """
+    로그인한 사용자 한 명의 요청 흐름. 시나리오 하나는 실제 사용 순서대로 여러 요청을 보낸다.
+    """
+    SCENARIOS = ('browse', 'search', 'bookmark', 'apply', 'login')
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, email: str, resume_id: int,
+                 posting_ids: List[int], rng: random.Random, count: bool):
+        self.client = client
+        self.recorder = recorder
+        self.email = email
+        self.resume_id = resume_id
+        self.posting_ids = posting_ids
+        self.rng = rng
+        self.count = count
+        self.token: Optional[str] = None
+
+    async def request(self, endpoint: str, method: str, url: str, expected=(200,), **kwargs) -> httpx.Response:
+        counter = [0]
+        reset = _request_queries.set(counter)
+        if self.token:
+            kwargs.setdefault('headers', {})['Authorization'] = f"Bearer {self.token}"
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        finally:
+            _request_queries.reset(reset)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.recorder.record(endpoint, elapsed_ms, counter[0] if self.count else None, response.status_code in expected)
+        return response
+
+    def pick_posting(self, response: Optional[httpx.Response] = None) -> int:
+        items = response.json().get('items') if response is not None and response.status_code == 200 else None
+        if items:
+            return self.rng.choice(items)['posting_id']
+        return self.rng.choice(self.posting_ids)
+
+    async def login(self):
+        self.token = None
+        response = await self.request(
+            "POST /auth/login", "POST", "/auth/login", data={'username': self.email, 'password': BENCH_PASSWORD}
+        )
+        if response.status_code == 200:
+            self.token = response.json()['access_token']
+
+    async def browse(self):
+        params = {'page': self.rng.randint(1, 5), 'sort': self.rng.choice(JOB_SORTS)}
+        response = await self.request("GET /jobs", "GET", "/jobs", params=params)
+        await self.request("GET /jobs/{id}", "GET", f"/jobs/{self.pick_posting(response)}")
+
+    async def search(self):
+        params = {'keyword': self.rng.choice(SEARCH_KEYWORDS), 'sort': self.rng.choice(['relevance', 'created_at_desc'])}
+        if self.rng.random() < 0.3:
+            params['location'] = '서울'
+        response = await self.request("GET /jobs?keyword", "GET", "/jobs", params=params)
+        await self.request("GET /jobs/{id}", "GET", f"/jobs/{self.pick_posting(response)}")
+
+    async def bookmark(self):
+        # 추가/제거가 번갈아 일어나므로 북마크 수는 일정하게 유지됨
+        await self.request("POST /bookmarks", "POST", "/bookmarks", json={'posting_id': self.pick_posting()})
+        await self.request("GET /bookmarks", "GET", "/bookmarks")
+
+    async def apply(self):
+        response = await self.request(
+            "POST /applications", "POST", "/applications",
+            data={'posting_id': self.pick_posting(), 'resume_id': self.resume_id}
+        )
+        await self.request("GET /applications", "GET", "/applications")
+        if response.status_code == 200:
+            # 다음 실행에서도 같은 공고에 지원할 수 있도록 취소
+            application_id = response.json()['application_id']
+            await self.request("DELETE /applications/{id}", "DELETE", f"/applications/{application_id}")
+
+def seed_postings(count: int):
+    """
+    기록 페이지의 공고를 crawling2db 적재 경로로 count개 이상 추가 (페이지마다 새 공고)
+    """
+    from benchmarks.replay_server import load_recordings, replay_page
+    from crawler.parser import parse_listing
+    from crawling2db import JobDatabase
+
+    recordings = load_recordings()
+    db = JobDatabase()
+    try:
+        inserted, page = 0, 1
+        while inserted < count:
+            # 크롤링 벤치마크와 겹치지 않는 키워드 번호 사용
+            inserted += db.insert_rows(parse_listing(replay_page(recordings, 99, page)))[0]
+            page += 1
+    finally:
+        db.close()
+
+async def setup_database(client: httpx.AsyncClient, users: int, seed: int) -> Tuple[List[Tuple[str, int]], List[int]]:
+    """
+    벤치마크 데이터 준비: 공고가 seed개보다 적으면 추가하고, 사용자와 사용자별 이력서를 만든다.
+    (이메일, 이력서 id) 목록과 활성 공고 id 목록을 반환
+    """
+    async with db_connection() as db:
+        cursor = await db.cursor()
+        await cursor.execute("SELECT COUNT(*) FROM job_postings WHERE status = 'active'")
+        (active,) = await cursor.fetchone()
+    if active < seed:
+        await asyncio.to_thread(seed_postings, seed - active)
+
+    emails = [f"bench-user-{i}@example.com" for i in range(users)]
+    for email in emails:
+        response = await client.post(
+            "/auth/register", json={'email': email, 'password': BENCH_PASSWORD, 'name': 'Benchmark User'}
+        )
+        if response.status_code not in (200, 400):
+            raise RuntimeError(f"Failed to register {email}: {response.status_code} {response.text}")
+
+    accounts = []
+    async with db_connection() as db:
+        cursor = await db.cursor()
+        for email in emails:
+            await cursor.execute("SELECT user_id FROM users WHERE email = %s", (email,))
+            (user_id,) = await cursor.fetchone()
+            await cursor.execute("SELECT resume_id FROM resumes WHERE user_id = %s ORDER BY resume_id LIMIT 1", (user_id,))
+            row = await cursor.fetchone()
+            if row is None:
+                await cursor.execute(
+                    "INSERT INTO resumes(user_id, title, content, is_primary) VALUES (%s, 'Benchmark Resume', %s, 1)",
+                    (user_id, b'%PDF-1.4 benchmark')
+                )
+                row = (cursor.lastrowid,)
+            accounts.append((email, row[0]))
+        await cursor.execute("SELECT posting_id FROM job_postings WHERE status = 'active' ORDER BY posting_id DESC LIMIT 5000")
+        posting_ids = [row[0] for row in await cursor.fetchall()]
+        await db.commit()
+    if not posting_ids:
+        raise RuntimeError("No active job postings to benchmark")
+    return accounts, posting_ids
+
+async def run_users(client: httpx.AsyncClient, args, count: bool) -> Dict:
+    mix = parse_mix(args.mix)
+    accounts, posting_ids = await setup_database(client, args.users, args.seed_postings)
+    recorder = Recorder()
+    recorder.active = args.warmup <= 0
+    users = [
+        VirtualUser(client, recorder, email, resume_id, posting_ids, random.Random(args.seed + i), count)
+        for i, (email, resume_id) in enumerate(accounts)
+    ]
+    for user in users:
+        await user.login()
+
+    async def loop(user: VirtualUser, deadline: float):
+        names, weights = list(mix), list(mix.values())
+        while time.perf_counter() < deadline:
+            scenario = user.rng.choices(names, weights)[0]
+            await getattr(user, scenario)()
+
+    started = time.perf_counter()
+    deadline = started + args.warmup + args.duration
+    recording = asyncio.get_running_loop().call_later(args.warmup, setattr, recorder, 'active', True)
+    await asyncio.gather(*(loop(user, deadline) for user in users))
+    recording.cancel()
+    duration = max(time.perf_counter() - started - args.warmup, 1e-9)
+
+    endpoints = recorder.summary(duration)
+    requests_total = sum(endpoint["requests"] for endpoint in endpoints.values())
+    return {
+        "config": {
+            "target": args.base_url or "in-process",
+            "users": args.users,
+            "duration_seconds": args.duration,
+            "warmup_seconds": args.warmup,
+            "mix": mix,
+            "seed": args.seed,
+            "python": platform.python_version(),
+        },
+        "requests": requests_total,
+        "errors": sum(endpoint["errors"] for endpoint in endpoints.values()),
+        "throughput_rps": round(requests_total / duration, 2),
+        "endpoints": endpoints,
+    }
+
+async def run(args) -> Dict:
+    if args.base_url:
+        try:
+            async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+                return await run_users(client, args, count=False)
+        finally:
+            # 데이터 준비에 사용한 DB 풀 정리
+            await close_async_pool()
+
+    count_queries()
+    # ASGI 전송은 lifespan을 실행하지 않으므로 직접 실행 (DB 풀, 인덱스 동기화, 조회수 반영)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=args.timeout) as client:
+            return await run_users(client, args, count=True)
+
+def compare(result: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    기준 결과 대비 악화된 항목 목록.
+    p95/p99 지연 시간과 처리량은 tolerance 비율을 넘게 나빠진 경우, 요청당 쿼리 수는 늘어난 경우 회귀로 본다.
+    """
+    regressions = []
+    for endpoint, base in baseline.get("endpoints", {}).items():
+        current = result["endpoints"].get(endpoint)
+        if current is None:
+            continue
+        for key in ("p95_ms", "p99_ms"):
+            # 1ms 미만 차이는 측정 잡음으로 봄
+            if current[key] > base[key] * (1 + tolerance) and current[key] - base[key] >= 1.0:
+                regressions.append(f"{endpoint}: {key} {base[key]} -> {current[key]}")
+        if current["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{endpoint}: throughput_rps {base['throughput_rps']} -> {current['throughput_rps']}")
+        if (current["queries_per_request"] is not None and base.get("queries_per_request") is not None
+                and current["queries_per_request"] > base["queries_per_request"] + 0.05):
+            regressions.append(f"{endpoint}: queries_per_request {base['queries_per_request']} -> {current['queries_per_request']}")
+    return regressions
+
+def print_table(result: Dict):
+    print(f"{'endpoint':<28}{'reqs':>7}{'err':>5}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'q/req':>7}")
+    for endpoint, stats in result["endpoints"].items():
+        queries = stats["queries_per_request"]
+        print(
+            f"{endpoint:<28}{stats['requests']:>7}{stats['errors']:>5}{stats['throughput_rps']:>9.1f}"
+            f"{stats['p50_ms']:>9.2f}{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}{'-' if queries is None else queries:>7}"
+        )
+    print(f"total: {result['requests']} requests, {result['errors']} errors, {result['throughput_rps']} req/s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the job API with mixed user scenarios.")
+    parser.add_argument('--users', type=int, default=10, help='Concurrent virtual users (each logs in as its own account).')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds measured after the warmup.')
+    parser.add_argument('--warmup', type=float, default=5, help='Seconds run before measuring (fills caches and indexes).')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='Scenario weights, e.g. browse=45,search=25,bookmark=15,apply=10,login=5.')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed of the virtual users.')
+    parser.add_argument('--seed-postings', type=int, default=500, help='Minimum active job postings; missing ones are loaded from recorded listing pages.')
+    parser.add_argument('--base-url', default=None, help='Benchmark a running server instead of the in-process app (no query counts).')
+    parser.add_argument('--timeout', type=float, default=30, help='Request timeout in seconds.')
+    parser.add_argument('--json', default=None, help='Also write the results to this JSON file.')
+    parser.add_argument('--save-baseline', default=None, help='Write the results as a baseline JSON file.')
+    parser.add_argument('--compare', default=None, help='Baseline JSON file to compare against; exits with status 1 on regressions.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed relative slowdown before a metric counts as a regression.')
+    args = parser.parse_args()
+
+    # 요청별 INFO 로그는 측정을 방해하므로 경고 이상만 출력
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("api_logger").setLevel(logging.WARNING)
+    result = asyncio.run(run(args))
+    print_table(result)
+
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
+
+if __name__ == "__main__":
+    main()
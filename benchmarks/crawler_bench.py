@@ -0,0 +1,135 @@
+"""
+크롤링 -> 파싱 -> 적재 벤치마크 (네트워크 없이 기록 페이지로 재현)
+
+    python -m benchmarks.crawler_bench --pages 25 --concurrency 4 --parser selectolax
+    python -m benchmarks.crawler_bench --parse-workers 2 --db-rtt 0.5 --json bench.json
+    python -m benchmarks.crawler_bench --loader mysql   # .env의 DB (비어 있는 테스트 DB 사용)
+"""
+import argparse
+import json
+import logging
+import platform
+import resource
+import statistics
+import sys
+import time
+from typing import Dict, List
+from benchmarks import sqlite_mysql
+from benchmarks.replay_server import DEFAULT_FIXTURES, ReplayServer, load_recordings, replay_page
+from crawler.fetcher import Fetcher
+from crawler.parser import BACKENDS, parse_listing, resolve_backend
+from crawler.pipeline import make_parse_pool, run_pipeline
+from crawling2db import JobDatabase
+
+DEFAULT_KEYWORDS = ['python', 'java', 'react', 'aws']
+
+def peak_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    """
+    최대 RSS(MB). Linux는 KB, macOS는 바이트 단위로 반환된다.
+    """
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def measure_parse(recordings: List[str], backend: str, base_url: str, repeat: int = 5) -> float:
+    """
+    기록 페이지 한 장을 파싱하는 데 걸리는 시간(ms, 중앙값)
+    """
+    pages = [replay_page(recordings, 0, page) for page in range(1, len(recordings) + 1)]
+    timings = []
+    for _ in range(max(repeat, 1)):
+        for html in pages:
+            started = time.perf_counter()
+            parse_listing(html, base_url, backend)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def run(args) -> Dict:
+    recordings = load_recordings(args.fixtures)
+    backend = resolve_backend(args.parser)
+    server = ReplayServer(args.keywords, args.pages, recordings, latency=args.latency / 1000)
+    parse_executor = make_parse_pool(args.parse_workers) if args.parse_workers > 0 else None
+    conn = sqlite_mysql.connect(rtt=args.db_rtt / 1000) if args.loader == 'memory' else None
+    db = JobDatabase(conn)
+    fetcher = Fetcher(rate=args.rate, burst=args.burst, max_retries=0, pool_size=max(args.concurrency, 1))
+    try:
+        if parse_executor is not None:
+            # 프로세스 시작 시간은 측정에서 제외
+            warmup = [parse_executor.submit(parse_listing, recordings[0], server.base_url, backend) for _ in range(args.parse_workers)]
+            for future in warmup:
+                future.result()
+
+        load_seconds = [0.0]
+        def write_batch(rows):
+            started = time.perf_counter()
+            try:
+                return db.insert_rows(rows)
+            finally:
+                load_seconds[0] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        counts = run_pipeline(
+            args.keywords, args.pages, write_batch, fetcher, server.base_url,
+            max_workers=args.concurrency, batch_size=args.batch_size,
+            parser_backend=backend, parse_executor=parse_executor
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        fetcher.close()
+        db.close()
+        if parse_executor is not None:
+            parse_executor.shutdown()
+        # 파싱 프로세스는 풀을 정리한 뒤에야 자식 프로세스 사용량에 합산됨 (재생 서버는 제외)
+        children_rss = peak_rss_mb(resource.RUSAGE_CHILDREN)
+        server.close()
+
+    return {
+        "config": {
+            "keywords": len(args.keywords),
+            "pages": args.pages,
+            "concurrency": args.concurrency,
+            "parser": backend,
+            "parse_workers": args.parse_workers,
+            "batch_size": args.batch_size,
+            "loader": args.loader,
+            "latency_ms": args.latency,
+            "db_rtt_ms": args.db_rtt,
+            "python": platform.python_version(),
+        },
+        "counts": counts,
+        "elapsed_seconds": round(elapsed, 3),
+        "pages_per_second": round(counts["pages"] / elapsed, 2),
+        "parse_ms_per_page": round(measure_parse(recordings, backend, server.base_url), 2),
+        "rows_per_second": round(counts["inserted"] / elapsed, 1),
+        "load_rows_per_second": round(counts["inserted"] / load_seconds[0], 1) if load_seconds[0] else None,
+        "db_queries": conn.queries if conn is not None else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "peak_rss_parse_workers_mb": round(children_rss, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark crawl -> parse -> load against recorded Saramin listing pages.")
+    parser.add_argument('--keywords', nargs='+', default=DEFAULT_KEYWORDS, help='Keywords to crawl (each gets its own replayed pages).')
+    parser.add_argument('--pages', type=int, default=10, help='Pages crawled per keyword.')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help='Glob of recorded listing pages to replay.')
+    parser.add_argument('--latency', type=float, default=0.0, help='Milliseconds the replay server waits before each response.')
+    parser.add_argument('--concurrency', type=int, default=4, help='Maximum number of pages fetched at the same time.')
+    parser.add_argument('--rate', type=float, default=0.0, help='Maximum requests per second (0 = unlimited).')
+    parser.add_argument('--burst', type=int, default=1, help='Maximum burst of requests.')
+    parser.add_argument('--parser', default='auto', choices=['auto', *BACKENDS], help='HTML parser backend (auto = fastest installed).')
+    parser.add_argument('--parse-workers', type=int, default=0, help='Processes used for parsing (0 = parse on the fetch threads).')
+    parser.add_argument('--batch-size', type=int, default=200, help='Number of postings written to the database per batch.')
+    parser.add_argument('--loader', choices=['memory', 'mysql'], default='memory', help='Load into an in-memory SQLite stand-in or the MySQL database from .env.')
+    parser.add_argument('--db-rtt', type=float, default=0.0, help='Milliseconds added to every query of the in-memory loader (simulated DB round trip).')
+    parser.add_argument('--json', default=None, help='Also write the results to this JSON file.')
+    args = parser.parse_args()
+
+    # 페이지/배치별 INFO 로그는 측정을 방해하므로 경고 이상만 출력
+    logging.getLogger().setLevel(logging.WARNING)
+    result = run(args)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import glob
+import gzip
+import multiprocessing
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+# 기본 기록 페이지 (파싱 오류 사례 페이지는 --fixtures로 지정해 포함)
+DEFAULT_FIXTURES = "crawler/fixtures/listing_python.html"
+
+_TITLE = re.compile(r'(<h2 class="job_tit">\s*<a\b[^>]*>\s*<span>)')
+_REC_IDX = re.compile(r'rec_idx=(\d+)')
+
+def load_recordings(pattern: str = DEFAULT_FIXTURES) -> List[str]:
+    """
+    저장해 둔 사람인 검색 결과 페이지 중 공고가 있는 페이지 (파일 이름 순)
+    """
+    recordings = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        if 'item_recruit' in html:
+            recordings.append(html)
+    if not recordings:
+        raise ValueError(f"No recorded listing pages with postings match '{pattern}'")
+    return recordings
+
+def replay_page(recordings: List[str], keyword_index: int, page: int) -> str:
+    """
+    (키워드, 페이지)에 돌려줄 기록 페이지.
+    기록을 돌아가며 쓰되 공고 제목과 rec_idx에 키워드/페이지 표시를 붙여 페이지마다 새 공고가 되도록 한다.
+    """
+    html = recordings[(keyword_index + page - 1) % len(recordings)]
+    html = _TITLE.sub(lambda m: f"{m.group(1)}[k{keyword_index}-p{page}] ", html)
+    return _REC_IDX.sub(lambda m: f"rec_idx={keyword_index + 1}{page:04d}{m.group(1)}", html)
+
+def _make_handler(pages: Dict[Tuple[str, int], Tuple[bytes, bytes]], latency: float, counter):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            with counter.get_lock():
+                counter.value += 1
+            if latency:
+                time.sleep(latency)
+            parts = urlsplit(self.path)
+            query = parse_qs(parts.query)
+            key = (query.get('searchword', [''])[0], int(query.get('recruitPage', ['1'])[0]))
+            if parts.path != '/zf_user/search/recruit' or key not in pages:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            raw, compressed = pages[key]
+            use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            body = compressed if use_gzip else raw
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            if use_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def _serve(recordings: List[str], keywords: List[str], pages: int, latency: float, counter, ready):
+    # 응답 본문(원본, gzip)을 미리 만들어 두어 서버 CPU 사용이 측정에 섞이지 않도록 함
+    bodies = {}
+    for index, keyword in enumerate(keywords):
+        for page in range(1, pages + 1):
+            raw = replay_page(recordings, index, page).encode('utf-8')
+            bodies[(keyword, page)] = (raw, gzip.compress(raw))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _make_handler(bodies, latency, counter))
+    server.daemon_threads = True
+    ready.send(server.server_address[1])
+    server.serve_forever()
+
+class ReplayServer:
+    """
+    기록한 검색 결과 페이지를 사람인 검색 주소(/zf_user/search/recruit)로 돌려주는 로컬 서버.
+    크롤러와 CPU/메모리 측정이 섞이지 않도록 별도 프로세스에서 실행한다.
+
+    Args:
+        keywords (List[str]): 응답할 검색어 목록
+        pages (int): 검색어별 페이지 수
+        recordings (List[str]): 기록 페이지 HTML 목록 (load_recordings)
+        latency (float): 응답마다 추가하는 지연 시간(초), 실제 사이트 응답 시간 흉내
+    """
+    def __init__(self, keywords: List[str], pages: int, recordings: List[str], latency: float = 0.0):
+        context = multiprocessing.get_context('spawn')
+        self._counter = context.Value('i', 0)
+        receiver, sender = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=_serve, args=(recordings, keywords, pages, latency, self._counter, sender), daemon=True
+        )
+        self._process.start()
+        if not receiver.poll(60):
+            self._process.terminate()
+            raise RuntimeError("Replay server did not start")
+        self.base_url = f"http://127.0.0.1:{receiver.recv()}"
+
+    @property
+    def requests(self) -> int:
+        return self._counter.value
+
+    def close(self):
+        self._process.terminate()
+        self._process.join()
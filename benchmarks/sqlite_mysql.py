@@ -0,0 +1,150 @@
+import sqlite3
+import threading
+import time
+from typing import Optional
+from mysql.connector import Error
+
+# 적재 단계가 사용하는 테이블 (MySQL 스키마에서 벤치마크에 필요한 컬럼만)
+SCHEMA = """
+CREATE TABLE companies (
+    company_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL COLLATE NOCASE
+);
+CREATE TABLE locations (
+    location_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    city TEXT NOT NULL,
+    district TEXT
+);
+CREATE TABLE tech_stacks (
+    stack_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL COLLATE NOCASE UNIQUE,
+    category TEXT
+);
+CREATE TABLE job_categories (
+    category_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL COLLATE NOCASE UNIQUE
+);
+CREATE TABLE job_postings (
+    posting_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company_id INTEGER,
+    title TEXT NOT NULL,
+    job_description TEXT,
+    experience_level TEXT,
+    education_level TEXT,
+    employment_type TEXT,
+    salary_info TEXT,
+    location_id INTEGER,
+    deadline_date TEXT,
+    status TEXT DEFAULT 'active',
+    view_count INTEGER DEFAULT 0,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX idx_job_postings_company_title ON job_postings (company_id, title);
+CREATE TABLE posting_tech_stacks (
+    posting_id INTEGER NOT NULL,
+    stack_id INTEGER NOT NULL,
+    PRIMARY KEY (posting_id, stack_id)
+);
+CREATE TABLE posting_categories (
+    posting_id INTEGER NOT NULL,
+    category_id INTEGER NOT NULL,
+    PRIMARY KEY (posting_id, category_id)
+);
+"""
+
+def translate(query: str) -> str:
+    """
+    MySQL 문법을 SQLite 문법으로 변환 (적재 코드가 쓰는 범위만)
+    """
+    return query.replace('%s', '?').replace('INSERT IGNORE', 'INSERT OR IGNORE')
+
+class Cursor:
+    def __init__(self, conn: 'Connection', dictionary: bool):
+        self._conn = conn
+        self._dictionary = dictionary
+        self._rows = []
+        self.lastrowid: Optional[int] = None
+        self.rowcount = -1
+
+    def _run(self, query: str, run):
+        self._conn.round_trip()
+        try:
+            with self._conn.lock:
+                cursor = run(translate(query))
+                rows = cursor.fetchall()
+        except sqlite3.Error as e:
+            raise Error(msg=str(e)) from e
+        columns = [column[0] for column in cursor.description or ()]
+        self._rows = [dict(zip(columns, row)) if self._dictionary else row for row in rows]
+        self.rowcount = cursor.rowcount
+        self.lastrowid = cursor.lastrowid
+
+    def execute(self, query: str, params=()):
+        self._run(query, lambda q: self._conn.db.execute(q, tuple(params or ())))
+        if query.lstrip().upper().startswith('INSERT') and self.rowcount > 1:
+            # MySQL은 다중 행 INSERT의 첫 번째 id를 돌려줌
+            self.lastrowid -= self.rowcount - 1
+
+    def executemany(self, query: str, seq_params):
+        # mysql.connector는 INSERT executemany를 다중 행 INSERT 한 번으로 보냄
+        self._run(query, lambda q: self._conn.db.executemany(q, [tuple(params) for params in seq_params]))
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self):
+        self._rows = []
+
+class Connection:
+    """
+    mysql.connector 연결 대신 쓰는 메모리 SQLite 연결 (JobDatabase(conn=...)에 전달).
+    rtt를 주면 쿼리/커밋마다 그만큼 대기해 네트워크 너머 DB의 왕복 시간을 흉내 낸다.
+    """
+    def __init__(self, rtt: float = 0.0):
+        self.db = sqlite3.connect(':memory:', check_same_thread=False, isolation_level=None)
+        self.db.create_function('GET_LOCK', 2, lambda name, timeout: 1)
+        self.db.create_function('RELEASE_LOCK', 1, lambda name: 1)
+        self.db.executescript(SCHEMA)
+        self.db.execute('BEGIN')
+        self.lock = threading.Lock()
+        self.rtt = rtt
+        self.queries = 0
+        self.commits = 0
+
+    def round_trip(self):
+        self.queries += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def cursor(self, dictionary: bool = False) -> Cursor:
+        return Cursor(self, dictionary)
+
+    def commit(self):
+        self.commits += 1
+        self.round_trip()
+        with self.lock:
+            self.db.execute('COMMIT')
+            self.db.execute('BEGIN')
+
+    def rollback(self):
+        with self.lock:
+            self.db.execute('ROLLBACK')
+            self.db.execute('BEGIN')
+
+    def count(self, table: str) -> int:
+        with self.lock:
+            return self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+def connect(rtt: float = 0.0) -> Connection:
+    return Connection(rtt)
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+_MISSING = object()
+
+class TTLCache:
+    """
+    TTL과 LRU 방식의 크기 제한을 가진 프로세스 내부 캐시.
+    - max_size(항목 수) 또는 max_bytes(set 시 전달한 size의 합)를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - ttl(초)이 지난 항목은 조회 시 만료 처리
+    """
+    def __init__(self, max_size: int, ttl: float, max_bytes: Optional[int] = None):
+        self.max_size = max(max_size, 1)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, size: int = 0):
+        with self._lock:
+            if self.max_bytes is not None and size > self.max_bytes:
+                # 상한보다 큰 항목은 저장하지 않음
+                self._remove(key)
+                return
+            self._remove(key)
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value, size)
+            self._bytes += size
+            while len(self._data) > self.max_size or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+
+    def _remove(self, key: Hashable):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def pop(self, key: Hashable):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        stats = {"size": len(self._data), "max_size": self.max_size, "ttl": self.ttl, "hits": self.hits, "misses": self.misses}
+        if self.max_bytes is not None:
+            stats.update({"bytes": self._bytes, "max_bytes": self.max_bytes})
+        return stats
+
+class SingleFlightCache(TTLCache):
+    """
+    같은 키에 대한 동시 계산을 하나로 합치는 비동기 캐시.
+    캐시에 없는 키를 여러 요청이 동시에 조회하면 첫 요청만 계산하고 나머지는 그 결과를 기다린다.
+    계산 도중 clear()가 호출되면 계산 결과는 반환만 하고 저장하지 않는다.
+    """
+    def __init__(self, max_size: int, ttl: float, max_bytes: Optional[int] = None):
+        super().__init__(max_size, ttl, max_bytes)
+        self._inflight = {}
+        self._generation = 0
+
+    def clear(self):
+        self._generation += 1
+        super().clear()
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]], sizeof: Callable[[Any], int] = len) -> Any:
+        while True:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 계산하던 요청이 취소된 경우 다시 시도, 이 요청이 취소된 경우는 그대로 전파
+                if future.cancelled():
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없을 때 미확인 예외 경고가 나지 않도록 표시
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(value)
+        if generation == self._generation:
+            self.set(key, value, size=sizeof(value))
+        return value
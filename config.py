@@ -16,3 +16,55 @@ SECRET_KEY = os.getenv('SECRET_KEY', 'secret')
 ALGORITHM = os.getenv('ALGORITHM', 'HS256')
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv('ACCESS_TOKEN_EXPIRE_MINUTES', '60'))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv('REFRESH_TOKEN_EXPIRE_DAYS', '7'))
+
+# 커넥션 풀 설정
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '10'))                 # 상시 유지하는 커넥션 수
+DB_POOL_MAX_OVERFLOW = int(os.getenv('DB_POOL_MAX_OVERFLOW', '20')) # 순간 부하 시 추가로 허용하는 커넥션 수
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '10'))         # 커넥션 대기 최대 시간(초)
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))         # 커넥션 최대 수명(초), 0 이하이면 제한 없음
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes')
+
+# 인증 사용자 캐시 설정
+USER_CACHE_TTL_SECONDS = float(os.getenv('USER_CACHE_TTL_SECONDS', '60'))
+USER_CACHE_MAX_SIZE = int(os.getenv('USER_CACHE_MAX_SIZE', '10000'))
+
+# 무상태(stateless) 토큰 검증 모드: 액세스 토큰에 상태/권한 클레임을 담고 DB 조회 없이 검증
+# 프로필 변경은 토큰 재발급 전까지 반영되지 않으므로 만료 시간을 짧게 유지
+AUTH_STATELESS = os.getenv('AUTH_STATELESS', 'false').lower() in ('1', 'true', 'yes')
+STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv('STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES', '5'))
+REVOCATION_MAX_SIZE = int(os.getenv('REVOCATION_MAX_SIZE', '100000'))
+
+# 채용 공고 키워드 검색 설정
+# fulltext: migrations/002의 ngram FULLTEXT 인덱스 사용, like: 기존 LIKE 검색
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'fulltext')
+NGRAM_TOKEN_SIZE = int(os.getenv('NGRAM_TOKEN_SIZE', '2'))  # MySQL ngram_token_size와 동일하게 설정
+
+# 채용 공고 facet 인덱스 설정
+FACET_INDEX_ENABLED = os.getenv('FACET_INDEX_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+FACET_MAX_IN_LIST = int(os.getenv('FACET_MAX_IN_LIST', '500'))              # 이보다 결과가 많으면 IN 목록 대신 SQL 조건으로 필터
+POSTINGS_SYNC_INTERVAL_SECONDS = float(os.getenv('POSTINGS_SYNC_INTERVAL_SECONDS', '30'))  # 크롤러 등 외부 변경 반영 주기
+
+# 채용 공고 목록 응답 캐시 설정
+JOB_CACHE_TTL_SECONDS = float(os.getenv('JOB_CACHE_TTL_SECONDS', '30'))
+JOB_CACHE_MAX_ENTRIES = int(os.getenv('JOB_CACHE_MAX_ENTRIES', '1000'))
+JOB_CACHE_MAX_BYTES = int(os.getenv('JOB_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+JOB_COUNT_CACHE_TTL_SECONDS = float(os.getenv('JOB_COUNT_CACHE_TTL_SECONDS', '300'))
+JOB_COUNT_CACHE_MAX_ENTRIES = int(os.getenv('JOB_COUNT_CACHE_MAX_ENTRIES', '10000'))
+
+# 조회수 버퍼 설정 (조회수를 메모리에 모아 주기적으로 일괄 반영)
+VIEW_COUNT_FLUSH_INTERVAL_SECONDS = float(os.getenv('VIEW_COUNT_FLUSH_INTERVAL_SECONDS', '5'))
+VIEW_COUNT_FLUSH_THRESHOLD = int(os.getenv('VIEW_COUNT_FLUSH_THRESHOLD', '1000'))  # 누적 조회수가 이 값을 넘으면 즉시 반영
+
+# 연관 공고 인덱스 설정
+RELATED_INDEX_ENABLED = os.getenv('RELATED_INDEX_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+RELATED_TOP_N = int(os.getenv('RELATED_TOP_N', '20'))                       # 공고별로 미리 계산해 두는 연관 공고 수
+RELATED_COMPANY_BONUS = float(os.getenv('RELATED_COMPANY_BONUS', '0.5'))    # 같은 회사 공고에 더하는 점수
+
+# 채용 공고 일괄 등록 설정
+JOB_BULK_MAX_ITEMS = int(os.getenv('JOB_BULK_MAX_ITEMS', '5000'))    # 한 요청에 등록 가능한 최대 공고 수
+JOB_BULK_CHUNK_SIZE = int(os.getenv('JOB_BULK_CHUNK_SIZE', '500'))   # 이 수만큼 등록할 때마다 커밋
+
+# 이력서 파일 저장소 설정 (SHA-256 기반 파일 경로, migrations/003 적용 필요)
+RESUME_STORAGE_DIR = os.getenv('RESUME_STORAGE_DIR', 'resume_files')
+RESUME_MAX_BYTES = int(os.getenv('RESUME_MAX_BYTES', str(10 * 1024 * 1024)))
+RESUME_CHUNK_SIZE = int(os.getenv('RESUME_CHUNK_SIZE', str(1024 * 1024)))  # 업로드를 읽고 쓰는 단위(바이트)
@@ -0,0 +1,295 @@
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+# 재시도 대상 상태 코드 (요청 과다, 서버 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 요청 속도 제한 (스레드 안전).
+    초당 rate개씩 토큰이 채워지며 최대 burst개까지 모아 둘 수 있다.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        토큰을 하나 얻을 때까지 대기 (rate가 0 이하이면 제한 없음)
+        """
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+class HostRateLimiter:
+    """
+    호스트별 토큰 버킷.
+    pause로 호스트를 일정 시간 멈추면 그 호스트에 요청하려는 모든 스레드가 재개 시각까지 기다린다.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def pause(self, url: str, seconds: float):
+        """
+        호스트에 대한 요청을 seconds초 동안 멈춤 (이미 더 길게 멈춘 경우 그대로 유지)
+        """
+        host = urlsplit(url).netloc
+        until = time.monotonic() + seconds
+        with self._lock:
+            if until > self._paused_until.get(host, 0):
+                self._paused_until[host] = until
+
+    def acquire(self, url: str):
+        host = urlsplit(url).netloc
+        while True:
+            with self._lock:
+                wait = self._paused_until.get(host, 0) - time.monotonic()
+                if wait <= 0:
+                    self._paused_until.pop(host, None)
+                    bucket = self._buckets.get(host)
+                    if bucket is None:
+                        bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+                    break
+            time.sleep(wait)
+        bucket.acquire()
+
+class HttpCache:
+    """
+    페이지별 ETag/Last-Modified 값을 저장하는 디스크 캐시 (URL마다 JSON 파일 하나).
+    본문은 저장하지 않으며, 다음 요청에 조건부 헤더를 붙여 변경이 없으면 304 응답을 받는 데 사용한다.
+    200 응답의 검증자는 메모리에 보관했다가 페이지의 공고가 DB에 커밋된 뒤 commit으로 저장한다
+    (적재 전에 저장하면 적재에 실패한 페이지가 다음 요청에서 304로 건너뛰어짐).
+    """
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._staged: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        try:
+            with open(self._path(url), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def stage(self, url: str, response: requests.Response):
+        """
+        200 응답의 검증자를 commit 전까지 메모리에 보관
+        """
+        with self._lock:
+            self._staged[url] = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+    def discard(self, url: str):
+        """
+        보관한 검증자를 저장하지 않고 버림 (다음 요청은 기존 항목으로 조건부 요청)
+        """
+        with self._lock:
+            self._staged.pop(url, None)
+
+    def commit(self, url: str):
+        """
+        보관한 검증자 저장 (검증자가 없으면 기존 항목 삭제, 보관한 값이 없으면 아무것도 하지 않음)
+        """
+        with self._lock:
+            staged = self._staged.pop(url, None)
+        if staged is None:
+            return
+        path = self._path(url)
+        etag, last_modified = staged
+        if not etag and not last_modified:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'etag': etag, 'last_modified': last_modified, 'stored_at': time.time()}, f)
+        os.replace(tmp_path, path)
+
+class Fetcher:
+    """
+    속도 제한과 재시도를 적용한 페이지 요청기 (여러 스레드에서 함께 사용)
+    - 하나의 세션으로 호스트별 연결을 재사용 (keep-alive 연결 풀)
+    - gzip/deflate 응답 해제 (brotli 패키지가 설치되어 있으면 br 포함)
+    - cache가 주어지면 조건부 요청을 보내고, 변경이 없는 페이지(304)는 본문 없이 None을 반환
+      (200 응답의 검증자는 호출한 쪽이 commit_cache를 호출해야 저장됨)
+    - 429/5xx 응답을 받으면 Retry-After(초 또는 HTTP 날짜) 또는 백오프 시간만큼 호스트 전체의 요청을 멈춤
+
+    Args:
+        rate (float): 호스트별 초당 최대 요청 수 (0 이하이면 제한 없음)
+        burst (int): 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        max_retries (int): 429/5xx 응답이나 연결 오류 시 재시도 횟수
+        backoff (float): 재시도 대기 시간의 기준값(초), 재시도마다 두 배로 증가
+        max_retry_delay (float): 재시도 대기 시간의 최대값(초), Retry-After가 더 길어도 이 값까지만 대기
+        timeout (float): 응답 대기 제한 시간(초)
+        connect_timeout (float): 연결 제한 시간(초)
+        pool_size (int): 호스트별로 유지하는 최대 연결 수
+        cache (HttpCache): ETag/Last-Modified 캐시
+    """
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: int = 1,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_retry_delay: float = 60.0,
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0,
+        pool_size: int = 10,
+        cache: Optional[HttpCache] = None
+    ):
+        self.limiter = HostRateLimiter(rate, burst)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_retry_delay = max(max_retry_delay, 0.0)
+        self.timeout = (connect_timeout, timeout)
+        self.cache = cache
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        # 재시도는 fetch에서 직접 처리하므로 어댑터 재시도는 사용하지 않음
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.counts = {'requests': 0, 'not_modified': 0, 'retries': 0}
+        self._counts_lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self._counts_lock:
+            self.counts[key] += 1
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Retry-After 헤더의 대기 시간(초). 초 단위 숫자와 HTTP 날짜 형식을 지원하며, 해석할 수 없으면 None
+        """
+        value = (response.headers.get('Retry-After') or '').strip()
+        if not value:
+            return None
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            return None
+        return max(retry_at.timestamp() - time.time(), 0.0)
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        delay = self._retry_after(response) if response is not None else None
+        if delay is None:
+            # 여러 요청이 동시에 재시도하지 않도록 약간의 무작위 지연 추가
+            delay = self.backoff * (2 ** attempt) * (1 + random.random() * 0.1)
+        return min(delay, self.max_retry_delay)
+
+    def _get(self, url: str, headers: Dict[str, str]) -> requests.Response:
+        self._count('requests')
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    @staticmethod
+    def prepare_url(url: str, params: Optional[dict] = None) -> str:
+        """
+        쿼리 파라미터를 붙인 요청 주소 (캐시 키)
+        """
+        return requests.Request('GET', url, params=params).prepare().url
+
+    def fetch(self, url: str, params: Optional[dict] = None) -> Optional[str]:
+        """
+        페이지 HTML 요청. 캐시된 페이지가 변경되지 않았으면(304) None 반환.
+        재시도 후에도 실패하면 requests.RequestException 발생
+        """
+        url = self.prepare_url(url, params)
+        headers = self.cache.conditional_headers(url) if self.cache is not None else {}
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(url)
+            try:
+                response = self._get(url, headers)
+            except requests.RequestException as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                logging.warning(f"요청 실패 ({e}), {delay:.1f}초 후 재시도: {url}")
+                self._count('retries')
+                time.sleep(delay)
+                continue
+
+            if response.status_code in RETRY_STATUS:
+                # 같은 호스트에 요청하는 다른 스레드도 함께 기다리도록 호스트 단위로 멈춤 (대기는 다음 acquire에서)
+                delay = self._retry_delay(attempt, response)
+                self.limiter.pause(url, delay)
+                if attempt < self.max_retries:
+                    logging.warning(f"응답 코드 {response.status_code}, {delay:.1f}초 후 재시도: {url}")
+                    self._count('retries')
+                    response.close()
+                    continue
+            if response.status_code == 304 and headers:
+                self._count('not_modified')
+                return None
+            response.raise_for_status()
+            if self.cache is not None:
+                self.cache.stage(url, response)
+            return response.text
+
+    def commit_cache(self, url: str, params: Optional[dict] = None):
+        """
+        fetch로 받은 페이지의 검증자 저장 (페이지 내용을 모두 반영한 뒤 호출)
+        """
+        if self.cache is not None:
+            self.cache.commit(self.prepare_url(url, params))
+
+    def discard_cache(self, url: str, params: Optional[dict] = None):
+        """
+        fetch로 받은 페이지의 검증자를 저장하지 않음 (다음 요청에서 다시 받음)
+        """
+        if self.cache is not None:
+            self.cache.discard(self.prepare_url(url, params))
+
+    def stats(self) -> dict:
+        with self._counts_lock:
+            return dict(self.counts)
+
+    def close(self):
+        self.session.close()
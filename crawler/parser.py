@@ -0,0 +1,207 @@
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+from bs4 import BeautifulSoup
+
+# 선택 의존성: 설치되어 있으면 더 빠른 파서 사용
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# 채용공고 항목 컬럼 (CSV 컬럼 순서)
+LISTING_COLUMNS = ['회사명', '제목', '링크', '지역', '경력', '학력', '고용형태', '마감일', '직무분야', '연봉정보']
+
+DEFAULT_BASE_URL = "https://www.saramin.co.kr"
+
+# BeautifulSoup이 공백만 있는 문자열을 줄일 때 공백으로 보는 문자
+_ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+
+def _join_text(pieces: Iterable[str]) -> str:
+    """
+    텍스트 노드를 BeautifulSoup의 .text와 같은 방식으로 합침.
+    BeautifulSoup은 공백만 있는 텍스트 노드를 줄바꿈(줄바꿈 포함 시) 또는 공백 하나로 줄이므로
+    다른 백엔드에서도 같은 결과가 나오도록 맞춘다.
+    """
+    return ''.join(
+        piece if piece.strip(_ASCII_SPACES) else ('\n' if '\n' in piece else ' ')
+        for piece in pieces if piece
+    ).strip()
+
+def _job(company, title, link, conditions, deadline, sector, salary) -> Dict[str, str]:
+    return {
+        '회사명': company,
+        '제목': title,
+        '링크': link,
+        '지역': conditions[0] if len(conditions) > 0 else '',
+        '경력': conditions[1] if len(conditions) > 1 else '',
+        '학력': conditions[2] if len(conditions) > 2 else '',
+        '고용형태': conditions[3] if len(conditions) > 3 else '',
+        '마감일': deadline,
+        '직무분야': sector,
+        '연봉정보': salary
+    }
+
+def _parse_html_parser(html: str, base_url: str) -> List[Dict[str, str]]:
+    jobs = []
+    soup = BeautifulSoup(html, 'html.parser')
+
+    for job in soup.select('.item_recruit'):
+        try:
+            # 회사명
+            company = job.select_one('.corp_name a').text.strip()
+
+            # 채용 제목, 링크
+            title_link = job.select_one('.job_tit a')
+            title = title_link.text.strip()
+            link = base_url + title_link['href']
+
+            # 지역, 경력, 학력, 고용형태
+            conditions = [span.text.strip() for span in job.select('.job_condition span')]
+
+            # 마감일
+            deadline = job.select_one('.job_date .date').text.strip()
+
+            # 직무 분야
+            job_sector = job.select_one('.job_sector')
+            sector = job_sector.text.strip() if job_sector else ''
+
+            # 평균연봉 정보 (있는 경우)
+            salary_badge = job.select_one('.area_badge .badge')
+            salary = salary_badge.text.strip() if salary_badge else ''
+
+            jobs.append(_job(company, title, link, conditions, deadline, sector, salary))
+
+        except (AttributeError, KeyError) as e:
+            logging.error(f"항목 파싱 중 에러 발생: {e}")
+            continue
+
+    return jobs
+
+def _parse_selectolax(html: str, base_url: str) -> List[Dict[str, str]]:
+    jobs = []
+    tree = LexborHTMLParser(html)
+
+    def text(node) -> str:
+        return _join_text(child.text_content for child in node.traverse(include_text=True) if child.tag == '-text')
+
+    for job in tree.css('.item_recruit'):
+        try:
+            company = text(job.css_first('.corp_name a'))
+            title_link = job.css_first('.job_tit a')
+            title = text(title_link)
+            link = base_url + title_link.attributes['href']
+            conditions = [text(span) for span in job.css('.job_condition span')]
+            deadline = text(job.css_first('.job_date .date'))
+            job_sector = job.css_first('.job_sector')
+            sector = text(job_sector) if job_sector is not None else ''
+            salary_badge = job.css_first('.area_badge .badge')
+            salary = text(salary_badge) if salary_badge is not None else ''
+            jobs.append(_job(company, title, link, conditions, deadline, sector, salary))
+        except (AttributeError, KeyError) as e:
+            logging.error(f"항목 파싱 중 에러 발생: {e}")
+            continue
+
+    return jobs
+
+def _xpath_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# CSS 선택자와 같은 의미의 XPath (.a .b -> 클래스 a의 자손 중 클래스 b)
+_LXML_XPATH = {
+    'item': f"//*[{_xpath_class('item_recruit')}]",
+    'company': f".//*[{_xpath_class('corp_name')}]//a",
+    'title': f".//*[{_xpath_class('job_tit')}]//a",
+    'conditions': f".//*[{_xpath_class('job_condition')}]//span",
+    'deadline': f".//*[{_xpath_class('job_date')}]//*[{_xpath_class('date')}]",
+    'sector': f".//*[{_xpath_class('job_sector')}]",
+    'salary': f".//*[{_xpath_class('area_badge')}]//*[{_xpath_class('badge')}]",
+}
+
+def _parse_lxml(html: str, base_url: str) -> List[Dict[str, str]]:
+    jobs = []
+    tree = lxml.html.document_fromstring(html.encode('utf-8'), parser=lxml.html.HTMLParser(encoding='utf-8'))
+
+    def first(node, key):
+        found = node.xpath(_LXML_XPATH[key])
+        return found[0] if found else None
+
+    def text(node) -> str:
+        return _join_text(node.itertext())
+
+    for job in tree.xpath(_LXML_XPATH['item']):
+        try:
+            company = text(first(job, 'company'))
+            title_link = first(job, 'title')
+            title = text(title_link)
+            link = base_url + title_link.attrib['href']
+            conditions = [text(span) for span in job.xpath(_LXML_XPATH['conditions'])]
+            deadline = text(first(job, 'deadline'))
+            job_sector = first(job, 'sector')
+            sector = text(job_sector) if job_sector is not None else ''
+            salary_badge = first(job, 'salary')
+            salary = text(salary_badge) if salary_badge is not None else ''
+            jobs.append(_job(company, title, link, conditions, deadline, sector, salary))
+        except (AttributeError, KeyError) as e:
+            logging.error(f"항목 파싱 중 에러 발생: {e}")
+            continue
+
+    return jobs
+
+# 파서 백엔드 (auto 선택 시 앞에 있는 것부터 사용)
+BACKENDS: Dict[str, Optional[Callable[[str, str], List[Dict[str, str]]]]] = {
+    'selectolax': _parse_selectolax if LexborHTMLParser is not None else None,
+    'lxml': _parse_lxml if lxml is not None else None,
+    'html.parser': _parse_html_parser,
+}
+
+def available_backends() -> List[str]:
+    return [name for name, parse in BACKENDS.items() if parse is not None]
+
+def resolve_backend(backend: str = 'auto') -> str:
+    """
+    파서 백엔드 이름 확인. auto이면 설치된 것 중 가장 빠른 백엔드를 사용하며,
+    설치되지 않은 백엔드를 지정하면 ValueError 발생
+    """
+    if backend == 'auto':
+        return available_backends()[0]
+    if BACKENDS.get(backend) is None:
+        raise ValueError(f"Parser backend '{backend}' is not available (available: {', '.join(available_backends())})")
+    return backend
+
+def parse_listing(html: str, base_url: str = DEFAULT_BASE_URL, backend: str = 'html.parser') -> List[Dict[str, str]]:
+    """
+    사람인 검색 결과 페이지 HTML에서 채용공고 목록을 추출하는 함수.
+    프로세스 풀에서도 실행할 수 있도록 모듈 수준 함수로 둔다.
+
+    Args:
+        html (str): 검색 결과 페이지 HTML
+        base_url (str): 채용 링크 앞에 붙일 주소
+        backend (str): 파서 백엔드 (selectolax, lxml, html.parser, auto)
+
+    Returns:
+        List[Dict[str, str]]: 채용공고 정보 목록 (crawl_saramin 결과와 같은 컬럼)
+    """
+    return BACKENDS[resolve_backend(backend)](html, base_url)
+
+def compare_backends(html: str, base_url: str = DEFAULT_BASE_URL) -> Dict[str, bool]:
+    """
+    설치된 모든 백엔드의 파싱 결과가 html.parser 결과와 같은지 확인 (백엔드 -> 일치 여부)
+    """
+    expected = _parse_html_parser(html, base_url)
+    return {name: BACKENDS[name](html, base_url) == expected for name in available_backends()}
+
+if __name__ == "__main__":
+    # 저장해 둔 검색 결과 페이지로 백엔드별 결과 비교: python -m crawler.parser crawler/fixtures/*.html
+    import sys
+    mismatched = False
+    for path in sys.argv[1:]:
+        with open(path, encoding='utf-8') as f:
+            result = compare_backends(f.read())
+        mismatched |= not all(result.values())
+        print(f"{path}: {result}")
+    sys.exit(1 if mismatched else 0)
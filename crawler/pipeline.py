@@ -0,0 +1,305 @@
+import csv
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import requests
+from crawler.fetcher import Fetcher
+from crawler.parser import parse_listing, LISTING_COLUMNS
+from crawler.state import CrawlState, extract_rec_idx
+
+# 생산자 스레드가 결과 큐에 넣지 못하고 기다릴 때 중단 여부를 확인하는 간격(초)
+PUT_POLL_SECONDS = 0.5
+
+_DONE = object()
+
+class _WorkerError:
+    """
+    요청 스레드에서 발생한 에러 (결과 큐를 통해 소비자에게 전달)
+    """
+    def __init__(self, error: BaseException):
+        self.error = error
+
+def listing_url(base_url: str, keyword: str, page: int) -> str:
+    """
+    검색 결과 한 페이지의 주소 (HTTP 캐시 키)
+    """
+    return Fetcher.prepare_url(
+        f"{base_url}/zf_user/search/recruit",
+        params={'searchType': 'search', 'searchword': keyword, 'recruitPage': page}
+    )
+
+def fetch_listing_html(fetcher: Fetcher, keyword: str, page: int, base_url: str) -> Optional[str]:
+    """
+    검색 결과 한 페이지의 HTML을 요청하는 함수 (지난 요청 이후 변경이 없으면 None)
+    """
+    return fetcher.fetch(listing_url(base_url, keyword, page))
+
+def make_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    파싱 단계용 프로세스 풀. 요청 스레드가 실행 중인 프로세스를 fork하지 않도록 spawn 방식을 사용한다.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+def iter_pages(
+    fetcher: Fetcher,
+    keywords: List[str],
+    pages: int,
+    base_url: str,
+    max_workers: int = 4,
+    queue_size: int = 8,
+    should_continue: Optional[Callable[[str, int, List[Dict[str, str]]], bool]] = None,
+    parser_backend: str = 'html.parser',
+    parse_executor: Optional[Executor] = None
+) -> Iterator[Tuple[str, int, List[Dict[str, str]]]]:
+    """
+    키워드별 1~pages 페이지를 여러 스레드에서 요청/파싱하고 (키워드, 페이지, 공고 목록)을 완료 순서대로 반환.
+    결과 큐의 크기가 queue_size로 제한되어 소비자(DB 적재)가 느리면 요청 스레드도 멈춘다.
+    요청에 실패한 페이지와 지난 요청 이후 변경되지 않은 페이지(304)는 빈 목록으로 반환된다.
+    그 밖의 에러(파싱 에러 등)는 남은 요청을 취소하고 소비자 쪽에서 다시 발생시킨다.
+
+    parse_executor(프로세스 풀)가 주어지면 파싱은 풀에서 실행되어 요청 스레드와 CPU를 나눠 쓰지 않는다.
+
+    should_continue가 주어지면 키워드별로 페이지를 순서대로 요청하고,
+    should_continue(키워드, 페이지, 공고 목록)이 False이면 그 키워드의 다음 페이지를 요청하지 않는다.
+    """
+    workers_count = max(max_workers, 1)
+    task_queue = queue.Queue()
+    results = queue.Queue(maxsize=max(queue_size, 1))
+    stop = threading.Event()
+    lock = threading.Lock()
+    outstanding = [0]
+
+    def add_task(task):
+        with lock:
+            outstanding[0] += 1
+        task_queue.put(task)
+
+    def task_done():
+        with lock:
+            outstanding[0] -= 1
+            finished = outstanding[0] == 0
+        if finished:
+            for _ in range(workers_count):
+                task_queue.put(None)
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def crawl_page(keyword: str, page: int) -> List[Dict[str, str]]:
+        try:
+            html = fetch_listing_html(fetcher, keyword, page, base_url)
+        except requests.RequestException as e:
+            logging.error(f"'{keyword}' {page}페이지 요청 중 에러 발생: {e}")
+            return []
+        if html is None:
+            # 변경되지 않은 페이지는 파싱하지 않음 (이미 적재한 공고)
+            logging.info(f"'{keyword}' {page}페이지 변경 없음")
+            return []
+        if parse_executor is not None:
+            jobs = parse_executor.submit(parse_listing, html, base_url, parser_backend).result()
+        else:
+            jobs = parse_listing(html, base_url, parser_backend)
+        logging.info(f"'{keyword}' {page}페이지 크롤링 완료")
+        return jobs
+
+    def worker():
+        try:
+            while not stop.is_set():
+                task = task_queue.get()
+                if task is None:
+                    break
+                keyword, page = task
+                try:
+                    jobs = crawl_page(keyword, page)
+                    if should_continue is not None and page < pages and should_continue(keyword, page, jobs):
+                        add_task((keyword, page + 1))
+                except Exception as e:
+                    # 요청 실패 외의 에러(파싱, 프로세스 풀 등)는 소비자에게 전달해 크롤링을 중단
+                    logging.error(f"'{keyword}' {page}페이지 처리 중 에러 발생: {e}")
+                    put(_WorkerError(e))
+                    break
+                finally:
+                    task_done()
+                if not put((keyword, page, jobs)):
+                    break
+        finally:
+            put(_DONE)
+
+    first_pages = 1 if should_continue is not None else pages
+    for keyword in keywords:
+        for page in range(1, first_pages + 1):
+            add_task((keyword, page))
+    if outstanding[0] == 0:
+        for _ in range(workers_count):
+            task_queue.put(None)
+
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(workers_count)]
+    for thread in workers:
+        thread.start()
+    try:
+        finished = 0
+        while finished < len(workers):
+            item = results.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            if isinstance(item, _WorkerError):
+                raise item.error
+            yield item
+    finally:
+        # 소비자가 중간에 멈춘 경우 남은 요청을 취소하고 스레드를 정리
+        stop.set()
+        for _ in workers:
+            task_queue.put(None)
+        for thread in workers:
+            thread.join()
+
+def normalize_job(job: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """
+    파싱한 공고의 값 앞뒤 공백을 제거하고 빈 값을 None으로 변환
+    (CSV를 거쳐 적재할 때 빈 칸이 NaN으로 읽히던 것과 같은 결과)
+    """
+    normalized = {}
+    for column in LISTING_COLUMNS:
+        value = job.get(column)
+        if isinstance(value, str):
+            value = value.strip() or None
+        normalized[column] = value
+    return normalized
+
+def batched(rows: Iterable, size: int) -> Iterator[list]:
+    """
+    size개씩 묶어서 반환
+    """
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+class CsvSink:
+    """
+    키워드별 CSV 파일(saramin_{키워드}.csv)에 공고를 이어서 기록하는 부가 출력
+    """
+    def __init__(self, directory: str = "."):
+        self.directory = directory
+        self._files = {}
+        self._writers = {}
+
+    def write(self, keyword: str, job: Dict[str, Optional[str]]):
+        writer = self._writers.get(keyword)
+        if writer is None:
+            path = os.path.join(self.directory, f"saramin_{keyword}.csv")
+            self._files[keyword] = open(path, 'w', newline='', encoding='utf-8')
+            writer = self._writers[keyword] = csv.DictWriter(self._files[keyword], fieldnames=LISTING_COLUMNS)
+            writer.writeheader()
+        writer.writerow(job)
+
+    def close(self):
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+        self._writers.clear()
+
+def run_pipeline(
+    keywords: List[str],
+    pages: int,
+    write_batch: Callable[[List[Dict[str, Optional[str]]]], Tuple[int, int, List[int]]],
+    fetcher: Fetcher,
+    base_url: str,
+    max_workers: int = 4,
+    batch_size: int = 200,
+    queue_size: int = 8,
+    csv_sink: Optional[CsvSink] = None,
+    state: Optional[CrawlState] = None,
+    parser_backend: str = 'html.parser',
+    parse_executor: Optional[Executor] = None
+) -> Dict[str, int]:
+    """
+    요청 -> 파싱 -> 정규화 -> 배치 적재를 스트리밍으로 처리.
+    크롤링 결과를 모두 모으지 않고 batch_size개씩 write_batch로 넘기므로 메모리 사용량이 일정하다.
+    write_batch는 (추가된 수, 건너뛴 수, 적재에 실패한 공고의 배치 내 위치 목록)을 반환한다.
+
+    state가 주어지면 이미 적재한 공고(rec_idx 기준)는 적재 대상에서 빼고,
+    페이지의 공고가 모두 이미 본 공고이면 그 키워드의 다음 페이지를 요청하지 않는다.
+    적재를 마친 공고와 키워드별 크롤링 시각은 state에 기록된다 (적재에 실패한 공고는 다음 크롤링에서 다시 시도).
+    fetcher의 HTTP 캐시 검증자는 페이지의 공고가 모두 적재된 뒤에 저장하고, 적재에 실패한 공고가 있으면 버린다.
+
+    Returns:
+        Dict[str, int]: pages, seen(이미 본 공고), jobs(적재 대상), inserted, skipped, failed 건수
+    """
+    counts = {"pages": 0, "seen": 0, "jobs": 0, "inserted": 0, "skipped": 0, "failed": 0}
+    new_postings = dict.fromkeys(keywords, 0)
+    should_continue = None
+    if state is not None:
+        def should_continue(keyword, page, page_jobs):
+            rec_ids = [extract_rec_idx(job.get('링크')) for job in page_jobs]
+            return bool(rec_ids) and (None in rec_ids or len(state.seen(rec_ids)) < len(set(rec_ids)))
+
+    # 페이지별 아직 적재하지 않은 공고 수와 적재 실패 여부
+    pending: Dict[Tuple[str, int], List] = {}
+
+    def page_loaded(keyword: str, page: int, ok: bool):
+        url = listing_url(base_url, keyword, page)
+        if ok:
+            fetcher.commit_cache(url)
+        else:
+            fetcher.discard_cache(url)
+
+    def jobs():
+        for keyword, page, page_jobs in iter_pages(
+            fetcher, keywords, pages, base_url, max_workers, queue_size, should_continue,
+            parser_backend=parser_backend, parse_executor=parse_executor
+        ):
+            counts["pages"] += 1
+            rec_ids = [extract_rec_idx(job.get('링크')) for job in page_jobs]
+            known = state.seen(rec_ids) if state is not None else set()
+            new_jobs = [(rec_id, job) for rec_id, job in zip(rec_ids, page_jobs) if rec_id not in known]
+            counts["seen"] += len(page_jobs) - len(new_jobs)
+            if not new_jobs:
+                page_loaded(keyword, page, True)
+                continue
+            pending[(keyword, page)] = [len(new_jobs), True]
+            for rec_id, job in new_jobs:
+                job = normalize_job(job)
+                if csv_sink is not None:
+                    csv_sink.write(keyword, job)
+                counts["jobs"] += 1
+                yield keyword, page, rec_id, job
+
+    for batch in batched(jobs(), max(batch_size, 1)):
+        inserted, skipped, failed = write_batch([job for _, _, _, job in batch])
+        counts["inserted"] += inserted
+        counts["skipped"] += skipped
+        counts["failed"] += len(failed)
+        failed = set(failed)
+        written = [item for position, item in enumerate(batch) if position not in failed]
+        for keyword, _, _, _ in written:
+            new_postings[keyword] += 1
+        if state is not None:
+            state.mark_seen((rec_id, keyword) for keyword, _, rec_id, _ in written)
+        for position, (keyword, page, _, _) in enumerate(batch):
+            entry = pending[(keyword, page)]
+            entry[0] -= 1
+            entry[1] = entry[1] and position not in failed
+            if entry[0] == 0:
+                del pending[(keyword, page)]
+                page_loaded(keyword, page, entry[1])
+
+    if state is not None:
+        for keyword, count in new_postings.items():
+            state.finish_keyword(keyword, count)
+    return counts
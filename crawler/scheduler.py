@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from crawler.state import CrawlState
+
+@dataclass
+class KeywordSchedule:
+    keyword: str
+    interval: float
+    next_run_at: float
+    last_run_at: Optional[float] = None
+    last_new_postings: int = 0
+
+class CrawlScheduler:
+    """
+    키워드별 크롤링 일정 관리.
+    - 새 공고가 많은 키워드는 자주, 새 공고가 없는 키워드는 간격을 backoff배씩 늘려 드물게 크롤링
+    - 한 번에 최대 max_workers개 키워드를 크롤링 (실행 시각이 가장 지난 키워드부터)
+    - 일정은 크롤링 상태 파일에 저장되어 재시작 후에도 유지
+
+    Args:
+        keywords (List[str]): 크롤링할 키워드 목록
+        crawl (Callable[[str], int]): 키워드 하나를 크롤링하고 새로 적재한 공고 수를 반환하는 함수
+        state (CrawlState): 일정을 저장할 크롤링 상태 저장소
+        min_interval (float): 최소 크롤링 간격(초)
+        max_interval (float): 최대 크롤링 간격(초)
+        target_new (int): 한 번 크롤링할 때 찾고자 하는 새 공고 수 (간격 조정 기준)
+        backoff (float): 한 번에 간격을 늘리거나 줄이는 최대 배수
+        max_workers (int): 동시에 크롤링하는 최대 키워드 수
+    """
+    def __init__(
+        self,
+        keywords: List[str],
+        crawl: Callable[[str], int],
+        state: CrawlState,
+        min_interval: float = 900,
+        max_interval: float = 86400,
+        target_new: int = 20,
+        backoff: float = 2.0,
+        max_workers: int = 2
+    ):
+        self.crawl = crawl
+        self.state = state
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.target_new = max(target_new, 1)
+        self.backoff = max(backoff, 1.0)
+        self.max_workers = max(max_workers, 1)
+        self._lock = threading.Lock()
+
+        # 저장된 일정이 없는 키워드는 바로 실행
+        saved = state.load_schedule()
+        now = time.time()
+        self.schedules: Dict[str, KeywordSchedule] = {}
+        for keyword in dict.fromkeys(keywords):
+            if keyword in saved:
+                interval, next_run_at, last_run_at, last_new_postings = saved[keyword]
+                interval = min(max(interval, self.min_interval), self.max_interval)
+                self.schedules[keyword] = KeywordSchedule(keyword, interval, next_run_at, last_run_at, last_new_postings)
+            else:
+                self.schedules[keyword] = KeywordSchedule(keyword, self.min_interval, now)
+
+    def next_interval(self, schedule: KeywordSchedule, new_postings: int, now: float) -> float:
+        """
+        다음 크롤링 간격 계산.
+        새 공고가 없으면 간격을 backoff배로 늘리고, 있으면 지난 크롤링 이후의 새 공고 비율로
+        target_new개가 쌓일 시간을 추정한다 (한 번에 backoff배 이상 바뀌지 않도록 제한).
+        """
+        if new_postings <= 0:
+            interval = schedule.interval * self.backoff
+        else:
+            elapsed = now - schedule.last_run_at if schedule.last_run_at else schedule.interval
+            desired = self.target_new * max(elapsed, 1.0) / new_postings
+            interval = min(max(desired, schedule.interval / self.backoff), schedule.interval * self.backoff)
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def _save(self, schedule: KeywordSchedule):
+        self.state.save_schedule(
+            schedule.keyword, schedule.interval, schedule.next_run_at,
+            schedule.last_run_at, schedule.last_new_postings
+        )
+
+    def run_keyword(self, keyword: str):
+        """
+        키워드 하나를 크롤링하고 다음 일정을 저장. 실패하면 간격은 그대로 두고 min_interval 후 다시 시도한다.
+        """
+        schedule = self.schedules[keyword]
+        try:
+            new_postings = self.crawl(keyword)
+        except Exception as e:
+            logging.error(f"Error crawling keyword '{keyword}': {str(e)}")
+            with self._lock:
+                schedule.next_run_at = time.time() + self.min_interval
+                self._save(schedule)
+            return
+
+        now = time.time()
+        with self._lock:
+            schedule.interval = self.next_interval(schedule, new_postings, now)
+            schedule.last_run_at = now
+            schedule.last_new_postings = new_postings
+            schedule.next_run_at = now + schedule.interval
+            self._save(schedule)
+        logging.info(f"'{keyword}': {new_postings} new postings, next crawl in {schedule.interval:.0f}s")
+
+    def due(self, now: float, running: set) -> List[str]:
+        """
+        실행 시각이 지난 키워드 목록 (오래 기다린 순서)
+        """
+        with self._lock:
+            schedules = [s for s in self.schedules.values() if s.next_run_at <= now and s.keyword not in running]
+        return [s.keyword for s in sorted(schedules, key=lambda s: s.next_run_at)]
+
+    def seconds_until_next(self, now: float, running: set) -> Optional[float]:
+        with self._lock:
+            waiting = [s.next_run_at for s in self.schedules.values() if s.keyword not in running]
+        return max(min(waiting) - now, 0.0) if waiting else None
+
+    def run(self, stop: Optional[threading.Event] = None):
+        """
+        stop이 설정될 때까지 일정에 따라 키워드를 크롤링
+        """
+        stop = stop or threading.Event()
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while not stop.is_set():
+                now = time.time()
+                for keyword in self.due(now, set(running.values()))[:self.max_workers - len(running)]:
+                    running[executor.submit(self.run_keyword, keyword)] = keyword
+
+                timeout = self.seconds_until_next(time.time(), set(running.values()))
+                if len(running) >= self.max_workers:
+                    # 빈 작업자가 없으면 크롤링 하나가 끝날 때까지 대기
+                    timeout = None
+                if running:
+                    done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        running.pop(future)
+                else:
+                    stop.wait(timeout)
@@ -0,0 +1,125 @@
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_postings (
+    rec_idx TEXT PRIMARY KEY,
+    keyword TEXT NOT NULL,
+    seen_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seen_postings_seen_at ON seen_postings (seen_at);
+CREATE TABLE IF NOT EXISTS keyword_state (
+    keyword TEXT PRIMARY KEY,
+    last_crawled_at REAL NOT NULL,
+    last_new_postings INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS keyword_schedule (
+    keyword TEXT PRIMARY KEY,
+    interval_seconds REAL NOT NULL,
+    next_run_at REAL NOT NULL,
+    last_run_at REAL,
+    last_new_postings INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# SQLite IN 조건 하나에 넣는 최대 값 수
+IN_CHUNK_SIZE = 500
+
+def extract_rec_idx(link: Optional[str]) -> Optional[str]:
+    """
+    채용 링크의 rec_idx 파라미터 (사람인 공고 번호), 없으면 None
+    """
+    if not link:
+        return None
+    values = parse_qs(urlsplit(link).query).get('rec_idx')
+    return values[0] if values else None
+
+class CrawlState:
+    """
+    크롤링 상태 저장소 (로컬 SQLite 파일).
+    - 이미 적재한 공고의 rec_idx와 키워드별 마지막 크롤링 시각을 보관
+    - 보관 기간(retention_days)이 지난 공고는 열 때 정리
+    여러 요청 스레드에서 함께 사용할 수 있도록 커넥션 접근을 잠금으로 직렬화한다.
+    """
+    def __init__(self, path: str, retention_days: float = 90):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+            if retention_days > 0:
+                self._conn.execute("DELETE FROM seen_postings WHERE seen_at < ?", (time.time() - retention_days * 86400,))
+
+    def seen(self, rec_ids: Iterable[str]) -> Set[str]:
+        """
+        주어진 rec_idx 중 이미 본 공고의 집합
+        """
+        rec_ids = list({rec_id for rec_id in rec_ids if rec_id})
+        found = set()
+        with self._lock:
+            for start in range(0, len(rec_ids), IN_CHUNK_SIZE):
+                chunk = rec_ids[start:start + IN_CHUNK_SIZE]
+                placeholders = ','.join(['?'] * len(chunk))
+                rows = self._conn.execute(f"SELECT rec_idx FROM seen_postings WHERE rec_idx IN ({placeholders})", chunk)
+                found.update(row[0] for row in rows)
+        return found
+
+    def mark_seen(self, items: Iterable[Tuple[str, str]]):
+        """
+        (rec_idx, 키워드) 목록을 본 공고로 기록
+        """
+        now = time.time()
+        rows = [(rec_id, keyword, now) for rec_id, keyword in items if rec_id]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO seen_postings (rec_idx, keyword, seen_at) VALUES (?, ?, ?)", rows)
+
+    def finish_keyword(self, keyword: str, new_postings: int):
+        """
+        키워드의 마지막 크롤링 시각과 새 공고 수 기록
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO keyword_state (keyword, last_crawled_at, last_new_postings) VALUES (?, ?, ?)",
+                (keyword, time.time(), new_postings)
+            )
+
+    def last_crawled(self, keyword: str) -> Optional[float]:
+        """
+        키워드의 마지막 크롤링 시각 (epoch 초), 기록이 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT last_crawled_at FROM keyword_state WHERE keyword = ?", (keyword,)).fetchone()
+        return row[0] if row else None
+
+    def load_schedule(self) -> Dict[str, Tuple[float, float, Optional[float], int]]:
+        """
+        키워드별 크롤링 일정 (키워드 -> (간격, 다음 실행 시각, 마지막 실행 시각, 마지막 새 공고 수))
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT keyword, interval_seconds, next_run_at, last_run_at, last_new_postings FROM keyword_schedule"
+            ).fetchall()
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+    def save_schedule(self, keyword: str, interval: float, next_run_at: float, last_run_at: Optional[float], last_new_postings: int):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO keyword_schedule (keyword, interval_seconds, next_run_at, last_run_at, last_new_postings) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (keyword, interval, next_run_at, last_run_at, last_new_postings)
+            )
+
+    def stats(self) -> dict:
+        with self._lock:
+            (seen,) = self._conn.execute("SELECT COUNT(*) FROM seen_postings").fetchone()
+            (keywords,) = self._conn.execute("SELECT COUNT(*) FROM keyword_state").fetchone()
+        return {"path": self.path, "seen_postings": seen, "keywords": keywords}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
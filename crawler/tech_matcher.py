@@ -0,0 +1,204 @@
+import threading
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from lookups import lookups
+
+# 기술 스택 별칭 (별칭 -> tech_stacks 이름). 대상 이름이 tech_stacks에 있을 때만 사용된다.
+TECH_STACK_ALIASES = {
+    '파이썬': 'Python',
+    '자바': 'Java',
+    'cpp': 'C++',
+    '리눅스': 'Linux',
+    'amazon web services': 'AWS',
+    '리액트': 'React',
+    'react.js': 'React',
+    'reactjs': 'React',
+    '장고': 'Django',
+    '스프링': 'Spring',
+    'spring boot': 'Spring',
+    '웹 개발': '웹개발',
+    '앱 개발': '앱개발',
+    '백엔드 개발': '백엔드',
+    'backend': '백엔드',
+    'back-end': '백엔드',
+    '프론트엔드 개발': '프론트엔드',
+    'frontend': '프론트엔드',
+    'front-end': '프론트엔드',
+    'machine learning': '머신러닝',
+    'deep learning': '딥러닝',
+    '인공지능': 'AI',
+    '데브옵스': 'DevOps',
+    'github': 'Git',
+    'gitlab': 'Git',
+}
+
+# match_many에서 여러 텍스트를 이어 붙일 때 사이에 넣는 문자 (이 문자가 들어간 이름은 사용하지 않음)
+TEXT_SEPARATOR = '\x00'
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+def _joined_before(text: str, start: int) -> bool:
+    """
+    start 바로 앞 문자가 같은 토큰의 일부인지 (영문/숫자, 또는 영문/숫자 뒤의 '.' 예: 'asp.net'의 'net')
+    """
+    if start <= 0:
+        return False
+    ch = text[start - 1]
+    return _is_word_char(ch) or (ch == '.' and start >= 2 and _is_word_char(text[start - 2]))
+
+def _joined_after(text: str, end: int) -> bool:
+    """
+    end 위치의 문자가 같은 토큰의 일부인지 (영문/숫자, '+', '#', 또는 영문/숫자가 뒤따르는 '.' 예: 'c++', 'c#', 'node.js')
+    """
+    if end >= len(text):
+        return False
+    ch = text[end]
+    return _is_word_char(ch) or ch in '+#' or (ch == '.' and end + 1 < len(text) and _is_word_char(text[end + 1]))
+
+class AhoCorasick:
+    """
+    여러 패턴을 한 번의 선형 탐색으로 찾는 Aho-Corasick 오토마톤
+    """
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = [pattern for pattern in patterns if pattern]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                child = self._goto[node].get(ch)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][ch] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = child
+            self._out[node].append(index)
+
+        # 너비 우선으로 실패 링크 계산 (루트의 자식은 루트로)
+        pending = deque(self._goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for ch, child in self._goto[node].items():
+                pending.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        (일치가 끝나는 위치(미포함), 패턴 번호)를 위치 순서대로 반환
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for index in out[node]:
+                yield i + 1, index
+
+class TechStackMatcher:
+    """
+    기술 스택 이름/별칭 사전으로 텍스트에서 기술 스택 id를 추출.
+    - 대소문자 구분 없이 부분 문자열로 찾되, 영문/숫자로 시작(끝)나는 이름은 앞(뒤)에 같은 토큰의 문자가 붙어 있으면 제외
+      (예: 'Java'는 'JavaScript'에서, 'Git'은 'Digital'에서, 'C'는 'C++'/'C#'에서, 'Node'는 'Node.js'에서 찾지 않음)
+    - 사전 크기와 관계없이 텍스트 길이에 비례하는 시간에 처리
+    """
+    def __init__(self, stack_ids: Dict[str, int], aliases: Optional[Dict[str, str]] = None, version: int = 0):
+        terms = {name.lower(): stack_id for name, stack_id in stack_ids.items() if name and TEXT_SEPARATOR not in name}
+        for alias, name in (TECH_STACK_ALIASES if aliases is None else aliases).items():
+            stack_id = terms.get(name.lower())
+            if stack_id is not None:
+                terms.setdefault(alias.lower(), stack_id)
+        self._terms = list(terms.items())
+        self._automaton = AhoCorasick(term for term, _ in self._terms)
+        self.version = version
+
+    def _iter_found(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        소문자로 바꾼 텍스트에서 경계 조건을 만족하는 (시작 위치, 기술 스택 id)를 끝 위치 순서대로 반환
+        """
+        for end, index in self._automaton.iter_matches(text):
+            term, stack_id = self._terms[index]
+            start = end - len(term)
+            if _is_word_char(term[0]) and _joined_before(text, start):
+                continue
+            if _is_word_char(term[-1]) and _joined_after(text, end):
+                continue
+            yield start, stack_id
+
+    def match(self, text: Optional[str]) -> List[int]:
+        """
+        텍스트에 나오는 기술 스택 id 목록 (처음 나온 순서, 중복 제거)
+
+        >>> matcher = TechStackMatcher({'C': 3, 'C++': 4, 'C#': 5, 'Node': 6, 'Java': 7}, aliases={})
+        >>> matcher.match("C++ 개발")
+        [4]
+        >>> matcher.match("C 언어, C#")
+        [3, 5]
+        >>> matcher.match("Node.js, JavaScript")
+        []
+        >>> matcher.match("java/c.")
+        [7, 3]
+        """
+        if not text:
+            return []
+        found = {}
+        for _, stack_id in self._iter_found(text.lower()):
+            found.setdefault(stack_id, None)
+        return list(found)
+
+    def match_many(self, texts: Iterable[Optional[str]]) -> List[List[int]]:
+        """
+        여러 텍스트를 구분 문자로 이어 붙여 오토마톤으로 한 번에 탐색하고, 일치 위치로 텍스트를 찾아 나눈다.
+        구분 문자는 토큰의 일부가 아니므로 텍스트 경계에서의 판단은 match와 같다.
+
+        >>> TechStackMatcher({'C': 3, 'C++': 4, 'Go': 8}, aliases={}).match_many(["C++", None, "go c", "c"])
+        [[4], [], [8, 3], [3]]
+        """
+        texts = [text.lower() if text else '' for text in texts]
+        found = [{} for _ in texts]
+        ends = []
+        position = 0
+        for text in texts:
+            position += len(text)
+            ends.append(position)
+            position += len(TEXT_SEPARATOR)
+        row = 0
+        for start, stack_id in self._iter_found(TEXT_SEPARATOR.join(texts)):
+            # 일치는 끝 위치 순서로 나오고 구분 문자를 넘지 않으므로 시작 위치로 텍스트를 앞에서부터 찾음
+            while start >= ends[row]:
+                row += 1
+            found[row].setdefault(stack_id, None)
+        return [list(row_found) for row_found in found]
+
+    def stats(self) -> dict:
+        return {"terms": len(self._terms), "states": len(self._automaton._goto), "version": self.version}
+
+class TechStackMatcherCache:
+    """
+    사전 테이블 캐시(lookups)의 tech_stacks가 바뀔 때만 매처를 다시 만든다 (프로세스 단위, 스레드 안전)
+    """
+    def __init__(self):
+        self._matcher: Optional[TechStackMatcher] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> TechStackMatcher:
+        matcher = self._matcher
+        if matcher is not None and matcher.version == lookups.versions["tech_stacks"]:
+            return matcher
+        with self._lock:
+            version, stack_ids = lookups.snapshot("tech_stacks")
+            if self._matcher is None or self._matcher.version != version:
+                self._matcher = TechStackMatcher(stack_ids, version=version)
+            return self._matcher
+
+# 프로세스 단위 기술 스택 매처
+tech_matchers = TechStackMatcherCache()
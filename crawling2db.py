@@ -1,16 +1,24 @@
 import argparse
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import mysql.connector
 from mysql.connector import Error
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from functools import wraps
+from concurrent.futures import Executor
 import time
 import sys
+import threading
 from dotenv import load_dotenv
 import os
+from lookups import lookups, location_key
+from crawler.fetcher import Fetcher, HttpCache
+from crawler.parser import LISTING_COLUMNS, BACKENDS, resolve_backend
+from crawler.pipeline import iter_pages, run_pipeline, batched, make_parse_pool, CsvSink
+from crawler.state import CrawlState
+from crawler.scheduler import CrawlScheduler
+from crawler.tech_matcher import tech_matchers
 
 # Load environment variables
 load_dotenv()
@@ -21,17 +29,32 @@ DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 DB_PORT = int(os.getenv("DB_PORT", "3306"))  # 기본값 3306
 
+# 크롤링 대상 주소 (로컬 테스트 서버로 바꿔 실행 가능)
+SARAMIN_BASE_URL = os.getenv("SARAMIN_BASE_URL", "https://www.saramin.co.kr")
+
+# DB 적재 시 한 트랜잭션(다중 행 INSERT)으로 처리하는 공고 수
+BULK_CHUNK_SIZE = int(os.getenv("CRAWLER_BULK_CHUNK_SIZE", "500"))
+
+# 크롤링 상태 파일 (이미 적재한 공고, 키워드별 마지막 크롤링 시각)
+CRAWL_STATE_PATH = os.getenv("CRAWL_STATE_PATH", "crawl_state.sqlite3")
+CRAWL_STATE_RETENTION_DAYS = float(os.getenv("CRAWL_STATE_RETENTION_DAYS", "90"))  # 이보다 오래된 공고 기록은 삭제
+
+# 검색 결과 페이지의 ETag/Last-Modified 캐시 디렉토리 (변경 없는 페이지는 304 응답으로 파싱 생략)
+HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", "http_cache")
+
 # ======================================
 # Logging Configuration
 # ======================================
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('db_loader.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+def configure_logging():
+    """Send log records to db_loader.log and stdout (only when run as a script, not on import)."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('db_loader.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
 
 # ======================================
 # Utility Decorators
@@ -58,6 +81,17 @@ def retry_on_error(max_retries: int = 3, delay: int = 1):
         return wrapper
     return decorator
 
+def split_location(location: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Split a location like '서울 강남구' into (city, district)."""
+    if pd.isna(location):
+        return None
+    parts = location.split(' ', 1)
+    return parts[0], parts[1] if len(parts) > 1 else None
+
+def posting_text(row) -> str:
+    """Title and sector text of a crawled row, used for tech stack extraction."""
+    return '\n'.join(str(row[column]) for column in ('제목', '직무분야') if not pd.isna(row[column]))
+
 # ======================================
 # Database Handling Class
 # ======================================
@@ -65,9 +99,10 @@ class JobDatabase:
     """
     A class for handling database operations related to job postings, companies, locations, tech stacks, and categories.
     """
-    def __init__(self):
+    def __init__(self, conn=None):
+        """Connect to the configured MySQL database, or use the given DB-API connection (e.g. a benchmark stand-in)."""
         try:
-            self.conn = mysql.connector.connect(
+            self.conn = conn if conn is not None else mysql.connector.connect(
                 host=DB_HOST,
                 port=DB_PORT,
                 user=DB_USER,
@@ -75,32 +110,17 @@ class JobDatabase:
                 database=DB_NAME
             )
             self.cursor = self.conn.cursor(dictionary=True)
-            self._init_tech_stacks()
-            self._init_job_categories()
-            self.tech_stack_cache = self._load_tech_stacks()
-            self.category_cache = self._load_job_categories()
+            self._company_ids: Dict[str, int] = {}
+            if not lookups.ready:
+                # Seed rows and the shared name -> id cache (which also picks up stacks/categories
+                # added through the API) are loaded once per process, not once per connection
+                self._init_tech_stacks()
+                self._init_job_categories()
+                lookups.load_sync(self.conn)
         except Error as e:
             logging.error(f"Error connecting to database: {e}")
             raise
 
-    def _load_tech_stacks(self) -> Dict[str, int]:
-        """Load tech stacks from database into cache"""
-        try:
-            self.cursor.execute("SELECT stack_id, name FROM tech_stacks")
-            return {row['name'].lower(): row['stack_id'] for row in self.cursor.fetchall()}
-        except Error as e:
-            logging.error(f"Error loading tech stacks: {e}")
-            return {}
-
-    def _load_job_categories(self) -> Dict[str, int]:
-        """Load job categories from database into cache"""
-        try:
-            self.cursor.execute("SELECT category_id, name FROM job_categories")
-            return {row['name']: row['category_id'] for row in self.cursor.fetchall()}
-        except Error as e:
-            logging.error(f"Error loading job categories: {e}")
-            return {}
-
     def _init_tech_stacks(self):
         """Initialize tech_stacks table with common technologies"""
         tech_stacks = [
@@ -177,55 +197,32 @@ class JobDatabase:
     def insert_location(self, location: str) -> Optional[int]:
         """Insert a location if it doesn't exist and return its ID."""
         try:
-            if pd.isna(location):
+            parsed = split_location(location)
+            if parsed is None:
                 return None
-            parts = location.split(' ', 1)
-            city = parts[0]
-            district = parts[1] if len(parts) > 1 else None
-            self.cursor.execute(
-                """
-                SELECT location_id FROM locations 
-                WHERE city = %s AND (district = %s OR (district IS NULL AND %s IS NULL))
-                """, 
-                (city, district, district)
-            )
-            result = self.cursor.fetchone()
-            if result:
-                return result['location_id']
-            self.cursor.execute(
-                "INSERT INTO locations (city, district) VALUES (%s, %s)",
-                (city, district)
-            )
-            self.conn.commit()
-            return self.cursor.lastrowid
+            location_ids = lookups.resolve_locations_sync(self.conn, [parsed])
+            return location_ids[location_key(*parsed)]
         except Error as e:
             logging.error(f"Error inserting location: {e}")
             self.conn.rollback()
             raise
 
-    @retry_on_error()
-    def get_tech_stacks(self, tech_text: str) -> List[int]:
-        """Extract and return tech stack IDs from a text description."""
-        if pd.isna(tech_text):
-            return []
-        tech_text = tech_text.split('외')[0]
-        techs = [t.strip() for t in tech_text.split(',')]
-        tech_ids = []
-        for tech in techs:
-            tech_lower = tech.lower()
-            if tech_lower in self.tech_stack_cache:
-                tech_ids.append(self.tech_stack_cache[tech_lower])
-        return tech_ids
+    @staticmethod
+    def get_tech_stacks(rows: List) -> List[List[int]]:
+        """Extract tech stack IDs (names and aliases) from the title and sector text of each row."""
+        return tech_matchers.get().match_many(posting_text(row) for row in rows)
 
+    @staticmethod
     @retry_on_error()
-    def get_categories(self, experience: str) -> List[int]:
+    def get_categories(experience: str) -> List[int]:
         """Get category IDs based on the experience level."""
         if pd.isna(experience):
             return []
         experience = experience.strip()
         category_ids = []
-        if experience in self.category_cache:
-            category_ids.append(self.category_cache[experience])
+        category_id = lookups.get("job_categories", experience)
+        if category_id is not None:
+            category_ids.append(category_id)
         return category_ids
 
     @retry_on_error()
@@ -283,6 +280,176 @@ class JobDatabase:
             self.conn.rollback()
             raise
 
+    @staticmethod
+    def _job_data(row, company_id: Optional[int], location_id: Optional[int], tech_stack_ids: List[int]) -> Dict:
+        """Map a crawled row (CSV row or parsed listing dict) to job posting fields."""
+        return {
+            'company_id': company_id,
+            'title': row['제목'],
+            'job_description': row['링크'],
+            'experience_level': None if pd.isna(row['경력']) else row['경력'],
+            'education_level': None if pd.isna(row['학력']) else row['학력'],
+            'employment_type': None if pd.isna(row['고용형태']) else row['고용형태'],
+            'salary_info': None if pd.isna(row['연봉정보']) else row['연봉정보'],
+            'location_id': location_id,
+            'deadline_date': None if pd.isna(row['마감일']) else row['마감일'],
+            'tech_stacks': tech_stack_ids,
+            'categories': JobDatabase.get_categories(row['경력'])
+        }
+
+    def process_row(self, row) -> Optional[int]:
+        """Insert one crawled posting and return its posting ID, or None if it already exists."""
+        company_id = self.insert_company(row['회사명'])
+        location_id = self.insert_location(row['지역'])
+        tech_stack_ids = self.get_tech_stacks([row])[0]
+        return self.insert_job_posting(self._job_data(row, company_id, location_id, tech_stack_ids))
+
+    def existing_posting_keys(self, keys) -> set:
+        """Return which of the given (company_id, title) keys already exist, selecting only those candidates."""
+        keys = set(keys)
+        if not keys:
+            return set()
+        company_ids = list({company_id for company_id, _ in keys})
+        titles = list({title for _, title in keys})
+        self.cursor.execute(
+            f"SELECT company_id, title FROM job_postings "
+            f"WHERE company_id IN ({','.join(['%s'] * len(company_ids))}) AND title IN ({','.join(['%s'] * len(titles))})",
+            company_ids + titles
+        )
+        return keys & {(row['company_id'], row['title']) for row in self.cursor.fetchall()}
+
+    def resolve_companies(self, names: List[str]) -> Dict[str, int]:
+        """Return company IDs for the given names, inserting missing companies with one multi-row INSERT."""
+        missing = [name for name in dict.fromkeys(names) if name.lower() not in self._company_ids]
+        if missing:
+            placeholders = ','.join(['%s'] * len(missing))
+            query = f"SELECT company_id, name FROM companies WHERE name IN ({placeholders})"
+            self.cursor.execute(query, missing)
+            found = {row['name'].lower() for row in self.cursor.fetchall()}
+            new_names = [name for name in missing if name.lower() not in found]
+            if new_names:
+                self.cursor.execute(
+                    f"INSERT INTO companies (name) VALUES {','.join(['(%s)'] * len(new_names))}",
+                    new_names
+                )
+                # Commit right away so cached IDs stay valid even if the posting insert is rolled back
+                self.conn.commit()
+            self.cursor.execute(query, missing)
+            for row in self.cursor.fetchall():
+                self._company_ids.setdefault(row['name'].lower(), row['company_id'])
+        return {name: self._company_ids[name.lower()] for name in names}
+
+    def _insert_postings(self, postings: List[Dict]) -> List[int]:
+        """
+        Insert postings with one multi-row INSERT and their tech stack/category links with executemany.
+        AUTO_INCREMENT values of a multi-row INSERT are not consecutive under innodb_autoinc_lock_mode=2
+        (the MySQL 8 default), so the new IDs are selected back by (company_id, title), which is unique
+        within a chunk, from lastrowid (the first new ID) onwards.
+        """
+        values = ', '.join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s, 'active')"] * len(postings))
+        params = []
+        for job_data in postings:
+            params.extend((
+                job_data['company_id'], job_data['title'], job_data['job_description'],
+                job_data['experience_level'], job_data['education_level'],
+                job_data['employment_type'], job_data['salary_info'],
+                job_data['location_id'], job_data['deadline_date']
+            ))
+        self.cursor.execute(
+            f"""
+                INSERT INTO job_postings (
+                    company_id, title, job_description, experience_level,
+                    education_level, employment_type, salary_info,
+                    location_id, deadline_date, status
+                ) VALUES {values}
+            """,
+            params
+        )
+        company_ids = list({job_data['company_id'] for job_data in postings})
+        self.cursor.execute(
+            f"""
+                SELECT posting_id, company_id, title FROM job_postings
+                WHERE posting_id >= %s AND company_id IN ({','.join(['%s'] * len(company_ids))})
+                ORDER BY posting_id
+            """,
+            [self.cursor.lastrowid, *company_ids]
+        )
+        new_ids = {}
+        for row in self.cursor.fetchall():
+            new_ids.setdefault((row['company_id'], row['title']), row['posting_id'])
+        posting_ids = [new_ids[(job_data['company_id'], job_data['title'])] for job_data in postings]
+
+        stack_rows = [(posting_id, stack_id) for posting_id, job_data in zip(posting_ids, postings) for stack_id in set(job_data['tech_stacks'])]
+        category_rows = [(posting_id, category_id) for posting_id, job_data in zip(posting_ids, postings) for category_id in set(job_data['categories'])]
+        if stack_rows:
+            self.cursor.executemany("INSERT INTO posting_tech_stacks (posting_id, stack_id) VALUES (%s, %s)", stack_rows)
+        if category_rows:
+            self.cursor.executemany("INSERT INTO posting_categories (posting_id, category_id) VALUES (%s, %s)", category_rows)
+        return posting_ids
+
+    def _insert_chunk(self, rows: list) -> Tuple[int, int]:
+        """Resolve, deduplicate and insert one chunk of rows in a single transaction."""
+        valid = [row for row in rows if not pd.isna(row['회사명']) and not pd.isna(row['제목'])]
+        skipped = len(rows) - len(valid)
+        if skipped:
+            logging.warning(f"Skipped {skipped} job postings without company name or title")
+
+        company_ids = self.resolve_companies([row['회사명'] for row in valid])
+        locations = [split_location(row['지역']) for row in valid]
+        location_ids = lookups.resolve_locations_sync(self.conn, [location for location in locations if location])
+
+        existing = self.existing_posting_keys((company_ids[row['회사명']], row['제목']) for row in valid)
+        postings, keys = [], set()
+        for row, location, tech_stack_ids in zip(valid, locations, self.get_tech_stacks(valid)):
+            key = (company_ids[row['회사명']], row['제목'])
+            if key in existing or key in keys:
+                skipped += 1
+                continue
+            keys.add(key)
+            location_id = location_ids[location_key(*location)] if location else None
+            postings.append(self._job_data(row, key[0], location_id, tech_stack_ids))
+
+        if postings:
+            self._insert_postings(postings)
+        self.conn.commit()
+        return len(postings), skipped
+
+    def insert_rows(self, rows) -> Tuple[int, int, List[int]]:
+        """
+        Bulk-insert crawled postings, committing once per BULK_CHUNK_SIZE rows.
+        A chunk that fails is rolled back and retried row by row so one bad row does not drop the rest.
+        Returns (inserted, skipped, failed), where failed holds the positions of rows that could not be written.
+        """
+        successful_inserts = 0
+        skipped_records = 0
+        failed_rows = []
+        offset = 0
+        for chunk in batched(rows, BULK_CHUNK_SIZE):
+            start, offset = offset, offset + len(chunk)
+            try:
+                inserted, skipped = self._insert_chunk(chunk)
+                successful_inserts += inserted
+                skipped_records += skipped
+                logging.info(f"Inserted {inserted} job postings, skipped {skipped}")
+                continue
+            except Error as e:
+                logging.error(f"Bulk insert failed, retrying {len(chunk)} rows one by one: {str(e)}")
+                self.conn.rollback()
+
+            for position, row in enumerate(chunk, start):
+                try:
+                    posting_id = self.process_row(row)
+                    if posting_id:
+                        successful_inserts += 1
+                        logging.info(f"Successfully inserted job posting: {row['제목']}")
+                    else:
+                        skipped_records += 1
+                        logging.info(f"Skipped duplicate job posting: {row['제목']}")
+                except Exception as e:
+                    logging.error(f"Error processing row: {row.get('제목', 'Unknown Title')}, Error: {str(e)}")
+                    failed_rows.append(position)
+        return successful_inserts, skipped_records, failed_rows
+
     def close(self):
         """Close database connections."""
         if self.cursor:
@@ -290,6 +457,28 @@ class JobDatabase:
         if self.conn:
             self.conn.close()
 
+class SharedJobDatabase:
+    """
+    A JobDatabase shared by keyword crawls running at the same time.
+    Connects on the first insert and serializes inserts, so every crawl sees the same
+    posting key set and company ID cache and a posting found by two keywords is inserted once.
+    """
+    def __init__(self):
+        self._db: Optional[JobDatabase] = None
+        self._lock = threading.Lock()
+
+    def insert_rows(self, rows) -> Tuple[int, int, List[int]]:
+        with self._lock:
+            if self._db is None:
+                self._db = JobDatabase()
+            return self._db.insert_rows(rows)
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
 # ======================================
 # CSV Processing Function
 # ======================================
@@ -300,44 +489,11 @@ def process_csv_file(filename: str):
     db = JobDatabase()
     try:
         df = pd.read_csv(filename)
-        successful_inserts = 0
-        skipped_records = 0
-        
-        for _, row in df.iterrows():
-            try:
-                company_id = db.insert_company(row['회사명'])
-                location_id = db.insert_location(row['지역'])
-                tech_stack_ids = db.get_tech_stacks(row['직무분야'])
-                category_ids = db.get_categories(row['경력'])
-                
-                job_data = {
-                    'company_id': company_id,
-                    'title': row['제목'],
-                    'job_description': row['링크'],
-                    'experience_level': None if pd.isna(row['경력']) else row['경력'],
-                    'education_level': None if pd.isna(row['학력']) else row['학력'],
-                    'employment_type': None if pd.isna(row['고용형태']) else row['고용형태'],
-                    'salary_info': None if pd.isna(row['연봉정보']) else row['연봉정보'],
-                    'location_id': location_id,
-                    'deadline_date': None if pd.isna(row['마감일']) else row['마감일'],
-                    'tech_stacks': tech_stack_ids,
-                    'categories': category_ids
-                }
-                
-                posting_id = db.insert_job_posting(job_data)
-                
-                if posting_id:
-                    successful_inserts += 1
-                    logging.info(f"Successfully inserted job posting: {row['제목']}")
-                else:
-                    skipped_records += 1
-                    logging.info(f"Skipped duplicate job posting: {row['제목']}")
-                
-            except Exception as e:
-                logging.error(f"Error processing row: {row.get('제목', 'Unknown Title')}, Error: {str(e)}")
-                continue
-        
-        logging.info(f"Processing completed. Successfully inserted: {successful_inserts}, Skipped: {skipped_records}")
+        successful_inserts, skipped_records, failed_rows = db.insert_rows(row for _, row in df.iterrows())
+        logging.info(
+            f"Processing completed. Successfully inserted: {successful_inserts}, Skipped: {skipped_records}, "
+            f"Failed: {len(failed_rows)}"
+        )
         
     except Exception as e:
         logging.error(f"Error processing CSV file: {str(e)}")
@@ -348,86 +504,116 @@ def process_csv_file(filename: str):
 # ======================================
 # Crawling Function
 # ======================================
-def crawl_saramin(keyword: str, pages: int = 1) -> pd.DataFrame:
+def crawl_saramin_concurrent(
+    keywords: List[str],
+    pages: int = 1,
+    fetcher: Optional[Fetcher] = None,
+    max_workers: int = 4,
+    parser_backend: str = 'html.parser',
+    parse_executor: Optional[Executor] = None,
+    base_url: str = SARAMIN_BASE_URL
+) -> Dict[str, pd.DataFrame]:
     """
-    사람인 채용공고를 크롤링하는 함수
-    
+    여러 키워드의 검색 결과 페이지를 스레드 풀에서 동시에 크롤링하는 함수.
+    요청 속도는 fetcher의 호스트별 토큰 버킷으로 제한된다.
+
     Args:
-        keyword (str): 검색할 키워드
-        pages (int): 크롤링할 페이지 수
-    
+        keywords (List[str]): 검색할 키워드 목록
+        pages (int): 키워드별 크롤링할 페이지 수
+        fetcher (Fetcher): 요청기 (기본값: 초당 1회 요청)
+        max_workers (int): 동시에 요청하는 최대 페이지 수
+        parser_backend (str): 파서 백엔드 (selectolax, lxml, html.parser, auto)
+        parse_executor (Executor): 파싱을 실행할 프로세스 풀 (없으면 요청 스레드에서 파싱)
+        base_url (str): 크롤링 대상 주소
+
     Returns:
-        DataFrame: 채용공고 정보가 담긴 데이터프레임
+        Dict[str, DataFrame]: 키워드별 채용공고 데이터프레임 (페이지 순서 유지)
     """
-    jobs = []
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    fetcher = fetcher or Fetcher()
+    results = {
+        (keyword, page): jobs
+        for keyword, page, jobs in iter_pages(
+            fetcher, keywords, pages, base_url, max_workers=max_workers,
+            parser_backend=parser_backend, parse_executor=parse_executor
+        )
+    }
+    return {
+        keyword: pd.DataFrame(
+            [job for page in range(1, pages + 1) for job in results[(keyword, page)]],
+            columns=LISTING_COLUMNS
+        )
+        for keyword in keywords
     }
 
-    for page in range(1, pages + 1):
-        url = f"https://www.saramin.co.kr/zf_user/search/recruit?searchType=search&searchword={keyword}&recruitPage={page}"
+def crawl_to_db(
+    keywords: List[str],
+    pages: int = 1,
+    fetcher: Optional[Fetcher] = None,
+    max_workers: int = 4,
+    batch_size: int = 200,
+    csv_dir: Optional[str] = None,
+    state: Optional[CrawlState] = None,
+    parser_backend: str = 'html.parser',
+    parse_executor: Optional[Executor] = None,
+    base_url: str = SARAMIN_BASE_URL,
+    db: Optional[SharedJobDatabase] = None
+) -> Dict[str, int]:
+    """
+    크롤링한 공고를 CSV를 거치지 않고 바로 DB에 적재하는 함수.
+    요청/파싱은 스레드에서, 적재는 호출한 스레드에서 batch_size개씩 처리한다.
 
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+    Args:
+        keywords (List[str]): 검색할 키워드 목록
+        pages (int): 키워드별 크롤링할 페이지 수
+        fetcher (Fetcher): 요청기 (기본값: 초당 1회 요청)
+        max_workers (int): 동시에 요청하는 최대 페이지 수
+        batch_size (int): 한 번에 적재하는 공고 수
+        csv_dir (str): 지정하면 키워드별 CSV 파일도 함께 기록
+        state (CrawlState): 지정하면 이미 적재한 공고를 건너뛰고, 새 공고가 없는 페이지에서 크롤링 중단
+        parser_backend (str): 파서 백엔드 (selectolax, lxml, html.parser, auto)
+        parse_executor (Executor): 파싱을 실행할 프로세스 풀 (없으면 요청 스레드에서 파싱)
+        base_url (str): 크롤링 대상 주소
+        db (SharedJobDatabase): 여러 키워드를 동시에 크롤링할 때 함께 쓰는 적재기 (없으면 이 호출에서만 사용)
 
-            job_listings = soup.select('.item_recruit')
+    Returns:
+        Dict[str, int]: pages, seen, jobs, inserted, skipped, failed 건수
+    """
+    fetcher = fetcher or Fetcher()
+    csv_sink = CsvSink(csv_dir) if csv_dir is not None else None
+    # 새 공고가 없으면 DB에 연결하지 않음 (첫 적재 시 연결)
+    owns_db = db is None
+    db = db or SharedJobDatabase()
 
-            for job in job_listings:
-                try:
-                    # 회사명
-                    company = job.select_one('.corp_name a').text.strip()
-
-                    # 채용 제목
-                    title = job.select_one('.job_tit a').text.strip()
-
-                    # 채용 링크
-                    link = 'https://www.saramin.co.kr' + job.select_one('.job_tit a')['href']
-
-                    # 지역, 경력, 학력, 고용형태
-                    conditions = job.select('.job_condition span')
-                    location = conditions[0].text.strip() if len(conditions) > 0 else ''
-                    experience = conditions[1].text.strip() if len(conditions) > 1 else ''
-                    education = conditions[2].text.strip() if len(conditions) > 2 else ''
-                    employment_type = conditions[3].text.strip() if len(conditions) > 3 else ''
-
-                    # 마감일
-                    deadline = job.select_one('.job_date .date').text.strip()
-
-                    # 직무 분야
-                    job_sector = job.select_one('.job_sector')
-                    sector = job_sector.text.strip() if job_sector else ''
-
-                    # 평균연봉 정보 (있는 경우)
-                    salary_badge = job.select_one('.area_badge .badge')
-                    salary = salary_badge.text.strip() if salary_badge else ''
-
-                    jobs.append({
-                        '회사명': company,
-                        '제목': title,
-                        '링크': link,
-                        '지역': location,
-                        '경력': experience,
-                        '학력': education,
-                        '고용형태': employment_type,
-                        '마감일': deadline,
-                        '직무분야': sector,
-                        '연봉정보': salary
-                    })
-
-                except AttributeError as e:
-                    logging.error(f"항목 파싱 중 에러 발생: {e}")
-                    continue
-
-            logging.info(f"{page}페이지 크롤링 완료")
-            time.sleep(1)  # 서버 부하 방지를 위한 딜레이
-
-        except requests.RequestException as e:
-            logging.error(f"페이지 요청 중 에러 발생: {e}")
-            continue
-
-    return pd.DataFrame(jobs)
+    try:
+        counts = run_pipeline(
+            keywords, pages, db.insert_rows, fetcher, base_url,
+            max_workers=max_workers, batch_size=batch_size, csv_sink=csv_sink, state=state,
+            parser_backend=parser_backend, parse_executor=parse_executor
+        )
+        logging.info(
+            f"Processing completed. Pages: {counts['pages']}, Already seen: {counts['seen']}, "
+            f"Successfully inserted: {counts['inserted']}, Skipped: {counts['skipped']}, Failed: {counts['failed']}"
+        )
+        return counts
+    finally:
+        if owns_db:
+            db.close()
+        if csv_sink is not None:
+            csv_sink.close()
+
+def crawl_saramin(keyword: str, pages: int = 1, fetcher: Optional[Fetcher] = None) -> pd.DataFrame:
+    """
+    사람인 채용공고를 크롤링하는 함수 (한 번에 한 페이지씩 요청)
+    
+    Args:
+        keyword (str): 검색할 키워드
+        pages (int): 크롤링할 페이지 수
+        fetcher (Fetcher): 요청기 (기본값: 초당 1회 요청)
+    
+    Returns:
+        DataFrame: 채용공고 정보가 담긴 데이터프레임
+    """
+    return crawl_saramin_concurrent([keyword], pages, fetcher=fetcher, max_workers=1)[keyword]
 
 # ======================================
 # Main Execution with argparse
@@ -436,17 +622,54 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Crawl Saramin and load job postings into a database.")
     parser.add_argument('--keywords', nargs='+', required=True, help='List of keywords to search for.')
     parser.add_argument('--pages', type=int, default=1, help='Number of pages to crawl for each keyword.')
+    parser.add_argument('--concurrency', type=int, default=4, help='Maximum number of pages fetched at the same time.')
+    parser.add_argument('--rate', type=float, default=1.0, help='Maximum requests per second per host (0 = unlimited).')
+    parser.add_argument('--burst', type=int, default=1, help='Maximum burst of requests per host.')
+    parser.add_argument('--retries', type=int, default=3, help='Retries on 429/5xx responses and connection errors.')
+    parser.add_argument('--max-retry-delay', type=float, default=60.0, help='Maximum seconds to wait before a retry, even if Retry-After asks for longer.')
+    parser.add_argument('--connect-timeout', type=float, default=5.0, help='Seconds to wait for a connection.')
+    parser.add_argument('--read-timeout', type=float, default=10.0, help='Seconds to wait for a response.')
+    parser.add_argument('--http-cache-dir', default=HTTP_CACHE_DIR, help='Directory for ETag/Last-Modified validators of listing pages.')
+    parser.add_argument('--batch-size', type=int, default=200, help='Number of postings written to the database per batch.')
+    parser.add_argument('--csv-dir', default=None, help='Also write saramin_<keyword>.csv files to this directory.')
+    parser.add_argument('--state-file', default=CRAWL_STATE_PATH, help='SQLite file holding already loaded postings and the crawl schedule.')
+    parser.add_argument('--full', action='store_true', help='Ignore the crawl state and HTTP cache and crawl every page.')
+    parser.add_argument('--parser', default='auto', choices=['auto', *BACKENDS], help='HTML parser backend (auto = fastest installed).')
+    parser.add_argument('--parse-workers', type=int, default=0, help='Processes used for parsing (0 = parse on the fetch threads).')
+    parser.add_argument('--keyword-workers', type=int, default=2, help='Maximum number of keywords crawled at the same time.')
+    parser.add_argument('--min-interval', type=float, default=900, help='Minimum seconds between crawls of a keyword.')
+    parser.add_argument('--max-interval', type=float, default=86400, help='Maximum seconds between crawls of a keyword.')
+    parser.add_argument('--target-new', type=int, default=20, help='New postings per crawl the schedule aims for.')
     args = parser.parse_args()
-
-    while True:
-        for keyword in args.keywords:
-            try:
-                df = crawl_saramin(keyword, pages=args.pages)
-                csv_filename = f"saramin_{keyword}.csv"
-                df.to_csv(csv_filename, index=False)
-                process_csv_file(csv_filename)
-            except Exception as e:
-                logging.error(f"Error processing keyword '{keyword}': {str(e)}")
-        
-        logging.info("All keywords processed. Sleeping for 1 hour before next iteration...")
-        time.sleep(3600)
+    configure_logging()
+
+    fetcher = Fetcher(
+        rate=args.rate, burst=args.burst, max_retries=args.retries, max_retry_delay=args.max_retry_delay,
+        timeout=args.read_timeout, connect_timeout=args.connect_timeout,
+        pool_size=max(args.concurrency * args.keyword_workers, 1),
+        cache=None if args.full else HttpCache(args.http_cache_dir)
+    )
+    crawl_state = CrawlState(args.state_file, retention_days=CRAWL_STATE_RETENTION_DAYS)
+    parser_backend = resolve_backend(args.parser)
+    parse_executor = make_parse_pool(args.parse_workers) if args.parse_workers > 0 else None
+    logging.info(f"Parser backend: {parser_backend}, parse workers: {args.parse_workers}")
+    # 동시에 크롤링하는 키워드들이 같은 공고/회사를 중복 적재하지 않도록 적재기를 공유
+    shared_db = SharedJobDatabase()
+
+    def crawl_keyword(keyword: str) -> int:
+        counts = crawl_to_db(
+            [keyword], pages=args.pages, fetcher=fetcher, max_workers=args.concurrency,
+            batch_size=args.batch_size, csv_dir=args.csv_dir, state=None if args.full else crawl_state,
+            parser_backend=parser_backend, parse_executor=parse_executor, db=shared_db
+        )
+        return counts['inserted']
+
+    scheduler = CrawlScheduler(
+        args.keywords, crawl_keyword, crawl_state,
+        min_interval=args.min_interval, max_interval=args.max_interval,
+        target_new=args.target_new, max_workers=args.keyword_workers
+    )
+    try:
+        scheduler.run()
+    finally:
+        shared_db.close()
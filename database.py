@@ -1,22 +1,275 @@
+import asyncio
+import bisect
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional
+import aiomysql
+from fastapi import HTTPException
 from mysql.connector import pooling
-from config import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DB_PORT
-
-# DB 풀 생성
-db_pool = pooling.MySQLConnectionPool(
-    host=DB_HOST,
-    user=DB_USER,
-    password=DB_PASSWORD,
-    database=DB_NAME,
-    port=DB_PORT
+from config import (
+    DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DB_PORT,
+    DB_POOL_SIZE, DB_POOL_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING
 )
 
+# 동기 DB 풀 (최초 사용 시 생성)
+db_pool: Optional[pooling.MySQLConnectionPool] = None
+
+def get_sync_pool() -> pooling.MySQLConnectionPool:
+    """
+    동기 DB 풀 생성. mysql.connector 풀은 최대 32개까지만 허용한다.
+    """
+    global db_pool
+    if db_pool is None:
+        db_pool = pooling.MySQLConnectionPool(
+            pool_name="job_api",
+            pool_size=min(max(DB_POOL_SIZE, 1), 32),
+            host=DB_HOST,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            database=DB_NAME,
+            port=DB_PORT
+        )
+    return db_pool
+
+class PoolTimeoutError(Exception):
+    """
+    제한 시간 내에 풀에서 커넥션을 얻지 못한 경우 발생하는 예외
+    """
+
+class LatencyHistogram:
+    """
+    커넥션 획득 대기 시간 히스토그램 (단위: ms)
+    """
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float):
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.sum_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{bound}" for bound in self.BUCKETS_MS] + ["le_inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "avg_ms": round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3)
+        }
+
+class ConnectionPool:
+    """
+    aiomysql 커넥션을 관리하는 비동기 커넥션 풀.
+    - size: 유휴 상태로 유지하는 커넥션 수
+    - max_overflow: 부하 시 size를 초과해 추가로 열 수 있는 커넥션 수 (반환 시 닫힘)
+    - timeout: 모든 커넥션이 사용 중일 때 대기열에서 기다리는 최대 시간(초)
+    - recycle: 커넥션 최대 수명(초). 초과한 커넥션은 재사용하지 않고 새로 연결
+    - pre_ping: 유휴 커넥션을 내주기 전에 ping으로 생존 여부 확인
+    """
+    def __init__(self, size: int, max_overflow: int, timeout: float, recycle: int, pre_ping: bool, **connect_kwargs):
+        self.size = max(size, 1)
+        self.max_overflow = max(max_overflow, 0)
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self._connect_kwargs = connect_kwargs
+        self._slots = asyncio.Semaphore(self.size + self.max_overflow)
+        self._idle = deque()
+        self._in_use = set()
+        self._born_at = {}
+        self._waiters = 0
+        self._closed = False
+        self._acquire_latency = LatencyHistogram()
+        self._counters = {"created": 0, "closed": 0, "recycled": 0, "ping_failures": 0, "timeouts": 0}
+
+    async def _connect(self):
+        conn = await aiomysql.connect(**self._connect_kwargs)
+        self._born_at[conn] = time.monotonic()
+        self._counters["created"] += 1
+        return conn
+
+    def _discard(self, conn):
+        self._born_at.pop(conn, None)
+        self._counters["closed"] += 1
+        if not conn.closed:
+            conn.close()
+
+    def _expired(self, conn) -> bool:
+        if self.recycle <= 0:
+            return False
+        return time.monotonic() - self._born_at.get(conn, 0) > self.recycle
+
+    async def _checkout(self):
+        while self._idle:
+            # 최근에 반환된 커넥션부터 사용 (LIFO)
+            conn = self._idle.pop()
+            if conn.closed:
+                self._discard(conn)
+                continue
+            if self._expired(conn):
+                self._counters["recycled"] += 1
+                self._discard(conn)
+                continue
+            if self.pre_ping:
+                try:
+                    await conn.ping(reconnect=False)
+                except Exception:
+                    self._counters["ping_failures"] += 1
+                    self._discard(conn)
+                    continue
+            return conn
+        return await self._connect()
+
+    async def acquire(self):
+        """
+        커넥션 획득. 사용 가능한 커넥션이 없으면 timeout 동안 대기열에서 기다린다.
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        started = time.perf_counter()
+        self._waiters += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self._counters["timeouts"] += 1
+            raise PoolTimeoutError(f"Timed out after {self.timeout}s waiting for a database connection")
+        finally:
+            self._waiters -= 1
+
+        try:
+            conn = await self._checkout()
+        except Exception:
+            self._slots.release()
+            raise
+        self._in_use.add(conn)
+        self._acquire_latency.observe((time.perf_counter() - started) * 1000)
+        return conn
+
+    def release(self, conn):
+        """
+        커넥션 반환. size를 초과한 커넥션, 수명이 다한 커넥션, 끊어진 커넥션은 닫는다.
+        """
+        if conn not in self._in_use:
+            return
+        self._in_use.discard(conn)
+        try:
+            if self._closed or conn.closed or self._expired(conn) or len(self._idle) >= self.size:
+                self._discard(conn)
+            else:
+                self._idle.append(conn)
+        finally:
+            self._slots.release()
+
+    async def close(self):
+        """
+        풀 종료. 유휴 커넥션은 즉시 닫고 사용 중인 커넥션은 반환 시 닫힌다.
+        """
+        self._closed = True
+        while self._idle:
+            conn = self._idle.pop()
+            self._born_at.pop(conn, None)
+            await conn.ensure_closed()
+
+    def stats(self) -> dict:
+        """
+        풀 상태 통계
+        """
+        return {
+            "size": self.size,
+            "max_overflow": self.max_overflow,
+            "timeout": self.timeout,
+            "recycle": self.recycle,
+            "pre_ping": self.pre_ping,
+            "in_use": len(self._in_use),
+            "idle": len(self._idle),
+            "waiters": self._waiters,
+            "open_connections": len(self._born_at),
+            **self._counters,
+            "acquire_latency_ms": self._acquire_latency.snapshot()
+        }
+
+# 비동기 DB 풀 (애플리케이션 시작 시 생성)
+async_db_pool: Optional[ConnectionPool] = None
+
+async def init_async_pool() -> ConnectionPool:
+    """
+    비동기 DB 풀 생성. 이미 생성된 경우 기존 풀을 반환한다.
+    """
+    global async_db_pool
+    if async_db_pool is None:
+        async_db_pool = ConnectionPool(
+            size=DB_POOL_SIZE,
+            max_overflow=DB_POOL_MAX_OVERFLOW,
+            timeout=DB_POOL_TIMEOUT,
+            recycle=DB_POOL_RECYCLE,
+            pre_ping=DB_POOL_PRE_PING,
+            host=DB_HOST,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            db=DB_NAME,
+            port=DB_PORT,
+            charset="utf8mb4",
+            autocommit=False
+        )
+    return async_db_pool
+
+async def close_async_pool():
+    """
+    비동기 DB 풀 종료
+    """
+    global async_db_pool
+    if async_db_pool is not None:
+        await async_db_pool.close()
+        async_db_pool = None
+
 def get_db():
     """
     데이터베이스 커넥션을 제공하는 종속성 함수.
     요청 종료 후 커넥션을 반환한다.
     """
-    conn = db_pool.get_connection()
+    conn = get_sync_pool().get_connection()
     try:
         yield conn
     finally:
         conn.close()
+
+@asynccontextmanager
+async def db_connection():
+    """
+    비동기 풀에서 커넥션을 빌려주는 컨텍스트 매니저.
+    블록 종료 시 열린 트랜잭션을 정리하고 커넥션을 풀에 반환한다.
+    """
+    pool = await init_async_pool()
+    try:
+        conn = await pool.acquire()
+    except PoolTimeoutError:
+        raise HTTPException(
+            status_code=503,
+            detail="Database is busy, please retry.",
+            headers={"Retry-After": "1"}
+        )
+    try:
+        yield conn
+    finally:
+        # 커밋되지 않은 트랜잭션이 남은 커넥션은 다음 요청에서 오래된 스냅샷을 보게 되므로 정리 후 반환
+        try:
+            if not conn.closed:
+                await conn.rollback()
+        finally:
+            pool.release(conn)
+
+async def get_async_db():
+    """
+    비동기 데이터베이스 커넥션을 제공하는 종속성 함수.
+    커서는 `await conn.cursor(aiomysql.DictCursor)`로 생성하면 get_db의
+    dictionary=True 커서와 동일하게 dict 형태의 행을 반환한다.
+    """
+    async with db_connection() as conn:
+        yield conn
@@ -0,0 +1,260 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+from aiomysql import SSCursor
+
+# facet 종류: 기술 스택, 직무 카테고리, 지역, 고용 형태
+FACETS = ("tech_stacks", "job_categories", "location", "employment_type")
+
+FETCH_SIZE = 10000
+
+POSTING_QUERY = """
+SELECT jp.posting_id, jp.status, jp.employment_type, l.city, l.district
+FROM job_postings jp
+LEFT JOIN locations l ON jp.location_id = l.location_id
+WHERE {condition}
+"""
+
+TECH_STACK_QUERY = """
+SELECT pts.posting_id, ts.name
+FROM posting_tech_stacks pts
+JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
+JOIN job_postings jp ON pts.posting_id = jp.posting_id
+WHERE {condition}
+"""
+
+CATEGORY_QUERY = """
+SELECT pc.posting_id, jc.name
+FROM posting_categories pc
+JOIN job_categories jc ON pc.category_id = jc.category_id
+JOIN job_postings jp ON pc.posting_id = jp.posting_id
+WHERE {condition}
+"""
+
+# posting_id 집합은 정렬된 중복 없는 uint32 배열로 저장 (메모리는 공고 수에 비례, posting_id 최댓값과 무관)
+ID_DTYPE = np.uint32
+EMPTY_IDS = np.zeros(0, dtype=ID_DTYPE)
+
+def build_id_set(posting_ids: Iterable[int]) -> np.ndarray:
+    """
+    posting_id 목록으로 정렬된 중복 없는 id 배열 생성
+    """
+    return np.unique(np.fromiter(posting_ids, dtype=ID_DTYPE))
+
+def intersect_ids(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    두 id 배열의 교집합 (정렬 유지)
+    """
+    return np.intersect1d(a, b, assume_unique=True)
+
+def _intersect_count(a: np.ndarray, b: np.ndarray) -> int:
+    """
+    두 id 배열의 교집합 크기. 작은 배열의 id를 큰 배열에서 이진 탐색한다.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if not len(a):
+        return 0
+    positions = np.minimum(np.searchsorted(b, a), len(b) - 1)
+    return int(np.count_nonzero(b[positions] == a))
+
+def _normalize(value: str) -> str:
+    return value.strip().casefold()
+
+class FacetIndex:
+    """
+    활성 채용 공고의 facet 값별 posting_id 인덱스 (값마다 정렬된 posting_id 배열).
+    - 시작 시 DB에서 적재하고 공고 등록/수정/삭제 시 해당 공고가 속한 값의 배열만 갱신
+    - 같은 facet 안의 값은 합집합, facet 간에는 교집합으로 결합
+    - 결과 집합에 대한 facet 값별 건수는 정렬된 배열의 이진 탐색으로 계산
+    """
+    def __init__(self):
+        self.ready = False
+        self._active = EMPTY_IDS
+        self._ids: Dict[str, Dict[object, np.ndarray]] = {facet: {} for facet in FACETS}
+        self._labels: Dict[str, Dict[object, str]] = {facet: {} for facet in FACETS}
+        self._posting_keys: Dict[int, Tuple[Tuple[str, object], ...]] = {}
+        self._pending = set()
+
+    @staticmethod
+    def _facet_keys(row: tuple) -> List[Tuple[str, object, str]]:
+        """
+        공고 행(posting_id, status, employment_type, city, district)의 (facet, key, 표시 이름) 목록
+        """
+        _, _, employment_type, city, district = row
+        keys = []
+        if employment_type:
+            keys.append(("employment_type", _normalize(employment_type), employment_type))
+        if city:
+            label = f"{city} {district or ''}".strip()
+            keys.append(("location", (_normalize(city), _normalize(district or "")), label))
+        return keys
+
+    async def _fetch(self, db, condition: str, params: list) -> Tuple[list, list, list]:
+        """
+        조건에 해당하는 공고의 facet 원본 행 조회 (서버 측 커서로 나누어 읽음)
+        """
+        results = []
+        cursor = await db.cursor(SSCursor)
+        try:
+            for query in (POSTING_QUERY, TECH_STACK_QUERY, CATEGORY_QUERY):
+                rows = []
+                await cursor.execute(query.format(condition=condition), params)
+                while True:
+                    chunk = await cursor.fetchmany(FETCH_SIZE)
+                    if not chunk:
+                        break
+                    rows.extend(chunk)
+                results.append(rows)
+        finally:
+            await cursor.close()
+        return results[0], results[1], results[2]
+
+    def _build(self, postings: list, stacks: list, categories: list):
+        """
+        조회한 행으로 전체 id 배열을 한 번에 생성 (스레드에서 실행)
+        """
+        ids_by_key = {facet: defaultdict(list) for facet in FACETS}
+        labels = {facet: {} for facet in FACETS}
+        posting_keys = defaultdict(list)
+
+        for row in postings:
+            posting_id = row[0]
+            for facet, key, label in self._facet_keys(row):
+                ids_by_key[facet][key].append(posting_id)
+                labels[facet].setdefault(key, label)
+                posting_keys[posting_id].append((facet, key))
+        for facet, rows in (("tech_stacks", stacks), ("job_categories", categories)):
+            for posting_id, name in rows:
+                key = _normalize(name)
+                ids_by_key[facet][key].append(posting_id)
+                labels[facet].setdefault(key, name)
+                posting_keys[posting_id].append((facet, key))
+
+        id_sets = {
+            facet: {key: build_id_set(ids) for key, ids in values.items()}
+            for facet, values in ids_by_key.items()
+        }
+        active = build_id_set(row[0] for row in postings)
+        return active, id_sets, labels, {posting_id: tuple(keys) for posting_id, keys in posting_keys.items()}
+
+    async def load(self, db):
+        """
+        활성 공고 전체로 인덱스 생성. 적재 중에 변경된 공고는 적재 후 다시 반영한다.
+        """
+        postings, stacks, categories = await self._fetch(db, "jp.status = 'active'", [])
+        active, id_sets, labels, posting_keys = await asyncio.to_thread(self._build, postings, stacks, categories)
+        self._active, self._ids, self._labels, self._posting_keys = active, id_sets, labels, posting_keys
+        self.ready = True
+
+        pending, self._pending = list(self._pending), set()
+        if pending:
+            await self.refresh_postings(db, pending)
+
+    async def refresh_postings(self, db, posting_ids: List[int]):
+        """
+        변경된 공고의 facet 값을 DB에서 다시 읽어 id 배열 갱신.
+        값별로 제거/추가할 id를 모아 배열마다 한 번씩만 다시 만든다.
+        """
+        if not posting_ids:
+            return
+        if not self.ready:
+            self._pending.update(posting_ids)
+            return
+
+        placeholders = ','.join(['%s'] * len(posting_ids))
+        postings, stacks, categories = await self._fetch(db, f"jp.posting_id IN ({placeholders})", list(posting_ids))
+
+        # 기존 값에서 제거할 id
+        removals = defaultdict(list)
+        for posting_id in posting_ids:
+            for facet, key in self._posting_keys.pop(posting_id, ()):
+                removals[(facet, key)].append(posting_id)
+
+        # 활성 공고만 다시 등록
+        active_ids = {row[0] for row in postings if row[1] == 'active'}
+        new_keys = defaultdict(list)
+        for row in postings:
+            if row[0] in active_ids:
+                for facet, key, label in self._facet_keys(row):
+                    new_keys[row[0]].append((facet, key, label))
+        for facet, rows in (("tech_stacks", stacks), ("job_categories", categories)):
+            for posting_id, name in rows:
+                if posting_id in active_ids:
+                    new_keys[posting_id].append((facet, _normalize(name), name))
+
+        additions, labels = defaultdict(list), {}
+        for posting_id in active_ids:
+            for facet, key, label in new_keys[posting_id]:
+                additions[(facet, key)].append(posting_id)
+                labels.setdefault((facet, key), label)
+            self._posting_keys[posting_id] = tuple((facet, key) for facet, key, _ in new_keys[posting_id])
+
+        for facet, key in removals.keys() | additions.keys():
+            ids = self._ids[facet].get(key, EMPTY_IDS)
+            if (facet, key) in removals:
+                ids = np.setdiff1d(ids, build_id_set(removals[(facet, key)]), assume_unique=True)
+            if (facet, key) in additions:
+                ids = np.union1d(ids, build_id_set(additions[(facet, key)]))
+            if len(ids):
+                self._ids[facet][key] = ids
+                self._labels[facet].setdefault(key, labels.get((facet, key), str(key)))
+            else:
+                self._ids[facet].pop(key, None)
+                self._labels[facet].pop(key, None)
+        active = np.setdiff1d(self._active, build_id_set(posting_ids), assume_unique=True)
+        self._active = np.union1d(active, build_id_set(active_ids))
+
+    def _resolve_keys(self, facet: str, values: List[str]) -> List[object]:
+        """
+        요청 값에 해당하는 인덱스 키 목록. 지역은 시/구 이름에 대한 부분 일치로 찾는다.
+        """
+        if facet == "location":
+            terms = [_normalize(value) for value in values]
+            return [
+                key for key in self._ids["location"]
+                if any(term in key[0] or term in key[1] for term in terms)
+            ]
+        return [_normalize(value) for value in values]
+
+    def match(self, filters: Dict[str, List[str]]) -> np.ndarray:
+        """
+        facet 필터에 해당하는 활성 공고의 정렬된 posting_id 배열
+        """
+        result = self._active
+        for facet, values in filters.items():
+            matched = [self._ids[facet][key] for key in self._resolve_keys(facet, values) if key in self._ids[facet]]
+            if not matched:
+                return EMPTY_IDS
+            union = matched[0] if len(matched) == 1 else np.unique(np.concatenate(matched))
+            result = intersect_ids(result, union)
+            if not len(result):
+                break
+        return result
+
+    def counts(self, result: np.ndarray, top_n: int = 20) -> Dict[str, List[dict]]:
+        """
+        결과 집합에 대한 facet 값별 공고 수 (facet마다 건수 상위 top_n개)
+        """
+        facets = {}
+        for facet in FACETS:
+            values = []
+            for key, ids in self._ids[facet].items():
+                count = _intersect_count(ids, result)
+                if count:
+                    values.append({"value": self._labels[facet].get(key, str(key)), "count": count})
+            values.sort(key=lambda item: (-item["count"], item["value"]))
+            facets[facet] = values[:top_n]
+        return facets
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "active_postings": len(self._active),
+            "values": {facet: len(self._ids[facet]) for facet in FACETS},
+            "bytes": sum(ids.nbytes for values in self._ids.values() for ids in values.values())
+        }
+
+# 프로세스 단위 facet 인덱스
+facet_index = FacetIndex()
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from typing import List
+from config import (
+    FACET_INDEX_ENABLED, RELATED_INDEX_ENABLED, POSTINGS_SYNC_INTERVAL_SECONDS,
+    JOB_CACHE_TTL_SECONDS, JOB_CACHE_MAX_ENTRIES, JOB_CACHE_MAX_BYTES,
+    JOB_COUNT_CACHE_TTL_SECONDS, JOB_COUNT_CACHE_MAX_ENTRIES
+)
+from cache import TTLCache, SingleFlightCache
+from database import db_connection
+from facet_index import facet_index
+from related_index import related_index
+from lookups import lookups
+
+logger = logging.getLogger("api_logger")
+
+# 주기적 동기화에서 마지막으로 확인한 posting_id
+_last_seen_posting_id = 0
+
+# 채용 공고 목록 응답 캐시 (정규화된 조회 조건 -> 직렬화된 JSON 응답)
+job_list_cache = SingleFlightCache(max_size=JOB_CACHE_MAX_ENTRIES, ttl=JOB_CACHE_TTL_SECONDS, max_bytes=JOB_CACHE_MAX_BYTES)
+
+# 필터 조건별 total_count 캐시 (정렬/페이지와 무관하게 공유)
+job_count_cache = TTLCache(max_size=JOB_COUNT_CACHE_MAX_ENTRIES, ttl=JOB_COUNT_CACHE_TTL_SECONDS)
+
+async def postings_changed(db, posting_ids: List[int]):
+    """
+    채용 공고 등록/수정/삭제 후 호출. 목록/건수 캐시를 비우고 메모리 인덱스에 변경 내용을 반영한다.
+    인덱스 갱신 실패는 요청 실패로 처리하지 않고 로그만 남긴다.
+    """
+    job_list_cache.clear()
+    job_count_cache.clear()
+    try:
+        if FACET_INDEX_ENABLED:
+            await facet_index.refresh_postings(db, posting_ids)
+        if RELATED_INDEX_ENABLED:
+            await related_index.refresh_postings(db, posting_ids)
+    except Exception as e:
+        logger.error(f"Failed to refresh in-memory indexes for postings {posting_ids}: {e}")
+
+async def _max_posting_id(db) -> int:
+    cursor = await db.cursor()
+    await cursor.execute("SELECT COALESCE(MAX(posting_id), 0) FROM job_postings")
+    (max_id,) = await cursor.fetchone()
+    await cursor.close()
+    return max_id
+
+async def sync_new_postings():
+    """
+    API를 거치지 않고 추가된 공고(크롤러 적재 등)를 찾아 반영
+    """
+    global _last_seen_posting_id
+    async with db_connection() as db:
+        cursor = await db.cursor()
+        await cursor.execute(
+            "SELECT posting_id FROM job_postings WHERE posting_id > %s ORDER BY posting_id LIMIT 5000",
+            (_last_seen_posting_id,)
+        )
+        new_ids = [row[0] for row in await cursor.fetchall()]
+        await cursor.close()
+        if new_ids:
+            await postings_changed(db, new_ids)
+            _last_seen_posting_id = new_ids[-1]
+            logger.info(f"Synced {len(new_ids)} new job postings into in-memory indexes")
+
+async def run_postings_sync():
+    """
+    시작 시 사전 테이블 캐시와 메모리 인덱스를 적재하고 이후 주기적으로 외부 변경을 반영하는 백그라운드 작업
+    """
+    global _last_seen_posting_id
+    try:
+        async with db_connection() as db:
+            _last_seen_posting_id = await _max_posting_id(db)
+            await lookups.load(db)
+            if FACET_INDEX_ENABLED:
+                await facet_index.load(db)
+                logger.info(f"Facet index loaded: {facet_index.stats()}")
+            if RELATED_INDEX_ENABLED:
+                await related_index.load(db)
+                logger.info(f"Related index loaded: {related_index.stats()}")
+    except Exception as e:
+        logger.error(f"Failed to load in-memory indexes: {e}")
+
+    while True:
+        await asyncio.sleep(POSTINGS_SYNC_INTERVAL_SECONDS)
+        try:
+            while True:
+                before = _last_seen_posting_id
+                await sync_new_postings()
+                if _last_seen_posting_id == before:
+                    break
+        except Exception as e:
+            logger.error(f"Failed to sync job postings: {e}")
@@ -0,0 +1,247 @@
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+# 이름 사전 테이블: 테이블 -> (id 컬럼, 추가 쿼리)
+# name 컬럼의 UNIQUE 제약으로 동시에 같은 이름을 추가해도 한 행만 생성된다.
+NAME_TABLES = {
+    "tech_stacks": ("stack_id", "INSERT IGNORE INTO tech_stacks (name, category) VALUES (%s, 'Other')"),
+    "job_categories": ("category_id", "INSERT IGNORE INTO job_categories (name) VALUES (%s)"),
+}
+
+# locations에는 (city, district) 유니크 제약이 없으므로 추가 시 이름 잠금으로 직렬화
+LOCATION_LOCK = "job_api.locations"
+LOCATION_LOCK_TIMEOUT = 10
+
+def location_key(city: str, district: Optional[str]) -> Tuple[str, Optional[str]]:
+    return city.lower(), district.lower() if district is not None else None
+
+def _check_lock(acquired, name: str):
+    """
+    GET_LOCK 결과 확인 (1이 아니면 시간 초과(0) 또는 에러(NULL))
+    """
+    if acquired != 1:
+        raise RuntimeError(f"Could not acquire lock '{name}' within {LOCATION_LOCK_TIMEOUT}s")
+
+class LookupTables:
+    """
+    기술 스택, 직무 카테고리, 지역 사전 테이블의 이름 -> id 캐시 (프로세스 단위).
+    - 시작 시 전체를 적재하고, 캐시에 없는 값은 호출한 쪽의 커넥션에서 조회/추가 후 즉시 커밋
+      (요청 트랜잭션이 롤백되어도 캐시된 id가 유효하도록, 요청마다 두 번째 커넥션을 빌리지 않도록).
+      따라서 호출한 쪽은 쓰기 전에 이름을 조회해야 한다.
+    - API(aiomysql)와 크롤러(mysql.connector)에서 함께 사용
+    """
+    def __init__(self):
+        self.ready = False
+        self._ids: Dict[str, Dict[object, int]] = {"tech_stacks": {}, "job_categories": {}, "locations": {}}
+        # 테이블별 변경 횟수 (새 이름이 추가될 때 증가, 이름 목록으로 만든 구조의 재생성 여부 판단에 사용)
+        self.versions: Dict[str, int] = dict.fromkeys(self._ids, 0)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _store(self, table: str, rows: Iterable[tuple]):
+        with self._lock:
+            ids = self._ids[table]
+            size = len(ids)
+            changed = False
+            for row in rows:
+                if table == "locations":
+                    location_id, city, district = row
+                    ids.setdefault(location_key(city, district), location_id)
+                else:
+                    row_id, name = row
+                    changed |= ids.get(name.lower()) != row_id
+                    ids[name.lower()] = row_id
+            if changed or len(ids) != size:
+                self.versions[table] += 1
+
+    @staticmethod
+    def _select_all_queries():
+        yield "locations", "SELECT location_id, city, district FROM locations"
+        for table, (id_column, _) in NAME_TABLES.items():
+            yield table, f"SELECT {id_column}, name FROM {table}"
+
+    def _split(self, table: str, keys: Iterable) -> Tuple[Dict[object, int], list]:
+        """
+        캐시에 있는 키와 없는 키로 분리
+        """
+        cache = self._ids[table]
+        found, missing = {}, []
+        for key in dict.fromkeys(keys):
+            if key in cache:
+                found[key] = cache[key]
+            else:
+                missing.append(key)
+        self.hits += len(found)
+        self.misses += len(missing)
+        return found, missing
+
+    def _require(self, table: str, keys: list) -> Dict[object, int]:
+        """
+        추가 후 다시 조회한 키의 id. 추가되지 않은 값이 있으면 예외 발생
+        """
+        cache = self._ids[table]
+        unresolved = [key for key in keys if key not in cache]
+        if unresolved:
+            raise ValueError(f"Could not resolve {table}: {unresolved}")
+        return {key: cache[key] for key in keys}
+
+    def snapshot(self, table: str) -> Tuple[int, Dict[object, int]]:
+        """
+        테이블의 현재 버전과 이름 -> id 매핑 복사본
+        """
+        with self._lock:
+            return self.versions[table], dict(self._ids[table])
+
+    def get(self, table: str, name: str) -> Optional[int]:
+        """
+        캐시에서만 조회 (없으면 None)
+        """
+        return self._ids[table].get(name.lower())
+
+    # ---------- aiomysql (API) ----------
+
+    async def load(self, db):
+        """
+        사전 테이블 전체 적재
+        """
+        cursor = await db.cursor()
+        try:
+            for table, query in self._select_all_queries():
+                await cursor.execute(query)
+                self._store(table, await cursor.fetchall())
+        finally:
+            await cursor.close()
+        self.ready = True
+
+    async def resolve(self, db, table: str, names: Iterable[str]) -> Dict[str, int]:
+        """
+        이름 목록의 id 조회, 없는 이름은 db에서 추가 후 커밋 (소문자 이름 -> id)
+        """
+        originals = {name.lower(): name for name in names}
+        found, missing = self._split(table, originals)
+        if missing:
+            id_column, insert_query = NAME_TABLES[table]
+            placeholders = ','.join(['%s'] * len(missing))
+            cursor = await db.cursor()
+            try:
+                await cursor.executemany(insert_query, [(originals[key],) for key in missing])
+                await cursor.execute(
+                    f"SELECT {id_column}, name FROM {table} WHERE name IN ({placeholders})",
+                    [originals[key] for key in missing]
+                )
+                rows = await cursor.fetchall()
+                await db.commit()
+            finally:
+                await cursor.close()
+            self._store(table, rows)
+            found.update(self._require(table, missing))
+        return found
+
+    async def resolve_locations(self, db, locations: Iterable[Tuple[str, Optional[str]]]) -> Dict[tuple, int]:
+        """
+        (시, 구) 목록의 location_id 조회, 없는 지역은 db에서 추가 후 커밋 ((소문자 시, 소문자 구) -> id)
+        """
+        originals = {location_key(city, district): (city, district) for city, district in locations}
+        found, missing = self._split("locations", originals)
+        if missing:
+            cursor = await db.cursor()
+            try:
+                await cursor.execute("SELECT GET_LOCK(%s, %s)", (LOCATION_LOCK, LOCATION_LOCK_TIMEOUT))
+                _check_lock((await cursor.fetchone())[0], LOCATION_LOCK)
+                try:
+                    rows = await self._insert_missing_locations(cursor, [originals[key] for key in missing])
+                    await db.commit()
+                finally:
+                    await cursor.execute("SELECT RELEASE_LOCK(%s)", (LOCATION_LOCK,))
+                    await cursor.fetchall()
+            finally:
+                await cursor.close()
+            self._store("locations", rows)
+            found.update(self._require("locations", missing))
+        return found
+
+    async def location_id(self, db, city: str, district: Optional[str]) -> int:
+        """
+        단일 지역의 location_id 조회, 없으면 추가
+        """
+        return (await self.resolve_locations(db, [(city, district)]))[location_key(city, district)]
+
+    @staticmethod
+    def _location_queries(locations: list) -> Tuple[str, list]:
+        cities = list({city for city, _ in locations})
+        placeholders = ','.join(['%s'] * len(cities))
+        return f"SELECT location_id, city, district FROM locations WHERE city IN ({placeholders})", cities
+
+    @staticmethod
+    def _new_locations(locations: list, rows: list) -> list:
+        existing = {location_key(city, district) for _, city, district in rows}
+        return [location for location in locations if location_key(*location) not in existing]
+
+    async def _insert_missing_locations(self, cursor, locations: list) -> list:
+        query, cities = self._location_queries(locations)
+        await cursor.execute(query, cities)
+        rows = await cursor.fetchall()
+        new_rows = self._new_locations(locations, rows)
+        if new_rows:
+            await cursor.executemany("INSERT INTO locations (city, district) VALUES (%s, %s)", new_rows)
+            await cursor.execute(query, cities)
+            rows = await cursor.fetchall()
+        return rows
+
+    # ---------- mysql.connector (크롤러) ----------
+
+    def load_sync(self, conn):
+        """
+        사전 테이블 전체 적재 (동기 커넥션)
+        """
+        cursor = conn.cursor()
+        try:
+            for table, query in self._select_all_queries():
+                cursor.execute(query)
+                self._store(table, cursor.fetchall())
+        finally:
+            cursor.close()
+        self.ready = True
+
+    def resolve_locations_sync(self, conn, locations: Iterable[Tuple[str, Optional[str]]]) -> Dict[tuple, int]:
+        """
+        resolve_locations의 동기 커넥션 버전. 추가한 지역은 즉시 커밋된다.
+        """
+        originals = {location_key(city, district): (city, district) for city, district in locations}
+        found, missing = self._split("locations", originals)
+        if missing:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT GET_LOCK(%s, %s)", (LOCATION_LOCK, LOCATION_LOCK_TIMEOUT))
+                _check_lock(cursor.fetchall()[0][0], LOCATION_LOCK)
+                try:
+                    new_locations = [originals[key] for key in missing]
+                    query, cities = self._location_queries(new_locations)
+                    cursor.execute(query, cities)
+                    rows = cursor.fetchall()
+                    new_rows = self._new_locations(new_locations, rows)
+                    if new_rows:
+                        cursor.executemany("INSERT INTO locations (city, district) VALUES (%s, %s)", new_rows)
+                        cursor.execute(query, cities)
+                        rows = cursor.fetchall()
+                    conn.commit()
+                finally:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (LOCATION_LOCK,))
+                    cursor.fetchall()
+            finally:
+                cursor.close()
+            self._store("locations", rows)
+            found.update(self._require("locations", missing))
+        return found
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "sizes": {table: len(ids) for table, ids in self._ids.items()},
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+# 프로세스 단위 사전 테이블 캐시
+lookups = LookupTables()
@@ -1,21 +1,49 @@
+import asyncio
 import logging
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.openapi.utils import get_openapi
+from database import init_async_pool, close_async_pool
+from job_sync import run_postings_sync
+from view_counter import view_counter
+from resume_storage import resume_storage
 from routes.auth_routes import router as auth_router
 from routes.jobs_routes import router as jobs_router
 from routes.applications_routes import router as applications_router
 from routes.bookmarks_routes import router as bookmarks_router
+from routes.resumes_routes import router as resumes_router
+from routes.system_routes import router as system_router
 
 # 로거 설정
 logger = logging.getLogger("api_logger")
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 시작 시 비동기 DB 풀 생성 및 백그라운드 작업(메모리 인덱스 동기화, 조회수 반영) 시작,
+    종료 시 남은 조회수를 반영하고 정리
+    """
+    await init_async_pool()
+    sync_task = asyncio.create_task(run_postings_sync())
+    view_counter.start()
+    yield
+    sync_task.cancel()
+    try:
+        await sync_task
+    except asyncio.CancelledError:
+        pass
+    # 조회수 반영 작업은 취소하지 않고 멈춘 뒤, 진행 중인 반영을 기다려 남은 조회수를 반영
+    await view_counter.close()
+    await close_async_pool()
+
 app = FastAPI(
     title="Job API",
     description="Job recruitment API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -24,6 +52,49 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
+)
+
+# multipart 업로드 요청에서 파일 외 본문(경계 문자열, 다른 폼 필드)에 허용하는 크기
+UPLOAD_OVERHEAD_BYTES = 64 * 1024
+
+class UploadSizeLimitMiddleware:
+    """
+    업로드 요청의 본문 크기를 핸들러 실행 전에 제한하는 ASGI 미들웨어.
+    Starlette는 핸들러를 실행하기 전에 multipart 본문 전체를 받아 두므로 핸들러에서만 확인하면 업로드가 끝난 뒤에야 거절된다.
+    Content-Length가 제한을 넘으면 본문을 읽지 않고 413으로 응답하고,
+    길이를 알 수 없는 요청(chunked)은 받은 크기가 제한을 넘는 즉시 413으로 중단한다.
+    """
+    def __init__(self, app, paths, max_bytes: int):
+        self.app = app
+        self.paths = set(paths)
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        detail = f"Request body must be at most {self.max_bytes} bytes."
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            await JSONResponse(status_code=413, content={"detail": detail})(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+app.add_middleware(
+    UploadSizeLimitMiddleware, paths=["/applications"], max_bytes=resume_storage.max_bytes + UPLOAD_OVERHEAD_BYTES
 )
 
 # 라우터 등록
@@ -31,6 +102,8 @@ app.include_router(auth_router)
 app.include_router(jobs_router)
 app.include_router(applications_router)
 app.include_router(bookmarks_router)
+app.include_router(resumes_router)
+app.include_router(system_router)
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
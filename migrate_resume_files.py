@@ -0,0 +1,116 @@
+import argparse
+import logging
+import sys
+from typing import Dict, Optional
+import mysql.connector
+from config import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DB_PORT
+from resume_storage import resume_storage
+
+class BlobReader:
+    """
+    resumes.content를 SUBSTRING으로 나누어 읽는 파일 객체 (ResumeStorage.store에 전달).
+    read 한 번에 요청한 크기만큼만 DB에서 읽으므로 BLOB 전체가 메모리에 올라오지 않는다.
+    """
+    def __init__(self, cursor, resume_id: int, size: int):
+        self.cursor = cursor
+        self.resume_id = resume_id
+        self.size = size
+        self.offset = 0
+
+    def read(self, n: int = -1) -> bytes:
+        if self.offset >= self.size:
+            return b""
+        if n is None or n < 0:
+            n = self.size - self.offset
+        self.cursor.execute(
+            "SELECT SUBSTRING(content, %s, %s) FROM resumes WHERE resume_id = %s",
+            (self.offset + 1, n, self.resume_id)
+        )
+        row = self.cursor.fetchone()
+        if not row or not row[0]:
+            raise RuntimeError(f"Resume {self.resume_id} content changed while reading")
+        self.offset += len(row[0])
+        return bytes(row[0])
+
+def migrate_resume(conn, resume_id: int, size: int) -> Optional[bool]:
+    """
+    BLOB 이력서 하나를 파일 저장소로 옮기고, 저장된 파일을 확인한 뒤에만 행을 갱신하고 content를 비운다.
+    옮겼으면 True, 그 사이 행이 바뀌어 건너뛰었으면 False, 파일 확인에 실패하면 None을 반환.
+    """
+    cursor = conn.cursor()
+    try:
+        stored = resume_storage.store(BlobReader(cursor, resume_id, size))
+        if stored.size != size or not resume_storage.verify(stored):
+            logging.error(f"Resume {resume_id}: stored file does not match the BLOB ({stored.size}/{size} bytes), content kept")
+            conn.rollback()
+            return None
+        cursor.execute(
+            "UPDATE resumes SET file_sha256 = %s, file_path = %s, file_size = %s, content = NULL"
+            " WHERE resume_id = %s AND file_path IS NULL AND OCTET_LENGTH(content) = %s",
+            (stored.sha256, stored.path, stored.size, resume_id, size)
+        )
+        updated = cursor.rowcount == 1
+        conn.commit()
+        return updated
+    finally:
+        cursor.close()
+
+def migrate(conn, batch_size: int = 100, limit: Optional[int] = None) -> Dict[str, int]:
+    """
+    파일 저장소 도입 전에 BLOB으로 저장된 이력서를 resume_id 순서로 옮긴다.
+    이력서마다 커밋하므로 중간에 멈춰도 다시 실행하면 남은 이력서부터 이어서 처리된다.
+    """
+    counts = {"migrated": 0, "skipped": 0, "failed": 0}
+    last_id = 0
+    while limit is None or sum(counts.values()) < limit:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT resume_id, OCTET_LENGTH(content) FROM resumes
+            WHERE resume_id > %s AND file_path IS NULL AND OCTET_LENGTH(content) > 0
+            ORDER BY resume_id LIMIT %s
+            """,
+            (last_id, batch_size)
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        if not rows:
+            break
+        for resume_id, size in rows:
+            if limit is not None and sum(counts.values()) >= limit:
+                break
+            last_id = resume_id
+            try:
+                result = migrate_resume(conn, resume_id, size)
+            except Exception as e:
+                conn.rollback()
+                logging.error(f"Resume {resume_id}: migration failed: {e}")
+                counts["failed"] += 1
+                continue
+            if result is None:
+                counts["failed"] += 1
+            elif result:
+                counts["migrated"] += 1
+                logging.info(f"Resume {resume_id}: moved {size} bytes to the file store")
+            else:
+                counts["skipped"] += 1
+                logging.info(f"Resume {resume_id}: changed during migration, skipped")
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move resumes stored as DB BLOBs into the resume file store.")
+    parser.add_argument('--batch-size', type=int, default=100, help='Number of resume ids selected per query.')
+    parser.add_argument('--limit', type=int, default=None, help='Maximum number of resumes to process.')
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+    conn = mysql.connector.connect(host=DB_HOST, port=DB_PORT, user=DB_USER, password=DB_PASSWORD, database=DB_NAME)
+    try:
+        counts = migrate(conn, batch_size=max(args.batch_size, 1), limit=args.limit)
+    finally:
+        conn.close()
+    logging.info(f"Migrated: {counts['migrated']}, Skipped: {counts['skipped']}, Failed: {counts['failed']}")
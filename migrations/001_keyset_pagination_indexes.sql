@@ -0,0 +1,7 @@
+-- 커서(keyset) 페이지네이션용 인덱스
+-- (정렬 컬럼, id) 순서로 인덱스를 따라 마지막 행 이후만 읽도록 함
+
+CREATE INDEX idx_job_postings_status_created ON job_postings (status, created_at, posting_id);
+CREATE INDEX idx_job_postings_status_views ON job_postings (status, view_count, posting_id);
+CREATE INDEX idx_applications_user_applied ON applications (user_id, applied_at, application_id);
+CREATE INDEX idx_bookmarks_user_created ON bookmarks (user_id, created_at, bookmark_id);
@@ -0,0 +1,5 @@
+-- 채용 공고 키워드 검색용 FULLTEXT 인덱스 (SEARCH_BACKEND=fulltext)
+-- ngram 파서는 한글 제목을 n-gram(ngram_token_size, 기본 2) 단위로 색인함
+
+ALTER TABLE job_postings ADD FULLTEXT INDEX ft_job_postings_title (title) WITH PARSER ngram;
+ALTER TABLE job_postings ADD FULLTEXT INDEX ft_job_postings_title_desc (title, job_description) WITH PARSER ngram;
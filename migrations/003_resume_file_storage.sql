@@ -0,0 +1,9 @@
+-- 이력서 파일을 DB BLOB 대신 파일 저장소(RESUME_STORAGE_DIR)에 저장
+-- file_path는 저장소 기준 상대 경로(sha256 앞 2자리/다음 2자리/sha256), 기존 행은 content를 그대로 사용함
+
+ALTER TABLE resumes
+    ADD COLUMN file_sha256 CHAR(64) NULL,
+    ADD COLUMN file_path VARCHAR(255) NULL,
+    ADD COLUMN file_size BIGINT NULL,
+    MODIFY content LONGBLOB NULL,
+    ADD INDEX idx_resumes_file_sha256 (file_sha256);
@@ -48,6 +48,10 @@ class JobCreate(BaseModel):
     tech_stacks: Optional[List[str]] = None
     job_categories: Optional[List[str]] = None
 
+# 채용 공고 일괄 등록 모델
+class JobBulkCreate(BaseModel):
+    jobs: List[JobCreate]
+
 # 채용 공고 업데이트 모델
 class JobUpdate(BaseModel):
     company_id: Optional[int] = None
@@ -0,0 +1,39 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Sequence, Tuple
+from fastapi import HTTPException
+
+def encode_cursor(kind: str, **values: Any) -> str:
+    """
+    마지막으로 조회한 행의 정렬 키를 불투명한 커서 문자열로 인코딩
+    """
+    payload = {"k": kind, **values}
+    raw = json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, kind: str) -> Dict[str, Any]:
+    """
+    커서 문자열 디코딩. 다른 정렬 기준으로 만들어진 커서이거나 형식이 잘못된 경우 400 에러.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(payload, dict) or payload.get("k") != kind:
+        raise HTTPException(status_code=400, detail="Cursor does not match the requested sort")
+    return payload
+
+def keyset_condition(
+    sort_column: str, id_column: str, descending: bool, sort_value: Any, last_id: int,
+    sort_params: Sequence[Any] = ()
+) -> Tuple[str, List[Any]]:
+    """
+    (정렬 컬럼, id) 기준으로 마지막 행 이후의 행만 남기는 WHERE 조건 생성.
+    OFFSET과 달리 앞 페이지의 행을 읽고 버리지 않으므로 페이지 깊이와 무관하게 비용이 일정하다.
+    정렬 기준이 파라미터를 가진 식인 경우 sort_params로 전달한다.
+    """
+    op = "<" if descending else ">"
+    condition = f" AND ({sort_column} {op} %s OR ({sort_column} = %s AND {id_column} {op} %s))"
+    return condition, [*sort_params, sort_value, *sort_params, sort_value, last_id]
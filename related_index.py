@@ -0,0 +1,318 @@
+import asyncio
+import random
+import threading
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from config import RELATED_TOP_N, RELATED_COMPANY_BONUS
+
+# 유사도 계산 시 한 번에 처리하는 (행 x 전체 공고) 점수 행렬의 최대 원소 수
+SCORE_BLOCK_ELEMENTS = 1 << 22
+
+EMPTY_ROWS = np.zeros(0, dtype=np.int64)
+
+POSTING_QUERY = """
+SELECT jp.posting_id, jp.status, jp.company_id, jp.title, c.name
+FROM job_postings jp
+JOIN companies c ON jp.company_id = c.company_id
+WHERE {condition}
+"""
+
+TECH_STACK_QUERY = """
+SELECT pts.posting_id, pts.stack_id
+FROM posting_tech_stacks pts
+JOIN job_postings jp ON pts.posting_id = jp.posting_id
+WHERE {condition}
+"""
+
+class RelatedIndex:
+    """
+    활성 채용 공고별 연관 공고 top-N을 미리 계산해 두는 인덱스.
+    - 유사도: 기술 스택 Jaccard 유사도 + 같은 회사 가중치
+    - 기술 스택별 공고 행 번호 배열(희소 행렬의 열)을 유지하여, 교집합 크기는 계산할 공고의 기술 스택에 해당하는 배열만 읽어 구함
+    - 공고 등록/수정/삭제 시 해당 공고의 목록을 다시 계산하고 다른 공고의 목록에 반영
+    - 조회 시 상위 후보 중 일부를 무작위로 골라 반환
+    """
+    def __init__(self, top_n: int, company_bonus: float):
+        self.top_n = max(top_n, 1)
+        self.company_bonus = company_bonus
+        self.ready = False
+        self._pending = set()
+        # 인덱스와 목록 변경(전체 생성, 변경 반영)은 스레드에서 실행되므로 동시에 하나만 실행
+        self._lock = threading.Lock()
+        self._reset(0)
+
+    def _reset(self, rows: int):
+        self._sizes = np.zeros(rows, dtype=np.float32)
+        self._companies = np.full(rows, -1, dtype=np.int64)
+        self._row_ids = np.zeros(rows, dtype=np.int64)
+        self._rows: Dict[int, int] = {}
+        self._free_rows: List[int] = []
+        # 행 번호 -> 기술 스택 id 배열, 기술 스택 id -> 행 번호 배열
+        self._row_stacks: Dict[int, np.ndarray] = {}
+        self._stack_rows: Dict[int, np.ndarray] = {}
+        self._meta: Dict[int, dict] = {}
+        self._related: Dict[int, List[Tuple[float, int]]] = {}
+        self._referrers: Dict[int, set] = defaultdict(set)
+
+    async def _fetch(self, db, condition: str, params: list) -> Tuple[list, list]:
+        cursor = await db.cursor()
+        try:
+            await cursor.execute(POSTING_QUERY.format(condition=condition), params)
+            postings = await cursor.fetchall()
+            await cursor.execute(TECH_STACK_QUERY.format(condition=condition), params)
+            stacks = await cursor.fetchall()
+        finally:
+            await cursor.close()
+        return postings, stacks
+
+    def _ensure_capacity(self, rows: int):
+        """
+        행 수가 부족하면 두 배씩 늘려서 재할당
+        """
+        cur_rows = len(self._row_ids)
+        if rows <= cur_rows:
+            return
+        new_rows = max(rows, cur_rows * 2)
+        for name, fill in (("_sizes", 0), ("_companies", -1), ("_row_ids", 0)):
+            old = getattr(self, name)
+            grown = np.full(new_rows, fill, dtype=old.dtype)
+            grown[:cur_rows] = old
+            setattr(self, name, grown)
+        self._free_rows.extend(range(new_rows - 1, cur_rows - 1, -1))
+
+    def _add_posting(self, row: tuple, stack_ids: List[int]) -> int:
+        """
+        공고를 행에 기록하고 행 번호를 반환 (기술 스택별 행 번호 배열은 호출한 쪽에서 갱신)
+        """
+        posting_id, _, company_id, title, company_name = row
+        self._ensure_capacity(len(self._rows) + 1)
+        index = self._free_rows.pop()
+        stacks = np.array(sorted(set(stack_ids)), dtype=np.int64)
+        self._row_stacks[index] = stacks
+        self._sizes[index] = len(stacks)
+        self._companies[index] = company_id
+        self._row_ids[index] = posting_id
+        self._rows[posting_id] = index
+        self._meta[posting_id] = {"posting_id": posting_id, "title": title, "company_name": company_name}
+        return index
+
+    def _link(self, index: int):
+        """
+        행의 기술 스택별 행 번호 배열에 행 추가
+        """
+        for stack_id in self._row_stacks[index].tolist():
+            self._stack_rows[stack_id] = np.append(self._stack_rows.get(stack_id, EMPTY_ROWS), index)
+
+    def _link_all(self):
+        """
+        전체 행으로 기술 스택별 행 번호 배열 생성
+        """
+        indexes = list(self._row_stacks)
+        if not indexes:
+            self._stack_rows = {}
+            return
+        stacks = [self._row_stacks[index] for index in indexes]
+        rows = np.repeat(np.array(indexes, dtype=np.int64), [len(row_stacks) for row_stacks in stacks])
+        stacks = np.concatenate(stacks)
+        order = np.argsort(stacks, kind="stable")
+        stacks, rows = stacks[order], rows[order]
+        stack_ids, starts = np.unique(stacks, return_index=True)
+        self._stack_rows = dict(zip(stack_ids.tolist(), np.split(rows, starts[1:])))
+
+    def _remove_posting(self, posting_id: int) -> set:
+        """
+        공고를 인덱스에서 제거하고, 연관 목록에서 이 공고가 빠진 다른 공고의 id 집합을 반환
+        """
+        index = self._rows.pop(posting_id, None)
+        if index is not None:
+            for stack_id in self._row_stacks.pop(index).tolist():
+                rows = self._stack_rows[stack_id]
+                rows = rows[rows != index]
+                if len(rows):
+                    self._stack_rows[stack_id] = rows
+                else:
+                    del self._stack_rows[stack_id]
+            self._sizes[index] = 0
+            self._companies[index] = -1
+            self._free_rows.append(index)
+        self._meta.pop(posting_id, None)
+        for _, other_id in self._related.pop(posting_id, ()):
+            self._referrers[other_id].discard(posting_id)
+        referrers = self._referrers.pop(posting_id, set())
+        for other_id in referrers:
+            self._related[other_id] = [entry for entry in self._related.get(other_id, ()) if entry[1] != posting_id]
+        return referrers
+
+    def _intersections(self, indexes: np.ndarray) -> np.ndarray:
+        """
+        주어진 행의 공고와 전체 공고가 공유하는 기술 스택 수 (len(indexes) x 행 수).
+        각 행의 기술 스택에 해당하는 행 번호 배열만 읽어 (블록 내 위치, 행 번호)별로 센다.
+        """
+        capacity = len(self._row_ids)
+        keys = [
+            self._stack_rows[stack_id] + offset
+            for offset, index in zip(range(0, len(indexes) * capacity, capacity), indexes.tolist())
+            for stack_id in self._row_stacks[index].tolist()
+        ]
+        if not keys:
+            return np.zeros((len(indexes), capacity), dtype=np.float32)
+        counts = np.bincount(np.concatenate(keys), minlength=len(indexes) * capacity)
+        return counts.reshape(len(indexes), capacity).astype(np.float32)
+
+    def _scores(self, indexes: np.ndarray) -> np.ndarray:
+        """
+        주어진 행의 공고와 전체 공고 간 유사도 (len(indexes) x 행 수)
+        """
+        inter = self._intersections(indexes)
+        union = self._sizes[indexes, None] + self._sizes[None, :] - inter
+        scores = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+        same_company = (self._companies[indexes, None] == self._companies[None, :]) & (self._companies[None, :] >= 0)
+        scores += self.company_bonus * same_company
+        scores[np.arange(len(indexes)), indexes] = 0
+        return scores
+
+    def _top(self, scores: np.ndarray) -> List[List[Tuple[float, int]]]:
+        """
+        유사도 행렬의 각 행에서 점수가 0보다 큰 상위 top_n개 (점수 내림차순)
+        """
+        k = min(self.top_n, scores.shape[1])
+        top = np.argpartition(scores, -k, axis=1)[:, -k:] if k < scores.shape[1] else np.tile(np.arange(scores.shape[1]), (len(scores), 1))
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        top_ids = self._row_ids[top]
+        return [
+            [(float(score), int(posting_id)) for score, posting_id in zip(row_scores, row_ids) if score > 0]
+            for row_scores, row_ids in zip(top_scores.tolist(), top_ids.tolist())
+        ]
+
+    def _compute(self, posting_ids: List[int]) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        공고별 top-N 목록을 계산해 저장하고 (posting_id, 전체 공고와의 유사도)를 차례로 반환.
+        메모리 사용량을 제한하기 위해 행 블록 단위로 계산한다.
+        """
+        if not posting_ids:
+            return
+        block_size = max(1, SCORE_BLOCK_ELEMENTS // max(len(self._row_ids), 1))
+        for start in range(0, len(posting_ids), block_size):
+            block_ids = posting_ids[start:start + block_size]
+            scores = self._scores(np.array([self._rows[posting_id] for posting_id in block_ids], dtype=np.int64))
+            for posting_id, entries, row_scores in zip(block_ids, self._top(scores), scores):
+                self._related[posting_id] = entries
+                for _, other_id in entries:
+                    self._referrers[other_id].add(posting_id)
+                yield posting_id, row_scores
+
+    def _build(self, postings: list, stacks: list):
+        """
+        전체 공고로 인덱스와 연관 공고 목록 생성 (스레드에서 실행)
+        """
+        stacks_by_posting = defaultdict(list)
+        for posting_id, stack_id in stacks:
+            stacks_by_posting[posting_id].append(stack_id)
+        with self._lock:
+            self._reset(len(postings))
+            self._free_rows = list(range(len(postings) - 1, -1, -1))
+            for row in postings:
+                self._add_posting(row, stacks_by_posting[row[0]])
+            self._link_all()
+            for _ in self._compute(list(self._rows)):
+                pass
+
+    async def load(self, db):
+        """
+        활성 공고 전체로 인덱스 생성. 적재 중에 변경된 공고는 적재 후 다시 반영한다.
+        """
+        self.ready = False
+        postings, stacks = await self._fetch(db, "jp.status = 'active'", [])
+        await asyncio.to_thread(self._build, postings, stacks)
+        self.ready = True
+
+        pending, self._pending = list(self._pending), set()
+        if pending:
+            await self.refresh_postings(db, pending)
+
+    async def refresh_postings(self, db, posting_ids: List[int]):
+        """
+        변경된 공고를 DB에서 다시 읽어 해당 공고의 연관 목록을 계산하고,
+        다른 공고의 목록에도 점수가 충분히 높으면 추가한다 (유사도는 대칭).
+        변경된 공고가 목록에서 빠진 공고는 목록 전체를 다시 계산한다.
+        """
+        if not posting_ids:
+            return
+        if not self.ready:
+            self._pending.update(posting_ids)
+            return
+
+        placeholders = ','.join(['%s'] * len(posting_ids))
+        postings, stacks = await self._fetch(db, f"jp.posting_id IN ({placeholders})", list(posting_ids))
+        await asyncio.to_thread(self._apply, posting_ids, postings, stacks)
+
+    def _apply(self, posting_ids: List[int], postings: list, stacks: list):
+        """
+        다시 읽은 공고를 인덱스와 연관 목록에 반영 (스레드에서 실행)
+        """
+        with self._lock:
+            stacks_by_posting = defaultdict(list)
+            for posting_id, stack_id in stacks:
+                stacks_by_posting[posting_id].append(stack_id)
+
+            affected = set()
+            for posting_id in posting_ids:
+                affected |= self._remove_posting(posting_id)
+            active_ids = []
+            for row in postings:
+                if row[1] == 'active':
+                    self._link(self._add_posting(row, stacks_by_posting[row[0]]))
+                    active_ids.append(row[0])
+
+            changed = set(active_ids)
+            for posting_id, row_scores in self._compute(active_ids):
+                for index in np.flatnonzero(row_scores > 0):
+                    other_id = int(self._row_ids[index])
+                    if other_id in changed or other_id in affected:
+                        continue
+                    entries = self._related.setdefault(other_id, [])
+                    score = float(row_scores[index])
+                    if len(entries) < self.top_n or score > entries[-1][0]:
+                        entries.append((score, posting_id))
+                        entries.sort(reverse=True)
+                        self._referrers[posting_id].add(other_id)
+                        if len(entries) > self.top_n:
+                            _, dropped_id = entries.pop()
+                            self._referrers[dropped_id].discard(other_id)
+
+            affected = [posting_id for posting_id in affected - changed if posting_id in self._rows]
+            for posting_id in affected:
+                for _, other_id in self._related.pop(posting_id, ()):
+                    self._referrers[other_id].discard(posting_id)
+            for _ in self._compute(affected):
+                pass
+
+    def related(self, posting_id: int, limit: int = 5) -> Optional[List[dict]]:
+        """
+        연관 공고 목록. 상위 후보(limit의 2배) 중 limit개를 무작위로 골라 점수 순으로 반환한다.
+        인덱스에 없는 공고(비활성 공고 등)는 None을 반환한다.
+        """
+        if not self.ready or posting_id not in self._rows:
+            return None
+        pool = self._related.get(posting_id, [])[:limit * 2]
+        picked = sorted(random.sample(pool, min(limit, len(pool))), reverse=True)
+        # 변경 반영은 스레드에서 실행되므로 그 사이에 빠진 공고는 건너뜀
+        metas = [self._meta.get(other_id) for _, other_id in picked]
+        return [dict(meta) for meta in metas if meta is not None]
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "postings": len(self._rows),
+            "tech_stacks": len(self._stack_rows),
+            "top_n": self.top_n,
+            "avg_related": round(sum(len(entries) for entries in self._related.values()) / len(self._related), 2) if self._related else 0.0,
+            "index_bytes": sum(rows.nbytes for rows in self._stack_rows.values())
+        }
+
+# 프로세스 단위 연관 공고 인덱스
+related_index = RelatedIndex(RELATED_TOP_N, RELATED_COMPANY_BONUS)
@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+from config import RESUME_STORAGE_DIR, RESUME_MAX_BYTES, RESUME_CHUNK_SIZE
+
+class ResumeTooLargeError(Exception):
+    """
+    업로드 파일이 최대 크기를 넘은 경우 발생하는 예외
+    """
+
+@dataclass
+class StoredFile:
+    sha256: str
+    path: str   # 저장소 기준 상대 경로
+    size: int
+
+class ResumeStorage:
+    """
+    SHA-256 해시를 경로로 사용하는 이력서 파일 저장소.
+    - 업로드를 chunk_size 단위로 읽으며 해시를 계산하고 임시 파일에 기록 (요청당 메모리 사용량 일정)
+    - 파일이 max_bytes를 넘으면 저장하지 않음 (요청 본문은 핸들러 실행 전에 UploadSizeLimitMiddleware가 제한)
+    - 같은 내용의 파일은 한 번만 저장 (<root>/ab/cd/<sha256>)
+    """
+    def __init__(self, root: str, max_bytes: int, chunk_size: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def relative_path(sha256: str) -> str:
+        return os.path.join(sha256[:2], sha256[2:4], sha256)
+
+    def absolute_path(self, relative_path: str) -> str:
+        return os.path.join(self.root, relative_path)
+
+    def _store(self, source: BinaryIO, max_bytes: Optional[int]) -> StoredFile:
+        tmp_dir = os.path.join(self.root, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        hasher = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as tmp:
+            try:
+                while True:
+                    chunk = source.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise ResumeTooLargeError(f"File exceeds {max_bytes} bytes")
+                    hasher.update(chunk)
+                    tmp.write(chunk)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+
+        sha256 = hasher.hexdigest()
+        relative_path = self.relative_path(sha256)
+        target = self.absolute_path(relative_path)
+        if os.path.exists(target):
+            # 이미 저장된 내용이면 새로 쓴 파일은 버림
+            os.unlink(tmp.name)
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(tmp.name, target)
+        return StoredFile(sha256=sha256, path=relative_path, size=size)
+
+    async def save(self, upload) -> StoredFile:
+        """
+        업로드 파일(UploadFile)을 저장소에 저장. 파일 입출력은 스레드에서 수행한다.
+        """
+        if upload.size is not None and upload.size > self.max_bytes:
+            raise ResumeTooLargeError(f"File exceeds {self.max_bytes} bytes")
+        await upload.seek(0)
+        return await asyncio.to_thread(self._store, upload.file, self.max_bytes)
+
+    def store(self, source: BinaryIO) -> StoredFile:
+        """
+        파일 객체의 내용을 chunk_size 단위로 읽어 저장소에 저장 (동기 실행, 크기 제한 없음. DB BLOB 이전용)
+        """
+        return self._store(source, None)
+
+    def verify(self, stored: StoredFile) -> bool:
+        """
+        저장된 파일의 크기와 SHA-256이 기록한 값과 같은지 확인
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with open(self.absolute_path(stored.path), "rb") as f:
+                while True:
+                    chunk = f.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    hasher.update(chunk)
+        except OSError:
+            return False
+        return size == stored.size and hasher.hexdigest() == stored.sha256
+
+# 프로세스 단위 이력서 저장소
+resume_storage = ResumeStorage(RESUME_STORAGE_DIR, RESUME_MAX_BYTES, RESUME_CHUNK_SIZE)
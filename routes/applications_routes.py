@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, Query
+from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, Query, Response
 from typing import Optional
 import datetime
-from database import get_db
+from aiomysql import DictCursor
+from database import get_async_db
 from auth import get_current_user
+from pagination import encode_cursor, decode_cursor, keyset_condition
+from resume_storage import resume_storage, ResumeTooLargeError
 
 router = APIRouter(tags=["applications"], prefix="/applications")
 
@@ -12,86 +15,93 @@ async def apply_for_job(
     resume_id: Optional[int] = Form(None),
     resume_file: Optional[UploadFile] = File(None),
     current_user=Depends(get_current_user),
-    db=Depends(get_db)
+    db=Depends(get_async_db)
 ):
     """
     특정 채용 공고에 지원하기.
     resume_id나 resume_file 둘 중 하나는 반드시 필요.
     """
-    cursor = db.cursor(dictionary=True)
+    cursor = await db.cursor(DictCursor)
     # 이미 지원했는지 확인
-    cursor.execute(
+    await cursor.execute(
         "SELECT application_id FROM applications WHERE user_id=%s AND posting_id=%s",
         (current_user['user_id'], posting_id)
     )
-    if cursor.fetchone():
-        cursor.close()
+    if await cursor.fetchone():
+        await cursor.close()
         raise HTTPException(status_code=400, detail="Already applied for this job posting.")
 
     if not resume_id and not resume_file:
-        cursor.close()
+        await cursor.close()
         raise HTTPException(status_code=400, detail="Either resume_id or resume_file must be provided.")
 
-    # 업로드 파일이 있는 경우 PDF 검사 후 DB 삽입
+    # 업로드 파일이 있는 경우 PDF 검사 후 파일 저장소에 저장하고 DB에는 해시/경로/크기만 기록
     if resume_file:
         if resume_file.content_type != "application/pdf":
-            cursor.close()
+            await cursor.close()
             raise HTTPException(status_code=400, detail="Only PDF files are allowed.")
-        file_content = await resume_file.read()
-        cursor.execute(
-            "INSERT INTO resumes(user_id, title, content, is_primary) VALUES(%s, %s, %s, 0)",
-            (current_user['user_id'], f"Uploaded Resume {datetime.datetime.utcnow()}", file_content)
+        try:
+            stored = await resume_storage.save(resume_file)
+        except ResumeTooLargeError:
+            await cursor.close()
+            raise HTTPException(status_code=413, detail=f"Resume file must be at most {resume_storage.max_bytes} bytes.")
+        await cursor.execute(
+            "INSERT INTO resumes(user_id, title, file_sha256, file_path, file_size, is_primary) VALUES(%s, %s, %s, %s, %s, 0)",
+            (current_user['user_id'], f"Uploaded Resume {datetime.datetime.utcnow()}", stored.sha256, stored.path, stored.size)
         )
-        db.commit()
+        await db.commit()
         resume_id = cursor.lastrowid
 
     if resume_id:
-        cursor.execute("SELECT resume_id,user_id FROM resumes WHERE resume_id=%s", (resume_id,))
-        r = cursor.fetchone()
+        await cursor.execute("SELECT resume_id,user_id FROM resumes WHERE resume_id=%s", (resume_id,))
+        r = await cursor.fetchone()
         if not r or r['user_id'] != current_user['user_id']:
-            cursor.close()
+            await cursor.close()
             raise HTTPException(status_code=403, detail="Not authorized to use this resume or it doesn't exist.")
 
-    cursor.execute(
+    await cursor.execute(
         "INSERT INTO applications(user_id, posting_id, resume_id, status) VALUES (%s, %s, %s, 'pending')",
         (current_user['user_id'], posting_id, resume_id)
     )
-    db.commit()
+    await db.commit()
     application_id = cursor.lastrowid
-    cursor.close()
+    await cursor.close()
 
     return {"detail": "Application submitted successfully", "application_id": application_id}
 
 @router.delete("/{id}", summary="지원 취소")
-def cancel_application(id: int, current_user=Depends(get_current_user), db=Depends(get_db)):
+async def cancel_application(id: int, current_user=Depends(get_current_user), db=Depends(get_async_db)):
     """
     지원 취소 (applications 레코드 삭제)
     """
-    cursor = db.cursor(dictionary=True)
-    cursor.execute("SELECT user_id FROM applications WHERE application_id=%s", (id,))
-    appl = cursor.fetchone()
+    cursor = await db.cursor(DictCursor)
+    await cursor.execute("SELECT user_id FROM applications WHERE application_id=%s", (id,))
+    appl = await cursor.fetchone()
     if not appl:
-        cursor.close()
+        await cursor.close()
         raise HTTPException(status_code=404, detail="Application not found")
     if appl['user_id'] != current_user['user_id']:
-        cursor.close()
+        await cursor.close()
         raise HTTPException(status_code=403, detail="Not your application")
 
-    cursor.execute("DELETE FROM applications WHERE application_id=%s", (id,))
-    db.commit()
-    cursor.close()
+    await cursor.execute("DELETE FROM applications WHERE application_id=%s", (id,))
+    await db.commit()
+    await cursor.close()
     return {"detail": "Application canceled"}
 
 @router.get("", summary="지원 내역 조회")
-def list_applications(
+async def list_applications(
+    response: Response,
     status_filter: Optional[str] = Query(None, description="pending, reviewed, accepted, rejected"),
     sort_by_date: Optional[str] = Query("desc"),
     page: int = 1,
+    page_cursor: Optional[str] = Query(None, alias="cursor", description="이전 응답의 X-Next-Cursor 헤더 값 (지정 시 page 무시)"),
     current_user=Depends(get_current_user),
-    db=Depends(get_db)
+    db=Depends(get_async_db)
 ):
     """
     로그인한 사용자의 지원 내역 조회
+    다음 페이지 커서는 X-Next-Cursor 응답 헤더로 전달한다.
     """
     query = """
     SELECT a.application_id, a.posting_id, jp.title, a.status, a.applied_at
@@ -104,14 +114,32 @@ def list_applications(
         query += " AND a.status=%s"
         params.append(status_filter)
 
-    query += " ORDER BY a.applied_at " + ("ASC" if sort_by_date == "asc" else "DESC")
+    descending = sort_by_date != "asc"
+    cursor_kind = "applications_desc" if descending else "applications_asc"
+    if page_cursor:
+        last = decode_cursor(page_cursor, cursor_kind)
+        condition, values = keyset_condition("a.applied_at", "a.application_id", descending, last.get("v"), last.get("id"))
+        query += condition
+        params.extend(values)
+
+    direction = "DESC" if descending else "ASC"
+    query += f" ORDER BY a.applied_at {direction}, a.application_id {direction}"
 
     page_size = 20
-    offset = (page - 1) * page_size
-    query += f" LIMIT {page_size} OFFSET {offset}"
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    query += f" LIMIT {page_size + 1}"
+    if not page_cursor:
+        query += f" OFFSET {(page - 1) * page_size}"
+
+    cursor = await db.cursor(DictCursor)
+    await cursor.execute(query, params)
+    apps = await cursor.fetchall()
+    await cursor.close()
 
-    cursor = db.cursor(dictionary=True)
-    cursor.execute(query, params)
-    apps = cursor.fetchall()
-    cursor.close()
+    has_next = len(apps) > page_size
+    apps = apps[:page_size]
+    if has_next:
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            cursor_kind, v=apps[-1]['applied_at'], id=apps[-1]['application_id']
+        )
     return apps
@@ -1,50 +1,58 @@
 from fastapi import APIRouter, Depends, HTTPException, Body, status
 from fastapi.security import OAuth2PasswordRequestForm
 from datetime import datetime
-from database import get_db
+from aiomysql import DictCursor
+from database import get_async_db
 from models import UserRegister, UserProfile, Token
-from auth import verify_password, create_access_token, create_refresh_token, get_current_user
+from auth import (
+    verify_password, create_user_access_token, create_refresh_token, get_current_user,
+    invalidate_cached_user, revoke_user_tokens
+)
+from config import AUTH_STATELESS
 
 router = APIRouter(tags=["auth"], prefix="/auth")
 
 @router.post("/register", response_model=Token, summary="회원가입")
-def register_user(user: UserRegister, db=Depends(get_db)):
+async def register_user(user: UserRegister, db=Depends(get_async_db)):
     """
     회원가입 엔드포인트
     """
-    cursor = db.cursor(dictionary=True)
-    cursor.execute("SELECT user_id FROM users WHERE email=%s", (user.email,))
-    if cursor.fetchone():
-        cursor.close()
+    cursor = await db.cursor(DictCursor)
+    await cursor.execute("SELECT user_id FROM users WHERE email=%s", (user.email,))
+    if await cursor.fetchone():
+        await cursor.close()
         raise HTTPException(status_code=400, detail="Email already registered")
 
     from auth import base64_encode_password
     hashed_pw = base64_encode_password(user.password)
-    cursor.execute(
+    await cursor.execute(
         "INSERT INTO users(email, password_hash, name, phone, birth_date, status) VALUES (%s,%s,%s,%s,%s,'active')",
         (user.email, hashed_pw, user.name, user.phone, user.birth_date)
     )
-    db.commit()
+    await db.commit()
     user_id = cursor.lastrowid
-    cursor.close()
+    await cursor.close()
 
-    access_token = create_access_token(data={"sub": str(user_id)})
+    access_token = create_user_access_token({
+        "user_id": user_id, "email": user.email, "name": user.name,
+        "status": "active", "phone": user.phone, "birth_date": user.birth_date
+    })
     refresh_token = create_refresh_token(data={"sub": str(user_id)})
 
     return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
 
 @router.post("/login", response_model=Token, summary="로그인")
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db=Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db=Depends(get_async_db)):
     """
     로그인 엔드포인트
     """
     email = form_data.username
     password = form_data.password
 
-    cursor = db.cursor(dictionary=True)
-    cursor.execute("SELECT user_id, password_hash, status FROM users WHERE email=%s", (email,))
-    db_user = cursor.fetchone()
-    cursor.close()
+    cursor = await db.cursor(DictCursor)
+    await cursor.execute("SELECT user_id, password_hash, status, email, name, phone, birth_date FROM users WHERE email=%s", (email,))
+    db_user = await cursor.fetchone()
+    await cursor.close()
 
     if not db_user or db_user['status'] != 'active':
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -53,22 +61,22 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db=Depends(get_db)):
     if not verify_password(password, db_user['password_hash']):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    access_token = create_access_token(data={"sub": str(db_user['user_id'])})
+    access_token = create_user_access_token(db_user)
     refresh_token = create_refresh_token(data={"sub": str(db_user['user_id'])})
 
-    cursor = db.cursor()
-    cursor.execute("UPDATE users SET last_login=NOW() WHERE user_id=%s", (db_user['user_id'],))
-    db.commit()
-    cursor.close()
+    cursor = await db.cursor()
+    await cursor.execute("UPDATE users SET last_login=NOW() WHERE user_id=%s", (db_user['user_id'],))
+    await db.commit()
+    await cursor.close()
 
     return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
 
 @router.post("/refresh", response_model=Token, summary="토큰 갱신")
-def refresh_token(token: str = Body(...), db=Depends(get_db)):
+async def refresh_token(token: str = Body(...), db=Depends(get_async_db)):
     """
     리프레시 토큰을 통한 액세스 토큰 재발급
     """
-    from auth import create_access_token, create_refresh_token, SECRET_KEY, ALGORITHM
+    from auth import SECRET_KEY, ALGORITHM
     from jose import JWTError, jwt
 
     try:
@@ -84,15 +92,15 @@ def refresh_token(token: str = Body(...), db=Depends(get_db)):
         except ValueError:
             raise HTTPException(status_code=401, detail="Invalid token subject")
 
-        cursor = db.cursor(dictionary=True)
-        cursor.execute("SELECT user_id,status FROM users WHERE user_id=%s", (user_id,))
-        user = cursor.fetchone()
-        cursor.close()
+        cursor = await db.cursor(DictCursor)
+        await cursor.execute("SELECT user_id, email, name, status, phone, birth_date FROM users WHERE user_id=%s", (user_id,))
+        user = await cursor.fetchone()
+        await cursor.close()
 
         if not user or user['status'] != 'active':
             raise HTTPException(status_code=403, detail="User not active or does not exist")
 
-        access_token = create_access_token(data={"sub": str(user_id)})
+        access_token = create_user_access_token(user)
         new_refresh_token = create_refresh_token(data={"sub": str(user_id)})
         return {"access_token": access_token, "refresh_token": new_refresh_token, "token_type": "bearer"}
 
@@ -100,21 +108,36 @@ def refresh_token(token: str = Body(...), db=Depends(get_db)):
         raise HTTPException(status_code=401, detail="Invalid token.")
 
 @router.put("/profile", summary="회원 정보 수정")
-def update_profile(profile: UserProfile, current_user=Depends(get_current_user), db=Depends(get_db)):
+async def update_profile(profile: UserProfile, current_user=Depends(get_current_user), db=Depends(get_async_db)):
     """
-    회원 프로필 수정
+    회원 프로필 수정.
+    무상태 모드에서는 기존 토큰의 프로필 클레임이 바뀌지 않으므로 기존 토큰을 폐기하고
+    변경된 정보로 새 액세스 토큰을 발급해 함께 반환한다.
     """
-    cursor = db.cursor()
-    cursor.execute(
+    cursor = await db.cursor(DictCursor)
+    await cursor.execute(
         "UPDATE users SET name=%s, phone=%s, birth_date=%s WHERE user_id=%s",
         (profile.name, profile.phone, profile.birth_date, current_user['user_id'])
     )
-    db.commit()
-    cursor.close()
-    return {"detail": "Profile updated"}
+    await db.commit()
+    invalidate_cached_user(current_user['user_id'])
+    if not AUTH_STATELESS:
+        await cursor.close()
+        return {"detail": "Profile updated"}
+
+    revoke_user_tokens(current_user['user_id'])
+    await cursor.execute(
+        "SELECT user_id, email, name, status, phone, birth_date FROM users WHERE user_id=%s",
+        (current_user['user_id'],)
+    )
+    user = await cursor.fetchone()
+    await cursor.close()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return {"detail": "Profile updated", "access_token": create_user_access_token(user), "token_type": "bearer"}
 
 @router.get("/profile", summary="회원 정보 조회")
-def get_profile(current_user=Depends(get_current_user)):
+async def get_profile(current_user=Depends(get_current_user)):
     """
     현재 로그인한 사용자 정보 조회
     """
@@ -128,12 +151,14 @@ def get_profile(current_user=Depends(get_current_user)):
     }
 
 @router.delete("/delete", summary="회원 탈퇴")
-def delete_user(current_user=Depends(get_current_user), db=Depends(get_db)):
+async def delete_user(current_user=Depends(get_current_user), db=Depends(get_async_db)):
     """
     회원 탈퇴 (상태 inactive로 업데이트)
     """
-    cursor = db.cursor()
-    cursor.execute("UPDATE users SET status='inactive' WHERE user_id=%s", (current_user['user_id'],))
-    db.commit()
-    cursor.close()
+    cursor = await db.cursor()
+    await cursor.execute("UPDATE users SET status='inactive' WHERE user_id=%s", (current_user['user_id'],))
+    await db.commit()
+    await cursor.close()
+    invalidate_cached_user(current_user['user_id'])
+    revoke_user_tokens(current_user['user_id'])
     return {"detail": "User deactivated"}
@@ -1,50 +1,56 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from typing import Optional
-from database import get_db
+from aiomysql import DictCursor
+from database import get_async_db
 from auth import get_current_user
 from models import BookmarkToggle
+from pagination import encode_cursor, decode_cursor, keyset_condition
 
 router = APIRouter(tags=["bookmarks"], prefix="/bookmarks")
 
 @router.post("", summary="북마크 추가/제거")
-def toggle_bookmark(bm: BookmarkToggle, current_user=Depends(get_current_user), db=Depends(get_db)):
+async def toggle_bookmark(bm: BookmarkToggle, current_user=Depends(get_current_user), db=Depends(get_async_db)):
     """
     특정 공고에 북마크 추가 혹은 제거
     """
-    cursor = db.cursor(dictionary=True)
-    cursor.execute(
+    cursor = await db.cursor(DictCursor)
+    await cursor.execute(
         "SELECT bookmark_id FROM bookmarks WHERE user_id=%s AND posting_id=%s",
         (current_user['user_id'], bm.posting_id)
     )
-    existing = cursor.fetchone()
+    existing = await cursor.fetchone()
     if existing:
-        cursor.execute("DELETE FROM bookmarks WHERE bookmark_id=%s", (existing['bookmark_id'],))
-        db.commit()
-        cursor.close()
+        await cursor.execute("DELETE FROM bookmarks WHERE bookmark_id=%s", (existing['bookmark_id'],))
+        await db.commit()
+        await cursor.close()
         return {"detail": "Bookmark removed"}
     else:
-        cursor.execute(
+        await cursor.execute(
             "INSERT INTO bookmarks(user_id, posting_id) VALUES(%s,%s)",
             (current_user['user_id'], bm.posting_id)
         )
-        db.commit()
-        cursor.close()
+        await db.commit()
+        await cursor.close()
         return {"detail": "Bookmark added"}
 
 @router.get("", summary="북마크 목록 조회")
-def list_bookmarks(
+async def list_bookmarks(
+    response: Response,
     page: int = 1,
     sort: str = "desc",
+    page_cursor: Optional[str] = Query(None, alias="cursor", description="이전 응답의 X-Next-Cursor 헤더 값 (지정 시 page 무시)"),
     current_user=Depends(get_current_user),
-    db=Depends(get_db)
+    db=Depends(get_async_db)
 ):
     """
     로그인한 사용자의 북마크 목록 조회
+    다음 페이지 커서는 X-Next-Cursor 응답 헤더로 전달한다.
     """
     query = """
     SELECT 
         b.bookmark_id, 
         b.posting_id, 
+        b.created_at AS bookmarked_at,
         jp.title,
         jp.job_description,
         jp.experience_level,
@@ -66,21 +72,42 @@ def list_bookmarks(
     LEFT JOIN posting_categories pc ON jp.posting_id = pc.posting_id
     LEFT JOIN job_categories jc ON pc.category_id = jc.category_id
     WHERE b.user_id = %s
-    GROUP BY b.bookmark_id
     """
-    query += " ORDER BY b.created_at " + ("ASC" if sort == "asc" else "DESC")
+    params = [current_user['user_id']]
+
+    descending = sort != "asc"
+    cursor_kind = "bookmarks_desc" if descending else "bookmarks_asc"
+    if page_cursor:
+        last = decode_cursor(page_cursor, cursor_kind)
+        condition, values = keyset_condition("b.created_at", "b.bookmark_id", descending, last.get("v"), last.get("id"))
+        query += condition
+        params.extend(values)
+
+    direction = "DESC" if descending else "ASC"
+    query += f" GROUP BY b.bookmark_id ORDER BY b.created_at {direction}, b.bookmark_id {direction}"
 
     page_size = 20
-    offset = (page - 1) * page_size
-    query += f" LIMIT {page_size} OFFSET {offset}"
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    query += f" LIMIT {page_size + 1}"
+    if not page_cursor:
+        query += f" OFFSET {(page - 1) * page_size}"
 
-    cursor = db.cursor(dictionary=True)
-    cursor.execute(query, (current_user['user_id'],))
-    bookmarks = cursor.fetchall()
+    cursor = await db.cursor(DictCursor)
+    await cursor.execute(query, params)
+    bookmarks = await cursor.fetchall()
 
     for bookmark in bookmarks:
         bookmark['tech_stacks'] = bookmark['tech_stacks'].split(',') if bookmark['tech_stacks'] else []
         bookmark['job_categories'] = bookmark['job_categories'].split(',') if bookmark['job_categories'] else []
 
-    cursor.close()
+    await cursor.close()
+
+    has_next = len(bookmarks) > page_size
+    bookmarks = bookmarks[:page_size]
+    if has_next:
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            cursor_kind, v=bookmarks[-1]['bookmarked_at'], id=bookmarks[-1]['bookmark_id']
+        )
+    for bookmark in bookmarks:
+        bookmark.pop('bookmarked_at')
     return bookmarks
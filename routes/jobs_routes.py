@@ -1,13 +1,93 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
-from typing import Optional, List
-from database import get_db
-from models import JobCreate, JobUpdate
+import logging
+from collections import defaultdict
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from typing import Optional, List, Tuple
+from aiomysql import DictCursor
+from database import get_async_db, db_connection
+from models import JobCreate, JobUpdate, JobBulkCreate
 from auth import get_current_user, check_admin
+from pagination import encode_cursor, decode_cursor, keyset_condition
+from search import keyword_filter
+from config import FACET_INDEX_ENABLED, FACET_MAX_IN_LIST, RELATED_INDEX_ENABLED, JOB_BULK_MAX_ITEMS, JOB_BULK_CHUNK_SIZE
+from facet_index import facet_index, build_id_set, intersect_ids
+from job_sync import postings_changed, job_list_cache, job_count_cache
+from view_counter import view_counter
+from related_index import related_index
+from lookups import lookups, location_key
 
 router = APIRouter(tags=["jobs"], prefix="/jobs")
 
+logger = logging.getLogger("api_logger")
+
+# 정렬 기준: (정렬 컬럼, 내림차순 여부). 동일 값은 posting_id로 순서를 고정한다.
+# relevance는 키워드 검색 시에만 사용 가능하며 관련도 점수 내림차순으로 정렬한다.
+JOB_SORTS = {
+    "created_at_desc": ("jp.created_at", True),
+    "created_at_asc": ("jp.created_at", False),
+    "view_count_desc": ("jp.view_count", True),
+}
+
+# 채용 공고 등록 쿼리 (VALUES에 JOB_POSTING_VALUES를 행 수만큼 넣어 사용)
+JOB_POSTING_INSERT = """
+INSERT INTO job_postings(
+    company_id, title, job_description, experience_level,
+    education_level, employment_type, salary_info,
+    location_id, deadline_date, status, view_count
+) VALUES {values}
+"""
+JOB_POSTING_VALUES = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, 'active', 0)"
+
+# 목록 항목 조회 쿼리 (페이지에 해당하는 posting_id에 대해서만 GROUP_CONCAT 수행)
+JOB_LIST_QUERY = """
+SELECT
+    jp.posting_id,
+    c.name AS company_name,
+    jp.title,
+    jp.job_description,
+    jp.experience_level,
+    jp.education_level,
+    jp.employment_type,
+    jp.salary_info,
+    CONCAT(l.city, ' ', COALESCE(l.district, '')) AS location,
+    jp.deadline_date,
+    jp.view_count,
+    GROUP_CONCAT(DISTINCT ts.name) AS tech_stacks,
+    GROUP_CONCAT(DISTINCT jc.name) AS job_categories
+FROM job_postings jp
+JOIN companies c ON jp.company_id = c.company_id
+LEFT JOIN locations l ON jp.location_id = l.location_id
+LEFT JOIN posting_tech_stacks pts ON jp.posting_id = pts.posting_id
+LEFT JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
+LEFT JOIN posting_categories pc ON jp.posting_id = pc.posting_id
+LEFT JOIN job_categories jc ON pc.category_id = jc.category_id
+WHERE jp.posting_id IN ({placeholders})
+GROUP BY jp.posting_id
+"""
+
+async def fetch_job_list_items(cursor, posting_ids: List[int]) -> List[dict]:
+    """
+    posting_id 목록에 해당하는 목록 항목을 조회하여 주어진 순서대로 반환
+    """
+    if not posting_ids:
+        return []
+    placeholders = ','.join(['%s'] * len(posting_ids))
+    await cursor.execute(JOB_LIST_QUERY.format(placeholders=placeholders), posting_ids)
+    rows = {row['posting_id']: row for row in await cursor.fetchall()}
+
+    jobs = []
+    for posting_id in posting_ids:
+        job = rows.get(posting_id)
+        if not job:
+            continue
+        job['tech_stacks'] = job['tech_stacks'].split(',') if job['tech_stacks'] else []
+        job['job_categories'] = job['job_categories'].split(',') if job['job_categories'] else []
+        jobs.append(job)
+    return jobs
+
 @router.get("", summary="채용 공고 조회")
-def list_jobs(
+async def list_jobs(
     keyword: Optional[str] = Query(None),
     company: Optional[str] = Query(None),
     employment_type: Optional[str] = Query(None),
@@ -16,135 +96,246 @@ def list_jobs(
     location: Optional[str] = Query(None),
     job_categories: Optional[List[str]] = Query(None),
     tech_stacks: Optional[List[str]] = Query(None),
-    sort: Optional[str] = Query("created_at_desc"),
+    sort: Optional[str] = Query(None, description="created_at_desc, created_at_asc, view_count_desc, relevance(키워드 검색 시). 기본값은 키워드 검색 시 relevance, 그 외 created_at_desc"),
     page: int = 1,
-    db=Depends(get_db)
+    page_cursor: Optional[str] = Query(None, alias="cursor", description="이전 응답의 X-Next-Cursor 헤더 값 (지정 시 page 무시)"),
+    include_facets: bool = Query(False, description="결과 집합의 facet 값별 공고 수 포함 여부"),
+    include_total: bool = Query(True, description="false이면 total_count/total_pages를 계산하지 않음 (다음 페이지 여부는 has_next로 확인)"),
 ):
     """
     다양한 조건으로 채용 공고 목록 조회 (페이지네이션 정보 포함)
+    같은 조건의 응답은 캐시하며 공고가 변경되면 캐시를 비운다.
+    다음 페이지 커서는 X-Next-Cursor 응답 헤더로 전달한다.
     """
-    page_size = 20
-    offset = (page - 1) * page_size
-
-    # Base query (for data)
-    base_query = """
-    SELECT DISTINCT
-        jp.posting_id,
-        c.name AS company_name,
-        jp.title,
-        jp.job_description,
-        jp.experience_level,
-        jp.education_level,
-        jp.employment_type,
-        jp.salary_info,
-        CONCAT(l.city, ' ', COALESCE(l.district, '')) AS location,
-        jp.deadline_date,
-        jp.view_count,
-        GROUP_CONCAT(DISTINCT ts.name) AS tech_stacks,
-        GROUP_CONCAT(DISTINCT jc.name) AS job_categories
-    FROM job_postings jp
-    JOIN companies c ON jp.company_id = c.company_id
-    LEFT JOIN locations l ON jp.location_id = l.location_id
-    LEFT JOIN posting_tech_stacks pts ON jp.posting_id = pts.posting_id
-    LEFT JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
-    LEFT JOIN posting_categories pc ON jp.posting_id = pc.posting_id
-    LEFT JOIN job_categories jc ON pc.category_id = jc.category_id
-    WHERE jp.status = 'active'
+    # 동일한 조회 조건이 같은 캐시 키가 되도록 정규화
+    def normalize(value: Optional[str]) -> Optional[str]:
+        return (value.strip() or None) if value is not None else None
+
+    keyword = normalize(keyword)
+    if sort is None:
+        sort = "relevance" if keyword else "created_at_desc"
+    filters = {
+        "keyword": keyword,
+        "company": normalize(company),
+        "employment_type": normalize(employment_type),
+        "position": normalize(position),
+        "salary_info": normalize(salary_info),
+        "location": normalize(location),
+        "job_categories": (sorted({v.strip() for v in job_categories if v.strip()}) or None) if job_categories else None,
+        "tech_stacks": (sorted({v.strip() for v in tech_stacks if v.strip()}) or None) if tech_stacks else None,
+        "sort": sort if sort in JOB_SORTS or (sort == "relevance" and keyword) else "created_at_desc",
+        "page": 1 if page_cursor else max(page, 1),
+        "page_cursor": page_cursor,
+        "include_facets": include_facets,
+        "include_total": include_total,
+    }
+    cache_key = tuple((name, tuple(value) if isinstance(value, list) else value) for name, value in filters.items())
+
+    async def compute() -> Tuple[bytes, Optional[str]]:
+        async with db_connection() as db:
+            result = await query_job_list(db, **filters)
+        next_cursor = result.pop("next_cursor")
+        return JSONResponse(content=jsonable_encoder(result)).body, next_cursor
+
+    body, next_cursor = await job_list_cache.get_or_compute(cache_key, compute, sizeof=lambda value: len(value[0]))
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def query_job_list(
+    db,
+    keyword: Optional[str],
+    company: Optional[str],
+    employment_type: Optional[str],
+    position: Optional[str],
+    salary_info: Optional[str],
+    location: Optional[str],
+    job_categories: Optional[List[str]],
+    tech_stacks: Optional[List[str]],
+    sort: str,
+    page: int,
+    page_cursor: Optional[str],
+    include_facets: bool,
+    include_total: bool
+) -> dict:
     """
+    다양한 조건으로 채용 공고 목록 조회
+    cursor를 지정하면 OFFSET 대신 마지막으로 조회한 행 이후부터 조회한다.
+    관련도 정렬 커서는 검색어별로 값이 달라지므로 검색어를 함께 기록하고, 다른 검색어의 커서는 거부한다.
+    기술 스택/직무 카테고리/지역/고용 형태 필터는 facet 인덱스가 준비된 경우 정렬된 posting_id 배열 연산으로 처리한다.
+    """
+    page_size = 20
 
-    # 동일한 조건으로 total_count를 구하기 위한 쿼리 (COUNT DISTINCT)
-    count_query = """
-    SELECT COUNT(DISTINCT jp.posting_id) AS total_count
+    # 필터 조건 (페이지 id 조회와 total_count 조회에 공통 사용)
+    # 태그 필터는 EXISTS로 처리하여 조인으로 행이 늘어나지 않도록 함
+    from_clause = """
     FROM job_postings jp
     JOIN companies c ON jp.company_id = c.company_id
     LEFT JOIN locations l ON jp.location_id = l.location_id
-    LEFT JOIN posting_tech_stacks pts ON jp.posting_id = pts.posting_id
-    LEFT JOIN tech_stacks ts ON pts.stack_id = ts.stack_id
-    LEFT JOIN posting_categories pc ON jp.posting_id = pc.posting_id
-    LEFT JOIN job_categories jc ON pc.category_id = jc.category_id
-    WHERE jp.status = 'active'
     """
-
+    where_clause = " WHERE jp.status = 'active'"
     params = []
 
     # 조건절 구성
     def add_condition(condition_str, values):
-        nonlocal base_query, count_query, params
-        base_query += condition_str
-        count_query += condition_str
+        nonlocal where_clause
+        where_clause += condition_str
         params.extend(values)
 
+    relevance = None
     if keyword:
-        add_condition(" AND (jp.title LIKE %s OR jp.job_description LIKE %s)", [f"%{keyword}%", f"%{keyword}%"])
+        condition, values, relevance = keyword_filter(keyword)
+        add_condition(condition, values)
     if company:
         add_condition(" AND c.name LIKE %s", [f"%{company}%"])
-    if employment_type:
-        add_condition(" AND jp.employment_type = %s", [employment_type])
     if position:
         add_condition(" AND jp.title LIKE %s", [f"%{position}%"])
     if salary_info:
         add_condition(" AND jp.salary_info LIKE %s", [f"%{salary_info}%"])
-    if location:
-        add_condition(" AND (l.city LIKE %s OR l.district LIKE %s)", [f"%{location}%", f"%{location}%"])
-    if tech_stacks:
-        placeholders = ','.join(['%s'] * len(tech_stacks))
-        add_condition(f" AND ts.name IN ({placeholders})", tech_stacks)
-    if job_categories:
-        placeholders = ','.join(['%s'] * len(job_categories))
-        add_condition(f" AND jc.name IN ({placeholders})", job_categories)
-
-    # GROUP BY와 정렬 조건
-    base_query += " GROUP BY jp.posting_id"
-    if sort == "created_at_desc":
-        base_query += " ORDER BY jp.created_at DESC"
-    elif sort == "created_at_asc":
-        base_query += " ORDER BY jp.created_at ASC"
-    elif sort == "view_count_desc":
-        base_query += " ORDER BY jp.view_count DESC"
+    # facet 인덱스로 처리할 수 없는 조건이 있는지 여부
+    has_sql_filters = bool(params)
+
+    # facet 필터: 같은 facet 안에서는 OR, facet 간에는 AND
+    facet_filters = {
+        name: values for name, values in (
+            ("tech_stacks", tech_stacks),
+            ("job_categories", job_categories),
+            ("location", [location] if location else None),
+            ("employment_type", [employment_type] if employment_type else None),
+        ) if values
+    }
+    use_facet_index = FACET_INDEX_ENABLED and facet_index.ready
+    facet_result = facet_index.match(facet_filters) if use_facet_index else None
+    facet_ids = None
+    if facet_result is not None and facet_filters and len(facet_result) <= FACET_MAX_IN_LIST:
+        # 결과가 너무 많으면 IN 목록 대신 SQL 조건으로 필터
+        facet_ids = facet_result.tolist()
+
+    if facet_ids is not None:
+        if facet_ids:
+            add_condition(f" AND jp.posting_id IN ({','.join(['%s'] * len(facet_ids))})", facet_ids)
+        else:
+            add_condition(" AND 1 = 0", [])
     else:
-        # 기본 정렬 기준 없을 경우 created_at DESC로
-        base_query += " ORDER BY jp.created_at DESC"
+        if employment_type:
+            add_condition(" AND jp.employment_type = %s", [employment_type])
+        if location:
+            add_condition(" AND (l.city LIKE %s OR l.district LIKE %s)", [f"%{location}%", f"%{location}%"])
+        if tech_stacks:
+            placeholders = ','.join(['%s'] * len(tech_stacks))
+            add_condition(
+                " AND EXISTS (SELECT 1 FROM posting_tech_stacks pts JOIN tech_stacks ts ON pts.stack_id = ts.stack_id"
+                f" WHERE pts.posting_id = jp.posting_id AND ts.name IN ({placeholders}))",
+                tech_stacks
+            )
+        if job_categories:
+            placeholders = ','.join(['%s'] * len(job_categories))
+            add_condition(
+                " AND EXISTS (SELECT 1 FROM posting_categories pc JOIN job_categories jc ON pc.category_id = jc.category_id"
+                f" WHERE pc.posting_id = jp.posting_id AND jc.name IN ({placeholders}))",
+                job_categories
+            )
 
-    # 페이지네이션
-    base_query += f" LIMIT {page_size} OFFSET {offset}"
+    # 동일한 조건으로 total_count를 구하기 위한 쿼리
+    count_query = "SELECT COUNT(*) AS total_count" + from_clause + where_clause
 
-    cursor = db.cursor(dictionary=True)
+    # 정렬 기준 결정
+    if sort == "relevance" and relevance:
+        sort_column, sort_params = relevance
+        descending = True
+    else:
+        if sort not in JOB_SORTS:
+            # 기본 정렬 기준 없을 경우 created_at DESC로
+            sort = "created_at_desc"
+        sort_column, descending = JOB_SORTS[sort]
+        sort_params = []
+
+    # 페이지에 해당하는 posting_id만 정렬 인덱스를 따라 조회
+    page_query = f"SELECT jp.posting_id, {sort_column} AS sort_value" + from_clause + where_clause
+    page_params = sort_params + params
+    if page_cursor:
+        last = decode_cursor(page_cursor, sort)
+        if sort_params and last.get("q") != keyword:
+            raise HTTPException(status_code=400, detail="Cursor does not match the requested keyword")
+        condition, values = keyset_condition(
+            sort_column, "jp.posting_id", descending, last.get("v"), last.get("id"), sort_params
+        )
+        page_query += condition
+        page_params.extend(values)
+    direction = "DESC" if descending else "ASC"
+    # 컬럼 정렬은 인덱스 순서를 그대로 쓰도록 컬럼명으로, 관련도 식은 별칭으로 정렬
+    order_by = "sort_value" if sort_params else sort_column
+    page_query += f" ORDER BY {order_by} {direction}, jp.posting_id {direction}"
 
-    # total_count 구하기
-    cursor.execute(count_query, params)
-    total_count_result = cursor.fetchone()
-    total_count = total_count_result['total_count'] if total_count_result else 0
+    # 페이지네이션 (다음 페이지 존재 여부 확인을 위해 한 행 더 조회)
+    page_query += f" LIMIT {page_size + 1}"
+    if not page_cursor:
+        page_query += f" OFFSET {(page - 1) * page_size}"
 
-    # 실제 데이터 조회
-    cursor.execute(base_query, params)
-    jobs = cursor.fetchall()
+    cursor = await db.cursor(DictCursor)
 
-    for job in jobs:
-        job['tech_stacks'] = job['tech_stacks'].split(',') if job['tech_stacks'] else []
-        job['job_categories'] = job['job_categories'].split(',') if job['job_categories'] else []
-
-    cursor.close()
+    # total_count 구하기
+    # facet 조건만 있는 경우 facet 인덱스 결과 건수를, 그 외에는 필터 조건별로 캐시한 COUNT 결과를 사용
+    total_count = None
+    if include_total:
+        if facet_result is not None and not has_sql_filters:
+            total_count = len(facet_result)
+        else:
+            count_key = (
+                keyword, company, employment_type, position, salary_info, location,
+                tuple(job_categories or ()), tuple(tech_stacks or ())
+            )
+            total_count = job_count_cache.get(count_key)
+            if total_count is None:
+                await cursor.execute(count_query, params)
+                total_count_result = await cursor.fetchone()
+                total_count = total_count_result['total_count'] if total_count_result else 0
+                job_count_cache.set(count_key, total_count)
 
-    total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
+    # 실제 데이터 조회
+    await cursor.execute(page_query, page_params)
+    page_rows = await cursor.fetchall()
+    has_next = len(page_rows) > page_size
+    page_rows = page_rows[:page_size]
+    jobs = await fetch_job_list_items(cursor, [row['posting_id'] for row in page_rows])
+
+    # facet 값별 공고 수
+    facets = None
+    if include_facets and facet_result is not None:
+        result_ids = facet_result
+        if has_sql_filters:
+            await cursor.execute("SELECT jp.posting_id" + from_clause + where_clause, params)
+            result_ids = intersect_ids(result_ids, build_id_set(row['posting_id'] for row in await cursor.fetchall()))
+        facets = facet_index.counts(result_ids)
+
+    await cursor.close()
+
+    next_cursor = None
+    if has_next:
+        last_row = page_rows[-1]
+        cursor_values = {"q": keyword} if sort_params else {}
+        next_cursor = encode_cursor(sort, v=last_row['sort_value'], id=last_row['posting_id'], **cursor_values)
+
+    total_pages = None
+    if total_count is not None:
+        total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
 
     return {
         "items": jobs,
         "total_count": total_count,
         "total_pages": total_pages,
         "page_size": page_size,
-        "current_page": page
+        "current_page": page,
+        "has_next": has_next,
+        "next_cursor": next_cursor,
+        "facets": facets
     }
 
 @router.get("/{id}", summary="채용 공고 상세 조회")
-def get_job_detail(id: int = Path(...), db=Depends(get_db)):
+async def get_job_detail(id: int = Path(...), db=Depends(get_async_db)):
     """
     특정 채용 공고 상세 정보 조회 및 연관 공고 조회
     """
-    cursor = db.cursor(dictionary=True)
-    # 조회수 증가
-    cursor.execute("UPDATE job_postings SET view_count = view_count + 1 WHERE posting_id = %s", (id,))
-    db.commit()
-
+    cursor = await db.cursor(DictCursor)
     query = """
     SELECT 
         jp.*,
@@ -163,16 +354,26 @@ def get_job_detail(id: int = Path(...), db=Depends(get_db)):
     WHERE jp.posting_id = %s AND jp.status != 'deleted'
     GROUP BY jp.posting_id
     """
-    cursor.execute(query, (id,))
-    job = cursor.fetchone()
+    await cursor.execute(query, (id,))
+    job = await cursor.fetchone()
 
     if not job:
-        cursor.close()
+        await cursor.close()
         raise HTTPException(status_code=404, detail="Job not found")
 
+    # 조회수 증가 (버퍼에 누적 후 일괄 반영, 응답에는 반영 대기 중인 조회수 포함)
+    view_counter.increment(id)
+    job['view_count'] += view_counter.pending(id)
+
     job['tech_stacks'] = job['tech_stacks'].split(',') if job['tech_stacks'] else []
     job['job_categories'] = job['job_categories'].split(',') if job['job_categories'] else []
 
+    # 미리 계산한 연관 공고 사용, 인덱스에 없는 공고(비활성 공고 등)는 DB에서 조회
+    related = related_index.related(id) if RELATED_INDEX_ENABLED else None
+    if related is not None:
+        await cursor.close()
+        return {"job": job, "related": related}
+
     related_query = """
     SELECT DISTINCT jp.posting_id, jp.title, c.name as company_name
     FROM job_postings jp
@@ -194,37 +395,55 @@ def get_job_detail(id: int = Path(...), db=Depends(get_db)):
     LIMIT 5
     """
 
-    cursor.execute(related_query, (id, job['company_id'], id))
-    related = cursor.fetchall()
-    cursor.close()
+    await cursor.execute(related_query, (id, job['company_id'], id))
+    related = await cursor.fetchall()
+    await cursor.close()
 
     return {"job": job, "related": related}
 
+async def resolve_posting_links(db, tech_stacks: Optional[List[str]], job_categories: Optional[List[str]]) -> Tuple[List[int], List[int]]:
+    """
+    공고에 연결할 기술 스택/직무 카테고리 id 목록 (사전 테이블에 없는 이름은 추가).
+    없는 이름은 요청 커넥션에서 바로 커밋되므로 공고를 쓰기 전에 호출한다.
+    """
+    stack_ids, category_ids = [], []
+    if tech_stacks:
+        ids = await lookups.resolve(db, "tech_stacks", tech_stacks)
+        stack_ids = list(dict.fromkeys(ids[name.lower()] for name in tech_stacks))
+    if job_categories:
+        ids = await lookups.resolve(db, "job_categories", job_categories)
+        category_ids = list(dict.fromkeys(ids[name.lower()] for name in job_categories))
+    return stack_ids, category_ids
+
+async def insert_posting_links(cursor, posting_id: int, stack_ids: List[int], category_ids: List[int]):
+    """
+    공고의 기술 스택/직무 카테고리 연결 행 추가
+    """
+    if stack_ids:
+        await cursor.executemany(
+            "INSERT INTO posting_tech_stacks (posting_id, stack_id) VALUES (%s, %s)",
+            [(posting_id, stack_id) for stack_id in stack_ids]
+        )
+    if category_ids:
+        await cursor.executemany(
+            "INSERT INTO posting_categories (posting_id, category_id) VALUES (%s, %s)",
+            [(posting_id, category_id) for category_id in category_ids]
+        )
+
 @router.post("", summary="채용 공고 등록")
-def create_job(job: JobCreate, current_user=Depends(check_admin), db=Depends(get_db)):
+async def create_job(job: JobCreate, current_user=Depends(check_admin), db=Depends(get_async_db)):
     """
     관리자 전용 채용 공고 등록
     """
-    cursor = db.cursor(dictionary=True)
+    cursor = await db.cursor(DictCursor)
     try:
+        # 사전 테이블 조회/추가는 요청 커넥션에서 커밋되므로 공고를 쓰기 전에 처리
         location_id = None
         if job.location:
-            cursor.execute(
-                "SELECT location_id FROM locations WHERE city = %s AND (district = %s OR (district IS NULL AND %s IS NULL))",
-                (job.location.city, job.location.district, job.location.district)
-            )
-            location_result = cursor.fetchone()
-
-            if location_result:
-                location_id = location_result['location_id']
-            else:
-                cursor.execute(
-                    "INSERT INTO locations (city, district) VALUES (%s, %s)",
-                    (job.location.city, job.location.district)
-                )
-                location_id = cursor.lastrowid
+            location_id = await lookups.location_id(db, job.location.city, job.location.district)
+        stack_ids, category_ids = await resolve_posting_links(db, job.tech_stacks, job.job_categories)
 
-        cursor.execute(
+        await cursor.execute(
             """
             INSERT INTO job_postings(
                 company_id, title, job_description, experience_level,
@@ -241,59 +460,175 @@ def create_job(job: JobCreate, current_user=Depends(check_admin), db=Depends(get
         )
         posting_id = cursor.lastrowid
 
-        # 기술 스택 처리
-        if job.tech_stacks:
-            for tech in job.tech_stacks:
-                cursor.execute("SELECT stack_id FROM tech_stacks WHERE name = %s", (tech,))
-                result = cursor.fetchone()
-                if not result:
-                    cursor.execute("INSERT INTO tech_stacks (name, category) VALUES (%s, 'Other')", (tech,))
-                    stack_id = cursor.lastrowid
-                else:
-                    stack_id = result['stack_id']
-
-                cursor.execute(
-                    "INSERT INTO posting_tech_stacks (posting_id, stack_id) VALUES (%s, %s)",
-                    (posting_id, stack_id)
-                )
-
-        # 직무 카테고리 처리
-        if job.job_categories:
-            for category in job.job_categories:
-                cursor.execute("SELECT category_id FROM job_categories WHERE name = %s", (category,))
-                result = cursor.fetchone()
-                if not result:
-                    cursor.execute("INSERT INTO job_categories (name) VALUES (%s)", (category,))
-                    category_id = cursor.lastrowid
-                else:
-                    category_id = result['category_id']
-
-                cursor.execute(
-                    "INSERT INTO posting_categories (posting_id, category_id) VALUES (%s, %s)",
-                    (posting_id, category_id)
-                )
-
-        db.commit()
+        # 기술 스택, 직무 카테고리 처리
+        await insert_posting_links(cursor, posting_id, stack_ids, category_ids)
+
+        await db.commit()
+        await postings_changed(db, [posting_id])
         return {"detail": "Job posting created successfully", "posting_id": posting_id}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        cursor.close()
+        await cursor.close()
+
+def job_posting_params(job: JobCreate, location_ids: dict) -> tuple:
+    return (
+        job.company_id, job.title, job.job_description,
+        job.experience_level, job.education_level,
+        job.employment_type, job.salary_info,
+        location_ids[location_key(job.location.city, job.location.district)] if job.location else None,
+        job.deadline_date
+    )
+
+async def insert_job_postings(cursor, jobs: List[JobCreate], location_ids: dict) -> List:
+    """
+    채용 공고를 현재 트랜잭션 안에서 다중 행 INSERT 한 번으로 등록하고 공고별 posting_id를 요청 순서대로 반환.
+    다중 행 INSERT의 AUTO_INCREMENT 값은 innodb_autoinc_lock_mode=2(MySQL 8 기본값)에서 연속이 보장되지 않으므로
+    lastrowid(첫 번째 id) 이후의 행을 (company_id, title)로 다시 조회해 id를 찾는다.
+    같은 문장의 id는 행 순서대로 증가하므로, 같은 회사/제목의 공고가 여러 개이면 요청 순서와 id 순서로 짝짓는다.
+    다중 행 INSERT가 실패하면(문장 단위로 전체가 취소됨) insert_job_postings_by_row로 한 행씩 다시 등록한다.
+    """
+    params = []
+    for job in jobs:
+        params.extend(job_posting_params(job, location_ids))
+    try:
+        await cursor.execute(JOB_POSTING_INSERT.format(values=', '.join([JOB_POSTING_VALUES] * len(jobs))), params)
+    except Exception as e:
+        logger.warning(f"Multi-row job posting insert failed, inserting {len(jobs)} rows one by one: {e}")
+        return await insert_job_postings_by_row(cursor, jobs, location_ids)
+
+    company_ids = list({job.company_id for job in jobs})
+    await cursor.execute(
+        f"""
+        SELECT posting_id, company_id, title FROM job_postings
+        WHERE posting_id >= %s AND company_id IN ({','.join(['%s'] * len(company_ids))})
+        ORDER BY posting_id
+        """,
+        [cursor.lastrowid, *company_ids]
+    )
+    new_ids = defaultdict(list)
+    for row in await cursor.fetchall():
+        new_ids[(row['company_id'], row['title'])].append(row['posting_id'])
+    ordinals = defaultdict(int)
+    posting_ids = []
+    for job in jobs:
+        key = (job.company_id, job.title)
+        posting_ids.append(new_ids[key][ordinals[key]])
+        ordinals[key] += 1
+    return posting_ids
+
+async def insert_job_postings_by_row(cursor, jobs: List[JobCreate], location_ids: dict) -> List:
+    """
+    채용 공고를 한 행씩 등록하고 공고별 posting_id(실패 시 예외)를 요청 순서대로 반환.
+    실패한 행은 SAVEPOINT로 그 행만 되돌려 나머지 행은 계속 등록한다 (다중 행 INSERT 실패 시 사용).
+    """
+    results = []
+    for job in jobs:
+        await cursor.execute("SAVEPOINT job_row")
+        try:
+            await cursor.execute(JOB_POSTING_INSERT.format(values=JOB_POSTING_VALUES), job_posting_params(job, location_ids))
+        except Exception as e:
+            await cursor.execute("ROLLBACK TO SAVEPOINT job_row")
+            results.append(e)
+            continue
+        results.append(cursor.lastrowid)
+    return results
+
+@router.post("/bulk", summary="채용 공고 일괄 등록")
+async def create_jobs_bulk(payload: JobBulkCreate, current_user=Depends(check_admin), db=Depends(get_async_db)):
+    """
+    관리자 전용 채용 공고 일괄 등록. JOB_BULK_CHUNK_SIZE개 단위로 커밋하며 공고별 결과를 요청 순서대로 반환
+    """
+    jobs = payload.jobs
+    if len(jobs) > JOB_BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Too many job postings (max {JOB_BULK_MAX_ITEMS})")
+
+    results = [None] * len(jobs)
+    cursor = await db.cursor(DictCursor)
+    try:
+        # 회사 존재 여부 확인
+        existing_companies = set()
+        company_ids = list({job.company_id for job in jobs})
+        if company_ids:
+            placeholders = ','.join(['%s'] * len(company_ids))
+            await cursor.execute(f"SELECT company_id FROM companies WHERE company_id IN ({placeholders})", company_ids)
+            existing_companies = {row['company_id'] for row in await cursor.fetchall()}
+        valid = []
+        for index, job in enumerate(jobs):
+            if job.company_id in existing_companies:
+                valid.append(index)
+            else:
+                results[index] = {"index": index, "status": "error", "detail": "Company not found"}
+
+        # 지역, 기술 스택, 직무 카테고리를 한 번에 조회/추가
+        try:
+            location_ids = await lookups.resolve_locations(
+                db, [(jobs[i].location.city, jobs[i].location.district) for i in valid if jobs[i].location]
+            )
+            stack_ids = await lookups.resolve(db, "tech_stacks", [name for i in valid for name in jobs[i].tech_stacks or []])
+            category_ids = await lookups.resolve(db, "job_categories", [name for i in valid for name in jobs[i].job_categories or []])
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+        created = []
+        for start in range(0, len(valid), JOB_BULK_CHUNK_SIZE):
+            chunk = valid[start:start + JOB_BULK_CHUNK_SIZE]
+            try:
+                inserted = await insert_job_postings(cursor, [jobs[i] for i in chunk], location_ids)
+                stack_rows, category_rows, chunk_created = [], [], []
+                for index, posting_id in zip(chunk, inserted):
+                    if isinstance(posting_id, Exception):
+                        results[index] = {"index": index, "status": "error", "detail": str(posting_id)}
+                        continue
+                    chunk_created.append((index, posting_id))
+                    job = jobs[index]
+                    stack_rows.extend((posting_id, stack_id) for stack_id in dict.fromkeys(stack_ids[name.lower()] for name in job.tech_stacks or []))
+                    category_rows.extend((posting_id, category_id) for category_id in dict.fromkeys(category_ids[name.lower()] for name in job.job_categories or []))
+                if stack_rows:
+                    await cursor.executemany("INSERT INTO posting_tech_stacks (posting_id, stack_id) VALUES (%s, %s)", stack_rows)
+                if category_rows:
+                    await cursor.executemany("INSERT INTO posting_categories (posting_id, category_id) VALUES (%s, %s)", category_rows)
+                await db.commit()
+            except Exception as e:
+                # 공고 행 이후 단계(연결 정보 등록, 커밋) 실패는 청크 전체가 롤백됨
+                await db.rollback()
+                for index in chunk:
+                    if results[index] is None:
+                        results[index] = {"index": index, "status": "error", "detail": str(e)}
+                continue
+            for index, posting_id in chunk_created:
+                results[index] = {"index": index, "status": "created", "posting_id": posting_id}
+                created.append(posting_id)
+
+        if created:
+            # 공고는 이미 커밋되었으므로 캐시/인덱스 갱신 실패는 응답에 반영하지 않음
+            try:
+                await postings_changed(db, created)
+            except Exception as e:
+                logger.error(f"Failed to apply bulk created postings {created}: {e}")
+        return {"created": len(created), "failed": len(jobs) - len(created), "results": results}
+    finally:
+        await cursor.close()
 
 @router.put("/{id}", summary="채용 공고 수정")
-def update_job(id: int, job: JobUpdate, current_user=Depends(check_admin), db=Depends(get_db)):
+async def update_job(id: int, job: JobUpdate, current_user=Depends(check_admin), db=Depends(get_async_db)):
     """
     관리자 전용 채용 공고 수정
     """
-    cursor = db.cursor(dictionary=True)
+    cursor = await db.cursor(DictCursor)
     try:
-        cursor.execute("SELECT posting_id FROM job_postings WHERE posting_id = %s", (id,))
-        existing_job = cursor.fetchone()
+        await cursor.execute("SELECT posting_id FROM job_postings WHERE posting_id = %s", (id,))
+        existing_job = await cursor.fetchone()
         if not existing_job:
             raise HTTPException(status_code=404, detail="Job posting not found")
 
+        # 사전 테이블 조회/추가는 요청 커넥션에서 커밋되므로 공고를 쓰기 전에 처리
         updates = {}
+        if job.location:
+            updates["location_id"] = await lookups.location_id(db, job.location.city, job.location.district)
+        stack_ids, category_ids = await resolve_posting_links(db, job.tech_stacks, job.job_categories)
+
         if job.title is not None:
             updates["title"] = job.title
         if job.job_description is not None:
@@ -311,73 +646,35 @@ def update_job(id: int, job: JobUpdate, current_user=Depends(check_admin), db=De
         if job.status is not None:
             updates["status"] = job.status.value
 
-        if job.location:
-            cursor.execute(
-                "SELECT location_id FROM locations WHERE city = %s AND (district = %s OR (district IS NULL AND %s IS NULL))",
-                (job.location.city, job.location.district, job.location.district)
-            )
-            location_result = cursor.fetchone()
-            if location_result:
-                updates["location_id"] = location_result['location_id']
-            else:
-                cursor.execute(
-                    "INSERT INTO locations (city, district) VALUES (%s, %s)",
-                    (job.location.city, job.location.district)
-                )
-                updates["location_id"] = cursor.lastrowid
-
         if updates:
             set_clause = ", ".join(f"{key} = %s" for key in updates)
-            cursor.execute(f"UPDATE job_postings SET {set_clause} WHERE posting_id = %s",
+            await cursor.execute(f"UPDATE job_postings SET {set_clause} WHERE posting_id = %s",
                            list(updates.values()) + [id])
 
-        # 기술 스택 재설정
+        # 기술 스택, 직무 카테고리 재설정
         if job.tech_stacks is not None:
-            cursor.execute("DELETE FROM posting_tech_stacks WHERE posting_id = %s", (id,))
-            for tech in job.tech_stacks:
-                cursor.execute("SELECT stack_id FROM tech_stacks WHERE name = %s", (tech,))
-                result = cursor.fetchone()
-                if not result:
-                    cursor.execute("INSERT INTO tech_stacks (name) VALUES (%s)", (tech,))
-                    stack_id = cursor.lastrowid
-                else:
-                    stack_id = result['stack_id']
-                cursor.execute(
-                    "INSERT INTO posting_tech_stacks (posting_id, stack_id) VALUES (%s, %s)",
-                    (id, stack_id)
-                )
-
-        # 직무 카테고리 재설정
+            await cursor.execute("DELETE FROM posting_tech_stacks WHERE posting_id = %s", (id,))
         if job.job_categories is not None:
-            cursor.execute("DELETE FROM posting_categories WHERE posting_id = %s", (id,))
-            for category in job.job_categories:
-                cursor.execute("SELECT category_id FROM job_categories WHERE name = %s", (category,))
-                result = cursor.fetchone()
-                if not result:
-                    cursor.execute("INSERT INTO job_categories (name) VALUES (%s)", (category,))
-                    category_id = cursor.lastrowid
-                else:
-                    category_id = result['category_id']
-                cursor.execute(
-                    "INSERT INTO posting_categories (posting_id, category_id) VALUES (%s, %s)",
-                    (id, category_id)
-                )
-
-        db.commit()
+            await cursor.execute("DELETE FROM posting_categories WHERE posting_id = %s", (id,))
+        await insert_posting_links(cursor, id, stack_ids, category_ids)
+
+        await db.commit()
+        await postings_changed(db, [id])
         return {"detail": "Job posting updated successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        cursor.close()
+        await cursor.close()
 
 @router.delete("/{id}", summary="채용 공고 삭제")
-def delete_job(id: int, current_user=Depends(check_admin), db=Depends(get_db)):
+async def delete_job(id: int, current_user=Depends(check_admin), db=Depends(get_async_db)):
     """
     관리자 전용 채용 공고 삭제 (status를 deleted로 변경)
     """
-    cursor = db.cursor()
-    cursor.execute("UPDATE job_postings SET status='deleted' WHERE posting_id=%s", (id,))
-    db.commit()
-    cursor.close()
+    cursor = await db.cursor()
+    await cursor.execute("UPDATE job_postings SET status='deleted' WHERE posting_id=%s", (id,))
+    await db.commit()
+    await cursor.close()
+    await postings_changed(db, [id])
     return {"detail": "Job deleted"}
@@ -0,0 +1,81 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from aiomysql import DictCursor
+from database import get_async_db, db_connection
+from auth import get_current_user
+from resume_storage import resume_storage
+
+router = APIRouter(tags=["resumes"], prefix="/resumes")
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match 헤더 값에 etag가 포함되어 있는지 확인 (약한 비교)
+    """
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in tags)
+
+async def stream_resume_blob(resume_id: int, size: int):
+    """
+    DB에 BLOB으로 저장된 이력서를 RESUME_CHUNK_SIZE 단위로 나누어 읽으며 전송 (메모리에는 한 조각만 유지).
+    응답 전송 중에는 요청 종속성의 커넥션이 반환된 상태이므로 별도 커넥션을 사용한다.
+    파일 저장소로 이전하는 작업은 migrate_resume_files.py로 따로 실행한다.
+    """
+    async with db_connection() as db:
+        cursor = await db.cursor()
+        try:
+            for offset in range(0, size, resume_storage.chunk_size):
+                await cursor.execute(
+                    "SELECT SUBSTRING(content, %s, %s) FROM resumes WHERE resume_id = %s",
+                    (offset + 1, resume_storage.chunk_size, resume_id)
+                )
+                row = await cursor.fetchone()
+                if not row or not row[0]:
+                    # 전송 도중 행이 삭제되거나 파일 저장소로 이전된 경우. 헤더는 이미 전송되었으므로
+                    # 에러로 연결을 끊어 클라이언트가 불완전한 응답임을 알 수 있게 한다.
+                    raise RuntimeError(f"Resume {resume_id} content changed while streaming")
+                yield row[0]
+        finally:
+            await cursor.close()
+
+@router.get("/{id}/file", summary="이력서 파일 다운로드")
+async def download_resume(id: int, request: Request, current_user=Depends(get_current_user), db=Depends(get_async_db)):
+    """
+    이력서 파일 다운로드 (본인 또는 관리자만 가능).
+    파일 저장소의 이력서는 ETag/If-None-Match와 Range 요청을 지원한다.
+    조회 요청에서는 행을 변경하지 않으며, 아직 이전하지 않은 BLOB 이력서는 DB에서 나누어 읽으며 전송한다.
+    """
+    cursor = await db.cursor(DictCursor)
+    await cursor.execute(
+        "SELECT user_id, file_sha256, file_path, OCTET_LENGTH(content) AS content_size FROM resumes WHERE resume_id = %s",
+        (id,)
+    )
+    resume = await cursor.fetchone()
+    await cursor.close()
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    if resume['user_id'] != current_user['user_id'] and current_user['role'] != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized to access this resume")
+
+    filename = f"resume-{id}.pdf"
+    headers = {"Cache-Control": "private, no-cache", "Content-Disposition": f'inline; filename="{filename}"'}
+
+    if resume['file_path']:
+        # 파일 내용의 SHA-256을 강한 ETag로 사용
+        etag = f'"{resume["file_sha256"]}"'
+        headers["ETag"] = etag
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        path = resume_storage.absolute_path(resume['file_path'])
+        if not os.path.exists(path):
+            raise HTTPException(status_code=404, detail="Resume file not found")
+        return FileResponse(path, media_type="application/pdf", headers=headers)
+
+    # 파일 저장소 도입 전의 이력서 (content BLOB)
+    if not resume['content_size']:
+        raise HTTPException(status_code=404, detail="Resume file not found")
+    headers["Content-Length"] = str(resume['content_size'])
+    return StreamingResponse(stream_resume_blob(id, resume['content_size']), media_type="application/pdf", headers=headers)
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends
+import database
+from auth import check_admin, user_cache
+from job_sync import job_list_cache, job_count_cache
+from facet_index import facet_index
+from related_index import related_index
+from view_counter import view_counter
+from lookups import lookups
+
+router = APIRouter(tags=["system"], prefix="/system")
+
+@router.get("/db-pool", summary="DB 커넥션 풀 상태 조회")
+async def db_pool_stats(current_user=Depends(check_admin)):
+    """
+    관리자 전용 DB 커넥션 풀 상태 조회 (사용 중/유휴 커넥션 수, 대기 요청 수, 획득 지연 히스토그램)
+    """
+    pool = await database.init_async_pool()
+    return pool.stats()
+
+@router.get("/indexes", summary="메모리 인덱스 상태 조회")
+async def index_stats(current_user=Depends(check_admin)):
+    """
+    관리자 전용 메모리 인덱스 상태 조회
+    """
+    return {"facet_index": facet_index.stats(), "related_index": related_index.stats()}
+
+@router.get("/caches", summary="캐시 상태 조회")
+async def cache_stats(current_user=Depends(check_admin)):
+    """
+    관리자 전용 캐시 상태 조회 (항목 수, 적중/실패 횟수, 사용 메모리)
+    """
+    return {
+        "job_list_cache": job_list_cache.stats(),
+        "job_count_cache": job_count_cache.stats(),
+        "user_cache": user_cache.stats(),
+        "view_counter": view_counter.stats(),
+        "lookups": lookups.stats()
+    }
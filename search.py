@@ -0,0 +1,28 @@
+from typing import List, Optional, Tuple
+from config import SEARCH_BACKEND, NGRAM_TOKEN_SIZE
+
+# 제목 일치에 가중치를 두는 관련도 점수 (migrations/002의 FULLTEXT 인덱스 필요)
+RELEVANCE_SQL = (
+    "(MATCH(jp.title) AGAINST (%s IN BOOLEAN MODE) * 2"
+    " + MATCH(jp.title, jp.job_description) AGAINST (%s IN BOOLEAN MODE))"
+)
+
+def fulltext_phrase(keyword: str) -> str:
+    """
+    키워드를 BOOLEAN MODE 구문 검색어로 변환.
+    ngram 파서에서 구문 검색은 n-gram이 연속으로 나타나는 문서만 찾으므로 LIKE '%kw%'와 같은 부분 일치가 된다.
+    """
+    return '"' + keyword.replace('"', ' ').strip() + '"'
+
+def keyword_filter(keyword: str) -> Tuple[str, List[str], Optional[Tuple[str, List[str]]]]:
+    """
+    키워드 검색 조건 생성. (조건절, 파라미터, 관련도 점수 SQL과 파라미터)를 반환한다.
+    FULLTEXT를 사용할 수 없는 경우(설정 또는 n-gram보다 짧은 키워드)는 LIKE 검색으로 대체하며 관련도 점수는 None.
+    """
+    keyword = keyword.strip()
+    if SEARCH_BACKEND == "fulltext" and len(keyword.replace('"', '').strip()) >= NGRAM_TOKEN_SIZE:
+        phrase = fulltext_phrase(keyword)
+        condition = " AND MATCH(jp.title, jp.job_description) AGAINST (%s IN BOOLEAN MODE)"
+        return condition, [phrase], (RELEVANCE_SQL, [phrase, phrase])
+    condition = " AND (jp.title LIKE %s OR jp.job_description LIKE %s)"
+    return condition, [f"%{keyword}%", f"%{keyword}%"], None
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Optional
+from config import VIEW_COUNT_FLUSH_INTERVAL_SECONDS, VIEW_COUNT_FLUSH_THRESHOLD
+from database import db_connection
+
+logger = logging.getLogger("api_logger")
+
+# 한 번의 UPDATE로 반영할 최대 공고 수
+FLUSH_CHUNK_SIZE = 500
+
+class ViewCountBuffer:
+    """
+    채용 공고 조회수 쓰기 지연(write-behind) 버퍼.
+    조회 시에는 메모리 카운터만 증가시키고, 주기적으로 또는 누적 조회수가 임계값을 넘으면
+    공고별 증가분을 하나의 다중 행 UPDATE로 반영한다.
+    """
+    def __init__(self, flush_interval: float, flush_threshold: int):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._pending = Counter()
+        self._pending_total = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._run_task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self.flushed_views = 0
+
+    def increment(self, posting_id: int):
+        self._pending[posting_id] += 1
+        self._pending_total += 1
+        if self._pending_total >= self.flush_threshold and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self.flush())
+
+    def pending(self, posting_id: int) -> int:
+        """
+        아직 DB에 반영되지 않은 조회수
+        """
+        return self._pending.get(posting_id, 0)
+
+    async def flush(self):
+        """
+        누적된 조회수를 DB에 반영. 실패하면 다음 반영 때 다시 시도하도록 버퍼에 되돌린다.
+        커밋 전에 취소되어도 꺼낸 조회수를 버퍼에 되돌린 뒤 취소를 전파한다.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, Counter()
+            self._pending_total = 0
+
+            # 공고 id 순서로 갱신하여 동시에 실행되는 다른 갱신과 잠금 순서를 맞춤
+            items = sorted(batch.items())
+            committed = False
+            try:
+                async with db_connection() as db:
+                    cursor = await db.cursor()
+                    for start in range(0, len(items), FLUSH_CHUNK_SIZE):
+                        chunk = items[start:start + FLUSH_CHUNK_SIZE]
+                        cases = " ".join(["WHEN %s THEN %s"] * len(chunk))
+                        placeholders = ','.join(['%s'] * len(chunk))
+                        params = [value for item in chunk for value in item] + [posting_id for posting_id, _ in chunk]
+                        await cursor.execute(
+                            f"UPDATE job_postings SET view_count = view_count + CASE posting_id {cases} END"
+                            f" WHERE posting_id IN ({placeholders})",
+                            params
+                        )
+                    await db.commit()
+                    committed = True
+                    await cursor.close()
+            except Exception as e:
+                if committed:
+                    logger.warning(f"View counts were flushed but closing the connection failed: {e}")
+                else:
+                    logger.error(f"Failed to flush view counts for {len(batch)} postings: {e}")
+                    self._restore(batch)
+                    return
+            except BaseException:
+                if not committed:
+                    self._restore(batch)
+                raise
+            self.flushed_views += sum(batch.values())
+
+    def _restore(self, batch: Counter):
+        self._pending.update(batch)
+        self._pending_total += sum(batch.values())
+
+    def start(self):
+        """
+        flush_interval마다 누적된 조회수를 반영하는 백그라운드 작업 시작.
+        취소하지 않고 close로 멈추므로 반영 중인 조회수를 잃지 않는다.
+        """
+        self._stopping = asyncio.Event()
+        self._run_task = asyncio.create_task(self.run(self._stopping))
+
+    async def run(self, stopping: asyncio.Event):
+        while not stopping.is_set():
+            try:
+                await asyncio.wait_for(stopping.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                await self.flush()
+
+    async def close(self):
+        """
+        백그라운드 작업을 멈추고 진행 중인 반영(주기/임계값)이 끝나기를 기다린 뒤 남은 조회수를 반영
+        """
+        if self._stopping is not None:
+            self._stopping.set()
+        tasks = [task for task in (self._run_task, self._flush_task) if task is not None]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending_postings": len(self._pending),
+            "pending_views": self._pending_total,
+            "flushed_views": self.flushed_views,
+            "flush_interval": self.flush_interval,
+            "flush_threshold": self.flush_threshold
+        }
+
+# 프로세스 단위 조회수 버퍼
+view_counter = ViewCountBuffer(VIEW_COUNT_FLUSH_INTERVAL_SECONDS, VIEW_COUNT_FLUSH_THRESHOLD)